@@ -1,12 +0,0 @@
-"""
-Init file for agents package
-"""
-from agents.planner_agent import planner_agent
-from agents.extraction_agent import extraction_agent
-from agents.validator_agent import validator_agent
-
-__all__ = [
-    'planner_agent',
-    'extraction_agent',
-    'validator_agent'
-]
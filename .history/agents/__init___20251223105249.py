@@ -1,14 +0,0 @@
-"""Agents module initialization"""
-from .planner_agent import PlannerAgent
-from .operations_agent import OperationsAgent
-from .passenger_agent import PassengerAgent
-from .crowd_agent import CrowdAgent
-from .alert_agent import AlertAgent
-
-__all__ = [
-    'PlannerAgent',
-    'OperationsAgent',
-    'PassengerAgent',
-    'CrowdAgent',
-    'AlertAgent'
-]
@@ -1,3 +0,0 @@
-"""
-API module for Railway Intelligence Multi-Agent System
-"""
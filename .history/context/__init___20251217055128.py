@@ -1,11 +0,0 @@
-"""
-Init file for context package
-"""
-from context.context_protocol import context_protocol, UserContext, ChannelType, ConversationState
-
-__all__ = [
-    'context_protocol',
-    'UserContext',
-    'ChannelType',
-    'ConversationState'
-]
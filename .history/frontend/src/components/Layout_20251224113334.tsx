@@ -1,138 +0,0 @@
-import { Outlet, Link, useLocation } from 'react-router-dom'
-import { 
-  HomeIcon, 
-  ClockIcon, 
-  UserGroupIcon, 
-  UsersIcon, 
-  BellIcon, 
-  CpuChipIcon,
-  Bars3Icon,
-  XMarkIcon
-} from '@heroicons/react/24/outline'
-import { useState } from 'react'
-
-const navigation = [
-  { name: 'Dashboard', href: '/', icon: HomeIcon },
-  { name: 'Train Delay', href: '/train-delay', icon: ClockIcon },
-  { name: 'Passenger Query', href: '/passenger-query', icon: UserGroupIcon },
-  { name: 'Crowd Prediction', href: '/crowd-prediction', icon: UsersIcon },
-  { name: 'Alerts', href: '/alerts', icon: BellIcon },
-  { name: 'Agents', href: '/agents', icon: CpuChipIcon },
-]
-
-export default function Layout() {
-  const location = useLocation()
-  const [sidebarOpen, setSidebarOpen] = useState(false)
-
-  return (
-    <div className="min-h-screen bg-gray-50">
-      {/* Mobile sidebar */}
-      {sidebarOpen && (
-        <div className="fixed inset-0 z-50 lg:hidden">
-          <div className="fixed inset-0 bg-gray-600 bg-opacity-75" onClick={() => setSidebarOpen(false)} />
-          <div className="fixed inset-y-0 left-0 flex w-64 flex-col bg-white">
-            <div className="flex items-center justify-between p-4 border-b">
-              <h2 className="text-xl font-bold text-railway-blue">Railway AI</h2>
-              <button onClick={() => setSidebarOpen(false)}>
-                <XMarkIcon className="h-6 w-6" />
-              </button>
-            </div>
-            <nav className="flex-1 space-y-1 px-2 py-4">
-              {navigation.map((item) => {
-                const isActive = location.pathname === item.href
-                return (
-                  <Link
-                    key={item.name}
-                    to={item.href}
-                    onClick={() => setSidebarOpen(false)}
-                    className={`
-                      group flex items-center px-3 py-2 text-sm font-medium rounded-md
-                      ${isActive 
-                        ? 'bg-blue-50 text-blue-600' 
-                        : 'text-gray-700 hover:bg-gray-50'
-                      }
-                    `}
-                  >
-                    <item.icon className={`mr-3 h-5 w-5 ${isActive ? 'text-blue-600' : 'text-gray-400'}`} />
-                    {item.name}
-                  </Link>
-                )
-              })}
-            </nav>
-          </div>
-        </div>
-      )}
-
-      {/* Desktop sidebar */}
-      <div className="hidden lg:fixed lg:inset-y-0 lg:flex lg:w-64 lg:flex-col">
-        <div className="flex flex-col flex-1 min-h-0 bg-white border-r border-gray-200">
-          <div className="flex items-center h-16 px-4 border-b bg-railway-blue">
-            <h1 className="text-xl font-bold text-white">🚂 Railway AI</h1>
-          </div>
-          <nav className="flex-1 px-2 py-4 space-y-1 overflow-y-auto">
-            {navigation.map((item) => {
-              const isActive = location.pathname === item.href
-              return (
-                <Link
-                  key={item.name}
-                  to={item.href}
-                  className={`
-                    group flex items-center px-3 py-2 text-sm font-medium rounded-md
-                    ${isActive 
-                      ? 'bg-blue-50 text-blue-600' 
-                      : 'text-gray-700 hover:bg-gray-50'
-                    }
-                  `}
-                >
-                  <item.icon className={`mr-3 h-5 w-5 ${isActive ? 'text-blue-600' : 'text-gray-400'}`} />
-                  {item.name}
-                </Link>
-              )
-            })}
-          </nav>
-          <div className="flex-shrink-0 p-4 border-t">
-            <div className="text-xs text-gray-500">
-              Multi-Agent System v1.0.0
-            </div>
-          </div>
-        </div>
-      </div>
-
-      {/* Main content */}
-      <div className="lg:pl-64 flex flex-col flex-1">
-        {/* Top bar */}
-        <div className="sticky top-0 z-10 flex-shrink-0 flex h-16 bg-white border-b border-gray-200">
-          <button
-            type="button"
-            className="px-4 border-r border-gray-200 text-gray-500 focus:outline-none lg:hidden"
-            onClick={() => setSidebarOpen(true)}
-          >
-            <Bars3Icon className="h-6 w-6" />
-          </button>
-          <div className="flex-1 px-4 flex justify-between items-center">
-            <div className="flex-1 flex">
-              <h2 className="text-2xl font-semibold text-gray-900">
-                Railway Intelligence System
-              </h2>
-            </div>
-            <div className="ml-4 flex items-center space-x-4">
-              <div className="flex items-center space-x-2">
-                <div className="h-2 w-2 bg-green-500 rounded-full animate-pulse"></div>
-                <span className="text-sm text-gray-600">System Active</span>
-              </div>
-            </div>
-          </div>
-        </div>
-
-        {/* Page content */}
-        <main className="flex-1">
-          <div className="py-6">
-            <div className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
-              <Outlet />
-            </div>
-          </div>
-        </main>
-      </div>
-    </div>
-  )
-}
@@ -1,10 +0,0 @@
-"""
-Init file for MCP package
-"""
-from mcp.tool_layer import mcp_registry, MCPTool, ToolDefinition
-
-__all__ = [
-    'mcp_registry',
-    'MCPTool',
-    'ToolDefinition'
-]
@@ -1,10 +0,0 @@
-"""
-Init file for memory package
-"""
-from memory.memory_manager import memory_manager, MemoryManager, MemoryType
-
-__all__ = [
-    'memory_manager',
-    'MemoryManager',
-    'MemoryType'
-]
@@ -1,9 +0,0 @@
-"""
-Init file for orchestrator package
-"""
-from orchestrator.orchestrator import orchestrator, LangChainOrchestrator
-
-__all__ = [
-    'orchestrator',
-    'LangChainOrchestrator'
-]
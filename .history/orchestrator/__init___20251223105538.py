@@ -1,4 +0,0 @@
-"""Orchestrator module initialization"""
-from .orchestrator import RailwayOrchestrator
-
-__all__ = ['RailwayOrchestrator']
@@ -1,4 +0,0 @@
-"""RAG module initialization"""
-from .rag_system import RAGSystem
-
-__all__ = ['RAGSystem']
@@ -1,10 +0,0 @@
-"""
-Init file for security package
-"""
-from security.auth import security_manager, oauth2_manager, permission_manager
-
-__all__ = [
-    'security_manager',
-    'oauth2_manager',
-    'permission_manager'
-]
@@ -1,10 +0,0 @@
-"""
-Init file for services package
-"""
-from services.whatsapp_service import whatsapp_service
-from services.webhook_handler import MessageIngestionService
-
-__all__ = [
-    'whatsapp_service',
-    'MessageIngestionService'
-]
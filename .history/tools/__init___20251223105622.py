@@ -1,14 +0,0 @@
-"""Tools module initialization"""
-from .train_schedule_tool import TrainScheduleTool
-from .delay_simulator import DelaySimulator
-from .crowd_predictor import CrowdPredictor
-from .booking_analyzer import BookingAnalyzer
-from .notification_service import NotificationService
-
-__all__ = [
-    'TrainScheduleTool',
-    'DelaySimulator',
-    'CrowdPredictor',
-    'BookingAnalyzer',
-    'NotificationService'
-]
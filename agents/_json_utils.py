@@ -0,0 +1,109 @@
+"""
+JSON helpers shared by the LLM-backed agents
+"""
+import json
+import re
+from typing import Any, Generator, Iterable, Tuple
+
+import orjson
+
+# Compact prompt serialization: numpy scores/arrays and non-str keys pass through
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+
+# First fenced block (```json or bare ```) wrapping a JSON object or array
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```", re.DOTALL)
+
+
+def parse_json_response(response_text: str) -> Any:
+    """Parse LLM response text and extract its JSON payload"""
+    payload = response_text.strip()
+    
+    # JSON-mode responses are bare JSON: skip the fence scan entirely
+    if payload[:1] in ("{", "["):
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            pass
+    
+    match = _FENCE_RE.search(response_text)
+    if match:
+        payload = match.group(1)
+    
+    try:
+        return orjson.loads(payload)
+    except orjson.JSONDecodeError:
+        pass
+    
+    # orjson is strict; stdlib json still accepts NaN/Infinity literals
+    try:
+        return json.loads(payload)
+    except json.JSONDecodeError:
+        return {"error": "Failed to parse response", "raw": response_text}
+
+
+def dumps_compact(obj: Any) -> str:
+    """Serialize data for embedding in a prompt, without indentation"""
+    return orjson.dumps(obj, default=str, option=_DUMPS_OPTIONS).decode()
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    while pos < len(text) and text[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+def iter_json_fields(chunks: Iterable[str]) -> Generator[Tuple[str, Any], None, bool]:
+    """
+    Incrementally parse a streamed JSON object
+    Yields (key, value) for each top-level field as soon as the field is
+    complete, without waiting for the rest of the object. Any text before
+    the opening brace (e.g. a ```json fence) is skipped.
+    
+    Returns (as the generator's return value) True only if the closing brace
+    was reached; False means the stream ended early or was not an object,
+    so the yielded fields may be incomplete.
+    """
+    buffer = ""
+    pos = None  # just past the opening brace or the last consumed comma
+    
+    for chunk in chunks:
+        buffer += chunk
+        if pos is None:
+            start = buffer.find("{")
+            if start < 0:
+                continue
+            pos = start + 1
+        
+        while True:
+            index = _skip_whitespace(buffer, pos)
+            if index >= len(buffer):
+                break
+            if buffer[index] == "}":
+                return True
+            try:
+                key, index = _DECODER.raw_decode(buffer, index)
+                index = _skip_whitespace(buffer, index)
+                if buffer[index:index + 1] != ":":
+                    break
+                value, index = _DECODER.raw_decode(buffer, _skip_whitespace(buffer, index + 1))
+            except json.JSONDecodeError:
+                # Field not fully streamed yet
+                break
+            
+            if not isinstance(key, str):
+                return False
+            
+            # A number may still be growing (e.g. "0." of 0.95) until its delimiter arrives
+            index = _skip_whitespace(buffer, index)
+            if index >= len(buffer) or buffer[index] not in ",}":
+                break
+            
+            yield key, value
+            if buffer[index] == "}":
+                return True
+            pos = index + 1
+    
+    return False
@@ -5,6 +5,7 @@ Handles sending alerts and triggering automated actions
 import os
 from config import AGENT_CONFIG, MOCK_MODE
 from utils.llm_client import LLMClient
+from agents._json_utils import dumps_compact, parse_json_response
 
 from typing import Dict, List, Any, Optional
 import json
@@ -55,7 +56,7 @@ ALERT TYPE: {alert_type}
 TARGET AUDIENCE: {target_audience}
 
 CONTEXT:
-{json.dumps(context, indent=2)}
+{dumps_compact(context)}
 
 Create alert messages that are:
 1. Clear and concise
@@ -189,7 +190,7 @@ You are the Alert & Action Agent. Execute an automated action.
 
 ACTION: {action}
 PARAMETERS:
-{json.dumps(parameters, indent=2)}
+{dumps_compact(parameters)}
 
 Determine:
 1. Pre-conditions to verify
@@ -248,21 +249,4 @@ Respond in JSON format with execution plan.
     
     def _parse_response(self, response_text: str) -> Dict[str, Any]:
         """Parse Gemini response and extract JSON"""
-        try:
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                json_str = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                json_str = response_text[json_start:json_end].strip()
-            else:
-                json_str = response_text.strip()
-            
-            return json.loads(json_str)
-        except json.JSONDecodeError:
-            try:
-                return json.loads(response_text)
-            except:
-                return {"error": "Failed to parse response", "raw": response_text}
+        return parse_json_response(response_text)
@@ -3,13 +3,33 @@ Extraction Agent
 Extracts structured data from unstructured text/documents
 """
 from typing import Dict, Any, List, Optional
-from langchain_community.chat_models import ChatOllama
-from langchain.prompts import ChatPromptTemplate
-from langchain.schema import HumanMessage, SystemMessage
+from functools import lru_cache
 import json
 import re
 
 from config import settings
+from utils.lazy import LazyProxy
+from utils.llm_client import get_ollama_client
+
+
+# Bill/invoice patterns, compiled once and tried in priority order
+AMOUNT_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'[₹$€£]\s*[\d,]+\.?\d*',
+    r'(?:total|amount|bill)[\s:]*[₹$€£]?\s*[\d,]+\.?\d*',
+    r'(?:total|amount)[\s:]*(?:rs\.?|inr)?\s*[\d,]+\.?\d*'
+))
+
+DATE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',
+    r'\d{4}[/-]\d{1,2}[/-]\d{1,2}',
+    r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}'
+))
+
+
+@lru_cache(maxsize=256)
+def _compile(pattern: str) -> "re.Pattern[str]":
+    """Compile a caller-supplied pattern once"""
+    return re.compile(pattern, re.IGNORECASE)
 
 
 class ExtractionAgent:
@@ -24,11 +44,8 @@ class ExtractionAgent:
     """
     
     def __init__(self):
-        self.llm = ChatOllama(
-            base_url=settings.ollama_base_url,
-            model=settings.ollama_model,
-            temperature=0
-        )
+        self.client = get_ollama_client(settings.ollama_base_url)
+        self.model_name = settings.ollama_model
         
         self.system_prompt = """You are an expert data extraction agent.
 
@@ -55,6 +72,19 @@ Output Format:
     "extraction_summary": "Brief summary of what was extracted"
 }
 """
+        
+        # Built once; the system prompt never changes between calls
+        self._system_message = {"role": "system", "content": self.system_prompt}
+    
+    async def _chat(self, messages: List[Dict[str, str]]) -> str:
+        """Run a deterministic JSON-mode chat completion against Ollama"""
+        response = await self.client.chat(
+            model=self.model_name,
+            messages=messages,
+            format="json",
+            options={"temperature": 0}
+        )
+        return response["message"]["content"]
     
     async def extract(
         self,
@@ -91,8 +121,8 @@ Output Format:
         context_str = json.dumps(context) if context else "None"
         
         messages = [
-            SystemMessage(content=self.system_prompt),
-            HumanMessage(content=f"""Text to extract from:
+            self._system_message,
+            {"role": "user", "content": f"""Text to extract from:
 ---
 {text}
 ---
@@ -100,19 +130,19 @@ Output Format:
 Fields to extract: {fields_str}
 Additional context: {context_str}
 
-Extract the requested fields and return structured JSON.""")
+Extract the requested fields and return structured JSON."""}
         ]
         
-        response = await self.llm.apredict_messages(messages)
+        response = await self._chat(messages)
         
         try:
-            result = json.loads(response.content)
+            result = json.loads(response)
             return result
         except json.JSONDecodeError:
             return {
                 "extracted_data": {},
                 "error": "Failed to parse extraction result",
-                "raw_response": response.content
+                "raw_response": response
             }
     
     async def _extract_bill_info(
@@ -126,38 +156,26 @@ Extract the requested fields and return structured JSON.""")
         
         # Amount patterns
         if "amount" in fields or "bill_amount" in fields or "total" in fields:
-            amount_patterns = [
-                r'[₹$€£]\s*[\d,]+\.?\d*',
-                r'(?:total|amount|bill)[\s:]*[₹$€£]?\s*[\d,]+\.?\d*',
-                r'(?:total|amount)[\s:]*(?:rs\.?|inr)?\s*[\d,]+\.?\d*'
-            ]
-            
-            for pattern in amount_patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
+            for pattern in AMOUNT_PATTERNS:
+                matches = pattern.findall(text)
                 if matches:
                     extracted_data["amount"] = {
                         "value": matches[-1],  # Usually last occurrence is total
                         "confidence": 0.9,
-                        "source": f"Regex pattern: {pattern}",
+                        "source": f"Regex pattern: {pattern.pattern}",
                         "method": "regex"
                     }
                     break
         
         # Date patterns
         if "date" in fields or "billing_date" in fields or "due_date" in fields:
-            date_patterns = [
-                r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',
-                r'\d{4}[/-]\d{1,2}[/-]\d{1,2}',
-                r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}'
-            ]
-            
-            for pattern in date_patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                if matches:
+            for pattern in DATE_PATTERNS:
+                match = pattern.search(text)
+                if match:
                     extracted_data["date"] = {
-                        "value": matches[0],
+                        "value": match.group(0),
                         "confidence": 0.85,
-                        "source": f"Regex pattern: {pattern}",
+                        "source": f"Regex pattern: {pattern.pattern}",
                         "method": "regex"
                     }
                     break
@@ -199,7 +217,7 @@ Extract the requested fields and return structured JSON.""")
         extracted_data = {}
         
         for field_name, pattern in patterns.items():
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = _compile(pattern).findall(text)
             if matches:
                 extracted_data[field_name] = {
                     "value": matches[0] if len(matches) == 1 else matches,
@@ -221,5 +239,5 @@ Extract the requested fields and return structured JSON.""")
         }
 
 
-# Global extraction agent instance
-extraction_agent = ExtractionAgent()
+# Global extraction agent instance (built on first use)
+extraction_agent: ExtractionAgent = LazyProxy(ExtractionAgent)
@@ -5,14 +5,51 @@ Handles train schedules, delay propagation, and operational decisions
 import os
 from config import AGENT_CONFIG, MOCK_MODE
 from utils.llm_client import LLMClient
+from agents._json_utils import dumps_compact, parse_json_response
 
-from typing import Dict, List, Any, Optional
-import json
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from config import GEMINI_API_KEY, AGENT_CONFIG
 from tools.train_schedule_tool import TrainScheduleTool
 from tools.delay_simulator import DelaySimulator
 
+# JSON shape of a single delay analysis, shared by the single and batched prompts
+DELAY_ANALYSIS_SCHEMA = """{
+    "impact_summary": "Brief summary",
+    "severity": "low|medium|high|critical",
+    "affected_stations": [
+        {
+            "station": "Station name",
+            "original_time": "HH:MM",
+            "new_time": "HH:MM",
+            "delay": 45
+        }
+    ],
+    "connected_trains": [
+        {
+            "train_number": "12345",
+            "connection_station": "Station",
+            "risk": "missed|tight|safe",
+            "recommendation": "hold|inform|no_action"
+        }
+    ],
+    "recommendations": [
+        {
+            "action": "Description",
+            "priority": "high|medium|low",
+            "reason": "Why this action"
+        }
+    ],
+    "platform_changes": [
+        {
+            "station": "Station",
+            "current_platform": "1",
+            "suggested_platform": "3",
+            "reason": "Conflict with train X"
+        }
+    ]
+}"""
+
 class OperationsAgent:
     """
     Responsible for:
@@ -46,7 +83,7 @@ class OperationsAgent:
             Analysis with impact assessment and recommendations
         """
         # Get train schedule
-        schedule = self.schedule_tool.get_train_schedule(train_number)
+        schedule = self._schedule_block(train_number)
         
         # Simulate delay propagation
         propagation = self.delay_simulator.simulate_delay(
@@ -61,10 +98,10 @@ DELAY: {delay_minutes} minutes
 CURRENT LOCATION: {current_location or 'Unknown'}
 
 SCHEDULE DATA:
-{json.dumps(schedule, indent=2)}
+{schedule}
 
 DELAY PROPAGATION SIMULATION:
-{json.dumps(propagation, indent=2)}
+{dumps_compact(propagation)}
 
 Analyze the situation and provide:
 1. Impact Assessment
@@ -84,41 +121,7 @@ Analyze the situation and provide:
    - Crew scheduling impacts
 
 Respond in JSON format:
-{{
-    "impact_summary": "Brief summary",
-    "severity": "low|medium|high|critical",
-    "affected_stations": [
-        {{
-            "station": "Station name",
-            "original_time": "HH:MM",
-            "new_time": "HH:MM",
-            "delay": 45
-        }}
-    ],
-    "connected_trains": [
-        {{
-            "train_number": "12345",
-            "connection_station": "Station",
-            "risk": "missed|tight|safe",
-            "recommendation": "hold|inform|no_action"
-        }}
-    ],
-    "recommendations": [
-        {{
-            "action": "Description",
-            "priority": "high|medium|low",
-            "reason": "Why this action"
-        }}
-    ],
-    "platform_changes": [
-        {{
-            "station": "Station",
-            "current_platform": "1",
-            "suggested_platform": "3",
-            "reason": "Conflict with train X"
-        }}
-    ]
-}}
+{DELAY_ANALYSIS_SCHEMA}
 """
         
         if MOCK_MODE or not self.model:
@@ -146,6 +149,72 @@ Respond in JSON format:
                 "delay_minutes": delay_minutes
             }
     
+    def analyze_delays_batch(self, delays: List[Tuple[str, int, Optional[str]]]) -> List[Dict[str, Any]]:
+        """
+        Analyze several delays with a single LLM round-trip
+        
+        Args:
+            delays: List of (train_number, delay_minutes, current_location) tuples
+            
+        Returns:
+            One analysis per input, in input order
+        """
+        if len(delays) <= 1 or MOCK_MODE or not self.model:
+            return [self.analyze_delay(*delay) for delay in delays]
+        
+        sections = []
+        for index, (train_number, delay_minutes, current_location) in enumerate(delays, 1):
+            schedule = self._schedule_block(train_number)
+            propagation = self.delay_simulator.simulate_delay(
+                train_number, delay_minutes, current_location
+            )
+            sections.append(f"""[{index}] TRAIN: {train_number}
+DELAY: {delay_minutes} minutes
+CURRENT LOCATION: {current_location or 'Unknown'}
+SCHEDULE DATA:
+{schedule}
+DELAY PROPAGATION SIMULATION:
+{dumps_compact(propagation)}""")
+        
+        sections_text = "\n\n".join(sections)
+        prompt = f"""
+You are the Operations Agent for a railway intelligence system.
+
+For each of the following {len(delays)} delayed trains, assess the impact,
+recommend operational actions and identify cascading effects.
+
+{sections_text}
+
+Return a JSON list of exactly {len(delays)} objects, in the same order as the
+numbered trains above, each in this format:
+{DELAY_ANALYSIS_SCHEMA}
+"""
+        
+        try:
+            response = self.model.generate_content(prompt)
+            analyses = self._parse_response(response.text)
+        except Exception as e:
+            analyses = {"error": str(e)}
+        
+        # Fall back to one call per train if the batch answer is unusable
+        if not isinstance(analyses, list) or len(analyses) != len(delays):
+            return [self.analyze_delay(*delay) for delay in delays]
+        
+        analyzed_at = datetime.now().isoformat()
+        results = []
+        for analysis, delay in zip(analyses, delays):
+            # Malformed entries (strings, nulls) are re-analyzed on their own
+            if not isinstance(analysis, dict):
+                results.append(self.analyze_delay(*delay))
+                continue
+            train_number, delay_minutes, _ = delay
+            analysis["train_number"] = train_number
+            analysis["delay_minutes"] = delay_minutes
+            analysis["analyzed_at"] = analyzed_at
+            results.append(analysis)
+        
+        return results
+    
     def suggest_schedule_adjustment(self, trains_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Suggest schedule adjustments for multiple trains
@@ -154,7 +223,7 @@ Respond in JSON format:
 You are the Operations Agent. Multiple trains are experiencing issues.
 
 TRAINS DATA:
-{json.dumps(trains_data, indent=2)}
+{dumps_compact(trains_data)}
 
 Suggest optimal schedule adjustments that:
 1. Minimize overall passenger impact
@@ -180,23 +249,13 @@ Provide comprehensive recommendations in JSON format.
         )
         return availability
     
+    def _schedule_block(self, train_number: str) -> str:
+        """Schedule section of a prompt: the compact route table when known"""
+        route_table = self.schedule_tool.get_route_table(train_number)
+        if route_table is not None:
+            return route_table
+        return dumps_compact(self.schedule_tool.get_train_schedule(train_number))
+    
     def _parse_response(self, response_text: str) -> Dict[str, Any]:
         """Parse Gemini response and extract JSON"""
-        try:
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                json_str = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                json_str = response_text[json_start:json_end].strip()
-            else:
-                json_str = response_text.strip()
-            
-            return json.loads(json_str)
-        except json.JSONDecodeError:
-            try:
-                return json.loads(response_text)
-            except:
-                return {"error": "Failed to parse response", "raw": response_text}
+        return parse_json_response(response_text)
@@ -6,11 +6,102 @@ import logging
 import os
 from config import AGENT_CONFIG, MOCK_MODE
 from utils.llm_client import LLMClient
+from agents._json_utils import dumps_compact, iter_json_fields, parse_json_response
 
-from typing import Dict, List, Any, Optional
-import json
-from config import GEMINI_API_KEY, AGENT_CONFIG
+from typing import Callable, Dict, List, Any, Iterator, Optional, Tuple
+from config import GEMINI_API_KEY, AGENT_CONFIG, SEMANTIC_CACHE_CONFIG
 from rag.rag_system import RAGSystem
+from utils.semantic_cache import CacheKey, SemanticCache
+
+logger = logging.getLogger(__name__)
+
+# Static prompt prefixes - sent as system instructions so providers can cache them
+ANSWER_QUERY_INSTRUCTIONS = """
+You are the Passenger Intelligence Agent for a railway system.
+Your role is to assist passengers with accurate, helpful information.
+
+Provide a helpful response that includes:
+1. Direct answer to the query
+2. Alternative options if applicable
+3. Relevant policies or rules
+4. Actionable next steps
+
+Respond in JSON format:
+{
+    "answer": "Main answer to the query",
+    "alternatives": [
+        {
+            "option": "Description",
+            "details": "Specifics",
+            "recommendation_score": 0.9
+        }
+    ],
+    "policies": [
+        {
+            "rule": "Policy name",
+            "description": "What it means",
+            "applies": true
+        }
+    ],
+    "next_steps": ["Step 1", "Step 2"],
+    "confidence": 0.95
+}
+"""
+
+SUGGEST_ALTERNATIVES_INSTRUCTIONS = """
+You are the Passenger Intelligence Agent. A passenger's train is affected.
+
+Suggest the best alternative trains considering:
+1. Similar arrival time
+2. Seat availability
+3. Fare difference
+4. Connection convenience
+5. Passenger preferences
+
+Respond in JSON format with ranked alternatives:
+{
+    "alternatives": [
+        {
+            "train_number": "12345",
+            "train_name": "Express",
+            "departure": "10:30",
+            "arrival": "18:45",
+            "fare_difference": "+150",
+            "seats_available": "Yes",
+            "recommendation_score": 0.95,
+            "pros": ["Faster", "Direct"],
+            "cons": ["Higher fare"],
+            "booking_action": "Can be booked immediately"
+        }
+    ],
+    "refund_eligible": true,
+    "refund_amount": 1200,
+    "auto_rebooking_available": true
+}
+"""
+
+REFUND_POLICY_INSTRUCTIONS = """
+You are the Passenger Intelligence Agent. Explain the refund policy.
+
+Provide clear explanation of:
+1. Eligibility for refund
+2. Refund amount calculation
+3. Processing time
+4. How to claim
+
+Be specific and accurate based on the rules.
+"""
+
+ADAPT_CACHED_ANSWER_INSTRUCTIONS = """
+You are the Passenger Intelligence Agent. A previously generated answer to
+a closely related passenger question is provided. Adapt it so that it
+answers the new question, changing only what the new question requires.
+
+Respond with JSON in exactly the same format as the cached answer.
+"""
+
+# RAG query used by explain_refund_policy
+REFUND_RULES_QUERY = "refund policy rules"
 
 class PassengerAgent:
     """
@@ -30,11 +121,50 @@ class PassengerAgent:
         if not MOCK_MODE:
              try:
                 self.model = LLMClient(AGENT_CONFIG["passenger"])
+                self.adapter_model = LLMClient(AGENT_CONFIG["cache_adapter"])
              except:
                  self.model = None
+                 self.adapter_model = None
         else:
             self.model = None
+            self.adapter_model = None
         self.rag_system = RAGSystem()
+        self.semantic_cache = SemanticCache(
+            self.rag_system.embedding_model,
+            threshold=SEMANTIC_CACHE_CONFIG["similarity_threshold"],
+            ttl_seconds=SEMANTIC_CACHE_CONFIG["ttl_seconds"],
+            max_entries=SEMANTIC_CACHE_CONFIG["max_entries"]
+        )
+        # (query, top_k) -> results retrieved ahead of time by prefetch()
+        self._prefetched: Dict[Tuple[str, int], List[Dict[str, Any]]] = {}
+    
+    def prefetch(self, retrievals: List[Tuple[str, int]]):
+        """
+        Retrieve RAG context for several upcoming calls in one batch
+        
+        Args:
+            retrievals: (query, top_k) pairs the next calls will need;
+                each result is consumed by the first call that asks for it
+        """
+        if not retrievals:
+            return
+        
+        queries = list(dict.fromkeys(query for query, _ in retrievals))
+        top_k = max(k for _, k in retrievals)
+        batch = dict(zip(queries, self.rag_system.retrieve_batch(queries, top_k=top_k)))
+        
+        # Global top-k of the per-collection top-K (K >= k) equals a direct top-k search
+        self._prefetched = {
+            (query, k): batch[query][:k] for query, k in retrievals
+        }
+    
+    @staticmethod
+    def alternatives_query(passenger_context: Dict[str, Any]) -> str:
+        """RAG query used by suggest_alternatives"""
+        origin = passenger_context.get("origin", "")
+        destination = passenger_context.get("destination", "")
+        travel_date = passenger_context.get("travel_date", "")
+        return f"Alternative trains from {origin} to {destination} on {travel_date}"
         
     def answer_query(self, query: str, passenger_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -47,65 +177,20 @@ class PassengerAgent:
         Returns:
             Answer with relevant information and suggestions
         """
-        # Retrieve relevant context from RAG
-        rag_context = self.rag_system.retrieve(query, top_k=5)
-        
-        prompt = f"""
-You are the Passenger Intelligence Agent for a railway system.
-Your role is to assist passengers with accurate, helpful information.
-
-PASSENGER QUERY: {query}
-
-PASSENGER CONTEXT:
-{json.dumps(passenger_context or {}, indent=2)}
-
-RELEVANT INFORMATION FROM KNOWLEDGE BASE:
-{json.dumps(rag_context, indent=2)}
-
-Provide a helpful response that includes:
-1. Direct answer to the query
-2. Alternative options if applicable
-3. Relevant policies or rules
-4. Actionable next steps
-
-Respond in JSON format:
-{{
-    "answer": "Main answer to the query",
-    "alternatives": [
-        {{
-            "option": "Description",
-            "details": "Specifics",
-            "recommendation_score": 0.9
-        }}
-    ],
-    "policies": [
-        {{
-            "rule": "Policy name",
-            "description": "What it means",
-            "applies": true
-        }}
-    ],
-    "next_steps": ["Step 1", "Step 2"],
-    "confidence": 0.95
-}}
-"""
-        
         if MOCK_MODE or not self.model:
-            return {
-                "answer": f"Mock Answer: Based on your query '{query}', here are some details...",
-                "alternatives": [{"option": "Mock Train 1", "details": "On time"}],
-                "policies": [{"rule": "Mock Policy", "description": "Always valid"}],
-                "confidence": 1.0,
-                "rag_sources": ["mock_data"]
-            }
+            return self._mock_answer(query)
 
         try:
-            response = self.model.generate_content(prompt)
-            answer = self._parse_response(response.text)
+            # RAG retrieval only runs on a cache miss; its sources are cached
+            # with the answer
+            answer = self._cached_generate(
+                query, passenger_context, ANSWER_QUERY_INSTRUCTIONS,
+                lambda: self._build_query_prompt(query, passenger_context)
+            )
             
             # Add metadata
             answer["query"] = query
-            answer["rag_sources"] = [doc.get("source", "unknown") for doc in rag_context]
+            answer.setdefault("rag_sources", [])
             
             return answer
         except Exception as e:
@@ -115,6 +200,64 @@ Respond in JSON format:
                 "answer": "I apologize, but I encountered an error processing your query."
             }
     
+    def stream_answer(self, query: str,
+                      passenger_context: Optional[Dict[str, Any]] = None) -> Iterator[Tuple[str, Any]]:
+        """
+        Streaming variant of answer_query
+        Yields (field, value) pairs as soon as each top-level field of the
+        answer is complete, so "answer" can be shown before the longer
+        alternatives/policies lists finish generating
+        """
+        if MOCK_MODE or not self.model:
+            yield from self._mock_answer(query).items()
+            return
+        
+        cache_key = self.semantic_cache.make_key(
+            query, passenger_context, namespace=ANSWER_QUERY_INSTRUCTIONS
+        )
+        answer = self.semantic_cache.get(cache_key)
+        if answer is not None:
+            answer.setdefault("rag_sources", [])
+            yield from answer.items()
+        else:
+            prompt, metadata = self._build_query_prompt(query, passenger_context)
+            answer = {}
+            chunks = []
+            try:
+                stream = self.model.stream_content(
+                    prompt, system_instruction=ANSWER_QUERY_INSTRUCTIONS
+                )
+                # Keep the raw chunks for the fallback parse below
+                fields = iter_json_fields(chunks.append(c) or c for c in stream)
+                while True:
+                    try:
+                        key, value = next(fields)
+                    except StopIteration as stop:
+                        complete = stop.value
+                        break
+                    answer[key] = value
+                    yield key, value
+            except Exception as e:
+                yield "error", str(e)
+                return
+            
+            # Cut off or not a plain JSON object: fall back to the full parser,
+            # so a truncated answer is reported (and never cached) as an error
+            if not complete:
+                streamed = answer
+                answer = self._parse_response("".join(chunks))
+                yield from (
+                    (key, value) for key, value in answer.items()
+                    if key not in streamed or streamed[key] != value
+                )
+            
+            answer.update(metadata)
+            if "error" not in answer:
+                self.semantic_cache.put(cache_key, answer)
+            yield from metadata.items()
+        
+        yield "query", query
+    
     def suggest_alternatives(self, original_train: str, passenger_context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Suggest alternative trains when original is delayed/cancelled
@@ -125,50 +268,19 @@ Respond in JSON format:
         travel_date = passenger_context.get("travel_date", "")
         
         # Retrieve alternative trains from RAG
-        query = f"Alternative trains from {origin} to {destination} on {travel_date}"
-        alternatives = self.rag_system.retrieve(query, top_k=10)
+        alternatives = self._retrieve(self.alternatives_query(passenger_context), top_k=10)
         
         prompt = f"""
-You are the Passenger Intelligence Agent. A passenger's train is affected.
-
 ORIGINAL TRAIN: {original_train}
 ORIGIN: {origin}
 DESTINATION: {destination}
 TRAVEL DATE: {travel_date}
 
 PASSENGER CONTEXT:
-{json.dumps(passenger_context, indent=2)}
+{dumps_compact(passenger_context)}
 
 AVAILABLE ALTERNATIVES:
-{json.dumps(alternatives, indent=2)}
-
-Suggest the best alternative trains considering:
-1. Similar arrival time
-2. Seat availability
-3. Fare difference
-4. Connection convenience
-5. Passenger preferences
-
-Respond in JSON format with ranked alternatives:
-{{
-    "alternatives": [
-        {{
-            "train_number": "12345",
-            "train_name": "Express",
-            "departure": "10:30",
-            "arrival": "18:45",
-            "fare_difference": "+150",
-            "seats_available": "Yes",
-            "recommendation_score": 0.95,
-            "pros": ["Faster", "Direct"],
-            "cons": ["Higher fare"],
-            "booking_action": "Can be booked immediately"
-        }}
-    ],
-    "refund_eligible": true,
-    "refund_amount": 1200,
-    "auto_rebooking_available": true
-}}
+{dumps_compact(alternatives)}
 """
         
         if MOCK_MODE or not self.model:
@@ -187,7 +299,9 @@ Respond in JSON format with ranked alternatives:
              }
 
         try:
-            response = self.model.generate_content(prompt)
+            response = self.model.generate_content(
+                prompt, system_instruction=SUGGEST_ALTERNATIVES_INSTRUCTIONS
+            )
             return self._parse_response(response.text)
         except Exception as e:
             return {"error": str(e)}
@@ -196,50 +310,122 @@ Respond in JSON format with ranked alternatives:
         """
         Explain refund policy for a specific ticket
         """
-        # Retrieve refund rules from RAG
-        refund_rules = self.rag_system.retrieve("refund policy rules", top_k=5)
-        
-        prompt = f"""
-You are the Passenger Intelligence Agent. Explain the refund policy.
-
+        def build_prompt():
+            # Retrieve refund rules from RAG
+            refund_rules = self._retrieve(REFUND_RULES_QUERY, top_k=5)
+            return f"""
 TICKET CONTEXT:
-{json.dumps(ticket_context, indent=2)}
+{dumps_compact(ticket_context)}
 
 REFUND RULES:
-{json.dumps(refund_rules, indent=2)}
+{dumps_compact(refund_rules)}
+""", {}
+        
+        try:
+            return self._cached_generate(
+                "refund policy", ticket_context, REFUND_POLICY_INSTRUCTIONS, build_prompt
+            )
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def _retrieve(self, query: str, top_k: int) -> List[Dict[str, Any]]:
+        """RAG retrieval, served from prefetch() results when available"""
+        prefetched = self._prefetched.pop((query, top_k), None)
+        if prefetched is not None:
+            return prefetched
+        return self.rag_system.retrieve(query, top_k=top_k)
+    
+    def _build_query_prompt(self, query: str, passenger_context: Optional[Dict[str, Any]]):
+        """
+        Retrieve RAG context for a query and build the per-request prompt
+        Returns the prompt and the answer metadata (its RAG sources)
+        """
+        rag_context = self._retrieve(query, top_k=5)
+        
+        prompt = f"""
+PASSENGER QUERY: {query}
 
-Provide clear explanation of:
-1. Eligibility for refund
-2. Refund amount calculation
-3. Processing time
-4. How to claim
+PASSENGER CONTEXT:
+{dumps_compact(passenger_context or {})}
 
-Be specific and accurate based on the rules.
+RELEVANT INFORMATION FROM KNOWLEDGE BASE:
+{dumps_compact(rag_context)}
 """
+        return prompt, {"rag_sources": [doc.get("source", "unknown") for doc in rag_context]}
+    
+    def _mock_answer(self, query: str) -> Dict[str, Any]:
+        """Canned answer used in mock mode or without an LLM client"""
+        return {
+            "answer": f"Mock Answer: Based on your query '{query}', here are some details...",
+            "alternatives": [{"option": "Mock Train 1", "details": "On time"}],
+            "policies": [{"rule": "Mock Policy", "description": "Always valid"}],
+            "confidence": 1.0,
+            "rag_sources": ["mock_data"]
+        }
+    
+    def _cached_generate(self, query: str, context: Optional[Dict[str, Any]], instructions: str,
+                         build_prompt: Callable[[], Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Generate and parse an LLM answer, reusing a cached answer when a
+        semantically equivalent query was already answered for the same context
+        and instructions (each prompt's answers have their own schema)
+        
+        build_prompt returns the prompt and metadata fields to store with the
+        answer; it is only called (and its RAG retrieval only run) on a miss.
+        """
+        cache_key = self.semantic_cache.make_key(query, context, namespace=instructions)
+        cached = self.semantic_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        answer = self._adapt_nearby_answer(query, cache_key)
+        if answer is None:
+            prompt, metadata = build_prompt()
+            response = self.model.generate_content(prompt, system_instruction=instructions)
+            answer = self._parse_response(response.text)
+            answer.update(metadata)
+        if "error" not in answer:
+            self.semantic_cache.put(cache_key, answer)
+        return answer
+    
+    def _adapt_nearby_answer(self, query: str, cache_key: CacheKey) -> Optional[Dict[str, Any]]:
+        """
+        Rewrite a near-miss cached answer for the new query with the fast model,
+        instead of a full generation. Returns None if there is nothing close
+        enough or the adaptation fails.
+        """
+        if not self.adapter_model:
+            return None
+        
+        nearby = self.semantic_cache.get_nearby(
+            cache_key, SEMANTIC_CACHE_CONFIG["adapt_threshold"]
+        )
+        if nearby is None:
+            return None
         
+        cached_answer, _ = nearby
+        prompt = f"""
+CACHED ANSWER:
+{dumps_compact(cached_answer)}
+
+NEW QUESTION: {query}
+"""
         try:
-            response = self.model.generate_content(prompt)
-            return self._parse_response(response.text)
+            response = self.adapter_model.generate_content(
+                prompt, system_instruction=ADAPT_CACHED_ANSWER_INSTRUCTIONS
+            )
         except Exception as e:
-            return {"error": str(e)}
+            logger.warning(f"Cached answer adaptation failed: {e}")
+            return None
+        
+        answer = self._parse_response(response.text)
+        if "error" in answer:
+            return None
+        # The adapted answer draws on the same sources as the cached one
+        if "rag_sources" in cached_answer:
+            answer.setdefault("rag_sources", cached_answer["rag_sources"])
+        return answer
     
     def _parse_response(self, response_text: str) -> Dict[str, Any]:
         """Parse Gemini response and extract JSON"""
-        try:
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                json_str = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                json_str = response_text[json_start:json_end].strip()
-            else:
-                json_str = response_text.strip()
-            
-            return json.loads(json_str)
-        except json.JSONDecodeError:
-            try:
-                return json.loads(response_text)
-            except:
-                return {"error": "Failed to parse response", "raw": response_text}
+        return parse_json_response(response_text)
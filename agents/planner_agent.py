@@ -2,27 +2,211 @@
 Planner Agent - Master Brain
 Responsible for task decomposition and decision-making
 """
-import google.generativeai as genai
-from typing import Dict, List, Any
-import json
+from typing import Dict, List, Any, Optional, Tuple
+import hashlib
 import logging
 import os
-from config import AGENT_CONFIG, MOCK_MODE
+import re
+import orjson
+from pydantic import BaseModel, ConfigDict, ValidationError
+from config import AGENT_CONFIG, MOCK_MODE, PLANNER_CACHE_CONFIG
 from utils.llm_client import LLMClient
+from utils.semantic_cache import canonicalize
+from utils.ttl_cache import TTLCache
+from agents._json_utils import dumps_compact, parse_json_response
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+# Static prompt prefixes - sent as system instructions so providers can cache them
+PLANNER_INSTRUCTIONS = """
+You are the Planner Agent - the master brain of a railway intelligence system.
+
+Analyze the request and create an execution plan.
+
+Available Agents:
+1. Operations Agent - Train operations, delay propagation, schedule adjustments
+2. Passenger Agent - Passenger queries, alternative trains, refund/reschedule rules
+3. Crowd Agent - Overcrowding prediction, load balancing, capacity management
+4. Alert Agent - Send notifications, trigger automated actions
+
+Your task:
+1. Understand the request
+2. Break it into subtasks
+3. Assign each subtask to appropriate agent(s)
+4. Define execution order (sequential or parallel)
+5. Specify data requirements for each subtask
+
+Respond in JSON format:
+{
+    "request_type": "delay|query|alert|capacity",
+    "priority": "high|medium|low",
+    "subtasks": [
+        {
+            "task_id": "1",
+            "description": "Task description",
+            "agent": "operations|passenger|crowd|alert",
+            "dependencies": ["task_id"],
+            "execution_type": "sequential|parallel",
+            "inputs": {}
+        }
+    ],
+    "expected_outcome": "What should be achieved"
+}
+"""
+
+REFINE_PLAN_INSTRUCTIONS = """
+You are the Planner Agent. Refine the current execution plan based on feedback.
+
+Provide an updated execution plan in the same JSON format as the current
+plan, adjusting:
+- Remaining subtasks
+- Agent assignments
+- Dependencies
+- Priorities
+
+Only include tasks that haven't been completed yet.
+"""
+
+BATCH_PLANNER_INSTRUCTIONS = PLANNER_INSTRUCTIONS + """
+You will receive several numbered REQUESTS, each with its own CONTEXT.
+Plan each request independently and respond with one JSON object:
+{"plans": [<plan for request 1>, <plan for request 2>, ...]}
+with exactly one plan per request, in the same order.
+"""
+
+
+# Requests regular enough to plan without the LLM; matched against the
+# whole request so anything else asked alongside still goes to the LLM.
+# A station name is one to three words, none of them a conjunction.
+_STATION_WORD = r"(?!(?:and|then|but|so|please)\b)[a-z][a-z'-]*"
+_DELAY_RE = re.compile(
+    r"\s*train\s+(\d{4,5})\s+(?:is\s+|was\s+|has\s+been\s+)?delayed\s+by\s+(\d+)"
+    r"\s*(?:minutes?|mins?)"
+    rf"(?:\s+at\s+({_STATION_WORD}(?:\s+{_STATION_WORD}){{0,2}}?)(?:\s+station)?)?"
+    r"[\s.!]*",
+    re.I
+)
+_ALERT_RE = re.compile(
+    r"\s*(?:please\s+)?(?:send|issue)\s+(?:an?\s+)?alert\s+to\s+(passengers|staff)"
+    r"\s+(?:of|on|for|about)\s+train\s+(\d{4,5})[\s.!]*",
+    re.I
+)
+
+
+def _make_delay_plan(train_number: str, delay_minutes: int,
+                     current_location: Optional[str] = None) -> Dict[str, Any]:
+    """Template plan for a single reported train delay"""
+    return {
+        "request_type": "delay",
+        "priority": "high" if delay_minutes >= 30 else "medium",
+        "subtasks": [
+            {
+                "task_id": "1",
+                "description": f"Analyze delay impact for train {train_number}",
+                "agent": "operations",
+                "dependencies": [],
+                "execution_type": "sequential",
+                "inputs": {
+                    "train_number": train_number,
+                    "delay_minutes": delay_minutes,
+                    "current_location": current_location
+                }
+            },
+            {
+                "task_id": "2",
+                "description": f"Notify passengers of train {train_number} about the delay",
+                "agent": "alert",
+                "dependencies": ["1"],
+                "execution_type": "sequential",
+                "inputs": {
+                    "alert_type": "delay",
+                    "target_audience": "passengers",
+                    "context": {"train_number": train_number, "delay_minutes": delay_minutes}
+                }
+            }
+        ],
+        "expected_outcome": f"Delay impact of train {train_number} analyzed and passengers notified."
+    }
+
+
+def _make_alert_plan(train_number: str, target_audience: str) -> Dict[str, Any]:
+    """Template plan for an explicit alert request"""
+    return {
+        "request_type": "alert",
+        "priority": "high",
+        "subtasks": [
+            {
+                "task_id": "1",
+                "description": f"Send alert to {target_audience} of train {train_number}",
+                "agent": "alert",
+                "dependencies": [],
+                "execution_type": "sequential",
+                "inputs": {
+                    "alert_type": "general",
+                    "target_audience": target_audience,
+                    "context": {"train_number": train_number}
+                }
+            }
+        ],
+        "expected_outcome": f"Alert delivered to {target_audience} of train {train_number}."
+    }
+
+
+def _match_template_plan(request: str) -> Optional[Dict[str, Any]]:
+    """Plan for a trivially classifiable request, or None if the LLM is needed"""
+    match = _DELAY_RE.fullmatch(request)
+    if match:
+        return _make_delay_plan(match.group(1), int(match.group(2)), match.group(3))
+    match = _ALERT_RE.fullmatch(request)
+    if match:
+        return _make_alert_plan(match.group(2), match.group(1).lower())
+    return None
+
+
+class Subtask(BaseModel):
+    """One step of an execution plan"""
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+    
+    task_id: str
+    description: str
+    agent: str
+    dependencies: List[str] = []
+    execution_type: str = "sequential"
+    inputs: Dict[str, Any] = {}
+
+
+class Plan(BaseModel):
+    """Execution plan produced by the planner"""
+    request_type: str
+    priority: str = "medium"
+    subtasks: List[Subtask] = []
+    expected_outcome: str = ""
+
 class PlannerAgent:
     """
     Master brain that understands requests, breaks them into subtasks,
     and decides which agents to invoke
     """
     
+    __slots__ = ("config", "global_state", "model", "plan_cache")
+    
     def __init__(self):
         self.config = AGENT_CONFIG["planner"]
-        self.global_state = {}
+        self.global_state = {
+            "current_plan": None,
+            "request": None,
+            "context": None,
+            "context_json": None,
+            "task_results": {}
+        }
+        # Plans keyed by a hash of (model, prompt inputs), stored as JSON text
+        self.plan_cache = TTLCache(
+            max_entries=PLANNER_CACHE_CONFIG["max_entries"],
+            ttl_seconds=PLANNER_CACHE_CONFIG["ttl_seconds"]
+        )
         if not MOCK_MODE:
             try:
                 self.model = LLMClient(self.config)
@@ -32,9 +216,15 @@ class PlannerAgent:
         else:
             self.model = None
 
-    def analyze_request(self, request: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
+    def analyze_request(self, request: str, context: Dict[str, Any] = None,
+                        context_json: Optional[str] = None) -> Dict[str, Any]:
         """
         Process user request and decompose into subtasks
+        
+        Args:
+            request: User/system request
+            context: Additional context
+            context_json: context already serialized by the caller, if available
         """
         context = context or {}
         input_data = {"request": request, "context": context}
@@ -95,56 +285,35 @@ class PlannerAgent:
             logger.info(f"Returning mock plan: {mock_plan}")
             return mock_plan
         
+        # Regular requests skip the LLM round-trip
+        template_plan = _match_template_plan(request)
+        if template_plan is not None:
+            self.global_state["current_plan"] = template_plan
+            self.global_state["request"] = request
+            self.global_state["context"] = context
+            self.global_state["context_json"] = context_json
+            return template_plan
+        
         # Original analyze_request logic
-
-
+        if context_json is None:
+            context_json = dumps_compact(context)
+        
         prompt = f"""
-You are the Planner Agent - the master brain of a railway intelligence system.
-
-Analyze this request and create an execution plan:
 REQUEST: {request}
 
-CONTEXT: {json.dumps(context or {}, indent=2)}
-
-Available Agents:
-1. Operations Agent - Train operations, delay propagation, schedule adjustments
-2. Passenger Agent - Passenger queries, alternative trains, refund/reschedule rules
-3. Crowd Agent - Overcrowding prediction, load balancing, capacity management
-4. Alert Agent - Send notifications, trigger automated actions
-
-Your task:
-1. Understand the request
-2. Break it into subtasks
-3. Assign each subtask to appropriate agent(s)
-4. Define execution order (sequential or parallel)
-5. Specify data requirements for each subtask
-
-Respond in JSON format:
-{{
-    "request_type": "delay|query|alert|capacity",
-    "priority": "high|medium|low",
-    "subtasks": [
-        {{
-            "task_id": "1",
-            "description": "Task description",
-            "agent": "operations|passenger|crowd|alert",
-            "dependencies": ["task_id"],
-            "execution_type": "sequential|parallel",
-            "inputs": {{}}
-        }}
-    ],
-    "expected_outcome": "What should be achieved"
-}}
+CONTEXT: {context_json}
 """
         
         try:
-            response = self.model.generate_content(prompt)
-            plan = self._parse_response(response.text)
+            plan = self._cached_plan(
+                prompt, PLANNER_INSTRUCTIONS, "analyze", request, context
+            )
             
             # Update global state
             self.global_state["current_plan"] = plan
             self.global_state["request"] = request
             self.global_state["context"] = context
+            self.global_state["context_json"] = context_json
             
             return plan
         except Exception as e:
@@ -154,65 +323,133 @@ Respond in JSON format:
                 "subtasks": []
             }
     
-    def _parse_response(self, response_text: str) -> Dict[str, Any]:
-        """Parse Gemini response and extract JSON"""
-        try:
-            # Extract JSON from markdown code blocks if present
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                json_str = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                json_str = response_text[json_start:json_end].strip()
-            else:
-                json_str = response_text.strip()
+    def analyze_requests_batch(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Plan several independent requests with a single LLM call
+        
+        Args:
+            items: (request, context) pairs
             
-            return json.loads(json_str)
-        except json.JSONDecodeError:
-            # Fallback: try to parse the entire response
+        Returns:
+            One plan per item, in order. Cached plans are reused, and if the
+            batched response cannot be matched up the uncached items are
+            planned one by one. Template-matched requests never reach the LLM.
+        """
+        if MOCK_MODE or not self.model:
+            return [self.analyze_request(request, context) for request, context in items]
+        
+        items = [(request, context or {}) for request, context in items]
+        keys = [self._plan_cache_key("analyze", request, context) for request, context in items]
+        plans: List[Any] = [
+            _match_template_plan(request) or self.plan_cache.get(key)
+            for (request, _), key in zip(items, keys)
+        ]
+        pending = [i for i, cached in enumerate(plans) if cached is None]
+        
+        if len(pending) > 1:
+            prompt = "\n".join(
+                f"{n}) REQUEST: {items[i][0]}\n   CONTEXT: {dumps_compact(items[i][1])}"
+                for n, i in enumerate(pending, 1)
+            )
             try:
-                return json.loads(response_text)
-            except:
-                return {"error": "Failed to parse response", "raw": response_text}
+                response = self.model.generate_content(
+                    prompt, system_instruction=BATCH_PLANNER_INSTRUCTIONS, json_mode=True
+                )
+                batch = parse_json_response(response.text).get("plans")
+                if isinstance(batch, list) and len(batch) == len(pending):
+                    for i, raw_plan in zip(pending, batch):
+                        plan = Plan.model_validate(raw_plan).model_dump()
+                        self.plan_cache.put(keys[i], dumps_compact(plan))
+                        plans[i] = plan
+                else:
+                    logger.warning("Batched plan response did not match the request count")
+            except Exception as e:
+                logger.warning(f"Batched planning failed, planning individually: {e}")
+        
+        return [
+            orjson.loads(plan) if isinstance(plan, str)
+            else plan if plan is not None
+            else self.analyze_request(*items[i])
+            for i, plan in enumerate(plans)
+        ]
+    
+    def _plan_cache_key(self, *key_parts: Any) -> str:
+        """Hash of the model and canonicalized prompt inputs"""
+        payload = orjson.dumps(
+            [self.config["model"], canonicalize(list(key_parts))],
+            default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def _cached_plan(self, prompt: str, instructions: str, *key_parts: Any) -> Dict[str, Any]:
+        """
+        Generate and parse a plan, reusing the plan from an earlier call with
+        the same model and canonicalized inputs
+        """
+        cache_key = self._plan_cache_key(*key_parts)
+        
+        cached = self.plan_cache.get(cache_key)
+        if cached is not None:
+            return orjson.loads(cached)
+        
+        response = self.model.generate_content(
+            prompt, system_instruction=instructions, json_mode=True
+        )
+        plan = self._parse_plan(response.text)
+        if "error" not in plan:
+            self.plan_cache.put(cache_key, dumps_compact(plan))
+        return plan
+    
+    def _parse_plan(self, response_text: str) -> Dict[str, Any]:
+        """
+        Validate a JSON-mode plan response against the Plan model
+        Falls back to lenient parsing if the response does not match
+        """
+        try:
+            return Plan.model_validate_json(response_text).model_dump()
+        except ValidationError as e:
+            logger.warning(f"Plan response failed validation: {e}")
+            return self._parse_response(response_text)
+    
+    def _parse_response(self, response_text: str) -> Dict[str, Any]:
+        """Parse Gemini response and extract JSON"""
+        return parse_json_response(response_text)
     
     def update_state(self, task_id: str, result: Any):
         """Update global state with task results"""
-        if "task_results" not in self.global_state:
-            self.global_state["task_results"] = {}
         self.global_state["task_results"][task_id] = result
     
     def get_state(self) -> Dict[str, Any]:
-        """Get current global state"""
-        return self.global_state
+        """Get a shallow snapshot of the current global state"""
+        return self.global_state.copy()
     
-    def refine_plan(self, feedback: str) -> Dict[str, Any]:
+    def refine_plan(self, feedback: str, current_plan: Dict[str, Any] = None,
+                    task_results: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Refine execution plan based on feedback or intermediate results
+        
+        Args:
+            feedback: Summary of progress so far
+            current_plan: Plan to refine (defaults to the planner's global state)
+            task_results: Results so far (defaults to the planner's global state);
+                pass both when several runs share one planner concurrently
         """
-        current_plan = self.global_state.get("current_plan", {})
-        task_results = self.global_state.get("task_results", {})
+        if current_plan is None:
+            current_plan = self.global_state["current_plan"] or {}
+        if task_results is None:
+            task_results = self.global_state["task_results"]
         
         prompt = f"""
-You are the Planner Agent. Refine the current execution plan based on feedback.
-
-CURRENT PLAN: {json.dumps(current_plan, indent=2)}
-TASK RESULTS SO FAR: {json.dumps(task_results, indent=2)}
+CURRENT PLAN: {dumps_compact(current_plan)}
+TASK RESULTS SO FAR: {dumps_compact(task_results)}
 FEEDBACK: {feedback}
-
-Provide an updated execution plan in the same JSON format, adjusting:
-- Remaining subtasks
-- Agent assignments
-- Dependencies
-- Priorities
-
-Only include tasks that haven't been completed yet.
 """
         
         try:
-            response = self.model.generate_content(prompt)
-            refined_plan = self._parse_response(response.text)
+            refined_plan = self._cached_plan(
+                prompt, REFINE_PLAN_INSTRUCTIONS, "refine",
+                current_plan, task_results, feedback
+            )
             self.global_state["current_plan"] = refined_plan
             return refined_plan
         except Exception as e:
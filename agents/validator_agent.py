@@ -3,13 +3,13 @@ Validator Agent
 Validates data authenticity and prevents hallucination
 """
 from typing import Dict, Any, List, Optional
-from langchain_community.chat_models import ChatOllama
-from langchain.schema import HumanMessage, SystemMessage
 import json
 import re
 from datetime import datetime
 
 from config import settings
+from utils.lazy import LazyProxy
+from utils.llm_client import get_ollama_client
 
 
 class ValidationResult:
@@ -51,11 +51,8 @@ class ValidatorAgent:
     """
     
     def __init__(self):
-        self.llm = ChatOllama(
-            base_url=settings.ollama_base_url,
-            model=settings.ollama_model,
-            temperature=0
-        )
+        self.client = get_ollama_client(settings.ollama_base_url)
+        self.model_name = settings.ollama_model
         
         self.system_prompt = """You are a data validation agent focused on preventing hallucination and ensuring data accuracy.
 
@@ -87,6 +84,19 @@ Output Format (JSON):
     }
 }
 """
+        
+        # Reused by every validation call
+        self._system_message = {"role": "system", "content": self.system_prompt}
+    
+    async def _chat(self, messages: List[Dict[str, str]]) -> str:
+        """Run a deterministic JSON-mode chat completion against Ollama"""
+        response = await self.client.chat(
+            model=self.model_name,
+            messages=messages,
+            format="json",
+            options={"temperature": 0}
+        )
+        return response["message"]["content"]
     
     async def validate(
         self,
@@ -119,8 +129,8 @@ Output Format (JSON):
     ) -> ValidationResult:
         """General validation using LLM"""
         messages = [
-            SystemMessage(content=self.system_prompt),
-            HumanMessage(content=f"""Source Text:
+            self._system_message,
+            {"role": "user", "content": f"""Source Text:
 ---
 {source_text}
 ---
@@ -131,13 +141,13 @@ Extracted Data:
 Strict Mode: {strict}
 
 Validate if the extracted data accurately reflects the source text.
-Check for hallucinations, inconsistencies, or errors.""")
+Check for hallucinations, inconsistencies, or errors."""}
         ]
         
-        response = await self.llm.apredict_messages(messages)
+        response = await self._chat(messages)
         
         try:
-            result = json.loads(response.content)
+            result = json.loads(response)
             return ValidationResult(
                 is_valid=result.get("is_valid", False),
                 confidence=result.get("confidence", 0.0),
@@ -151,7 +161,7 @@ Check for hallucinations, inconsistencies, or errors.""")
                 confidence=0.0,
                 issues=["Failed to parse validation result"],
                 warnings=[],
-                metadata={"raw_response": response.content}
+                metadata={"raw_response": response}
             )
     
     async def _validate_bill_data(
@@ -291,5 +301,5 @@ Check for hallucinations, inconsistencies, or errors.""")
         return True
 
 
-# Global validator agent instance
-validator_agent = ValidatorAgent()
+# Global validator agent instance (built on first use)
+validator_agent: ValidatorAgent = LazyProxy(ValidatorAgent)
@@ -15,6 +15,8 @@ import os
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from utils.aes_support import check_aes_acceleration
+
 # Import orchestrator and RAG lazily to avoid blocking startup
 orchestrator_module = None
 rag_module = None
@@ -92,6 +94,8 @@ async def initialize_components():
     """Initialize heavy components in background to not block server startup"""
     global orchestrator, rag_system
     
+    check_aes_acceleration()
+    
     try:
         # Try to initialize RAG system
         print("📚 Loading RAG system in background...")
@@ -177,7 +181,7 @@ async def orchestrate_request(request: RequestModel):
             raise HTTPException(status_code=503, detail="Orchestrator not initialized")
         
         # Run orchestration
-        result = orchestrator.run(request.request, request.context)
+        result = await orchestrator.arun(request.request, request.context)
         
         return ResponseModel(
             success=True,
@@ -206,7 +210,7 @@ async def handle_train_delay(delay_request: TrainDelayRequest):
             "affected_passengers": delay_request.affected_passengers
         }
         
-        result = orchestrator.run(request, context)
+        result = await orchestrator.arun(request, context)
         
         return ResponseModel(
             success=True,
@@ -230,7 +234,7 @@ async def handle_passenger_query(query_request: PassengerQueryRequest):
         if query_request.passenger_id:
             context["passenger_id"] = query_request.passenger_id
         
-        result = orchestrator.run(request, context)
+        result = await orchestrator.arun(request, context)
         
         return ResponseModel(
             success=True,
@@ -258,7 +262,7 @@ async def send_alert(alert_request: AlertRequest):
             "channels": alert_request.channels
         }
         
-        result = orchestrator.run(request, context)
+        result = await orchestrator.arun(request, context)
         
         return ResponseModel(
             success=True,
@@ -14,6 +14,8 @@ LLM_PROVIDER = "groq" if GROQ_API_KEY else "gemini"
 # Models
 GEMINI_MODEL = "gemini-pro"
 GROQ_MODEL = "llama-3.3-70b-versatile" # High performance model
+GEMINI_FAST_MODEL = "gemini-1.5-flash"
+GROQ_FAST_MODEL = "llama-3.1-8b-instant" # Cheap model for lightweight rewrites
 
 # Database Configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///railway_intelligence.db")
@@ -33,6 +35,43 @@ else:
 # Vector Store Configuration
 VECTOR_STORE_PATH = "./data/vector_store"
 EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+EMBEDDING_BATCH_SIZE = 64  # texts per forward pass when indexing
+EMBEDDING_STORAGE_DTYPE = "float32"  # "float16" halves RAG embedding memory and scan bandwidth
+
+# Exported ONNX copy of EMBEDDING_MODEL (see rag/onnx_embedder.py); used
+# instead of sentence-transformers when the file exists and onnxruntime is installed
+ONNX_EMBEDDING_CONFIG = {
+    "model_dir": "./data/models/all-MiniLM-L6-v2-onnx",
+    "model_file": "model_int8.onnx",
+    "max_length": 256
+}
+QUERY_EMBEDDING_CACHE_SIZE = 2048  # recent query embeddings kept by RAGSystem
+
+# Approximate nearest-neighbour search (optional faiss); smaller collections
+# are scanned exactly
+ANN_INDEX_CONFIG = {
+    "min_documents": 5000,
+    "hnsw_m": 32,
+    "ef_construction": 200,
+    "ef_search": 64
+}
+
+# Exact search on a CUDA device through faiss-gpu, preferred over HNSW when
+# a GPU is present
+GPU_SEARCH_CONFIG = {
+    "min_documents": 5000,
+    "device": 0
+}
+
+# int8 pre-scan for exactly-searched collections (needs optional simsimd);
+# the best rerank_factor * top_k rows are rescored in float32
+QUANTIZED_SCAN_CONFIG = {
+    "min_documents": 2048,
+    "rerank_factor": 4
+}
+
+# Numba on-disk cache for compiled kernels (see utils/jit.py)
+NUMBA_CACHE_DIR = "./data/cache/numba"
 
 # RAG Configuration
 RAG_DATA_SOURCES = {
@@ -42,6 +81,33 @@ RAG_DATA_SOURCES = {
     "route_maps": "./data/rag/route_maps.json"
 }
 
+# Prompt Cache Configuration
+PROMPT_CACHE_TTL = 3600  # seconds a server-side static prompt prefix stays cached
+# Gemini only caches prefixes on versioned 1.5+ models, above a minimum size;
+# shorter prefixes are sent inline without attempting a cache
+PROMPT_CACHE_MODEL_PREFIXES = ("gemini-1.5-", "gemini-2")
+PROMPT_CACHE_MIN_TOKENS = 32768
+
+# Semantic Cache Configuration
+SEMANTIC_CACHE_CONFIG = {
+    "similarity_threshold": 0.92,
+    "adapt_threshold": 0.85,  # near matches above this are adapted by the fast model
+    "ttl_seconds": 3600,
+    "max_entries": 1024
+}
+
+# Planner Cache Configuration
+PLANNER_CACHE_CONFIG = {
+    "ttl_seconds": 3600,
+    "max_entries": 512
+}
+
+# Context Store Configuration
+CONTEXT_STORE_CONFIG = {
+    "ttl_seconds": 3600,  # idle time before a conversation context is dropped
+    "max_entries": 10000
+}
+
 # Alert Configuration
 TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID", "")
 TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN", "")
@@ -81,5 +147,23 @@ AGENT_CONFIG = {
     "alert": {
         "model": GROQ_MODEL if LLM_PROVIDER == "groq" else "gemini-pro",
         "description": "Handles external communications"
+    },
+    "cache_adapter": {
+        "model": GROQ_FAST_MODEL if LLM_PROVIDER == "groq" else GEMINI_FAST_MODEL,
+        "temperature": 0.2,
+        "max_tokens": 1500
     }
 }
+
+# Directories the system writes to
+DATA_DIRECTORIES = (VECTOR_STORE_PATH, NUMBA_CACHE_DIR)
+_created_directories = set()
+
+def ensure_directories(*paths: str):
+    """Create the given directories (default: DATA_DIRECTORIES) once per process"""
+    for path in paths or DATA_DIRECTORIES:
+        if path in _created_directories:
+            continue
+        if not os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
+        _created_directories.add(path)
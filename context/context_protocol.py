@@ -2,11 +2,14 @@
 Context Protocol Implementation
 Manages user context, permissions, and state across agents
 """
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, Optional, Any, Set, Union
 from datetime import datetime
-from dataclasses import dataclass, field, asdict
+import time
+from dataclasses import dataclass, field
 from enum import Enum
-import json
+import orjson
+from config import CONTEXT_STORE_CONFIG
+from utils.ttl_cache import TTLCache
 
 
 class ChannelType(str, Enum):
@@ -25,7 +28,19 @@ class ConversationState(str, Enum):
     ERRORED = "errored"
 
 
-@dataclass
+# Enum <-> string tables, so (de)serialization is a dict lookup
+_CHANNEL_VALUE = {channel: channel.value for channel in ChannelType}
+_CHANNEL_BY_VALUE = {channel.value: channel for channel in ChannelType}
+_STATE_VALUE = {state: state.value for state in ConversationState}
+_STATE_BY_VALUE = {state.value: state for state in ConversationState}
+
+
+def _iso_to_ns(value: str) -> int:
+    """Convert an ISO timestamp back to epoch nanoseconds"""
+    return round(datetime.fromisoformat(value).timestamp() * 1_000_000) * 1000
+
+
+@dataclass(slots=True)
 class UserContext:
     """
     User context that travels across all agents
@@ -34,12 +49,21 @@ class UserContext:
     user_id: str
     channel: ChannelType
     conversation_id: str
-    permissions: List[str] = field(default_factory=list)
+    permissions: Set[str] = field(default_factory=set)
     conversation_state: ConversationState = ConversationState.ACTIVE
     memory_scope: str = "private"
     metadata: Dict[str, Any] = field(default_factory=dict)
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    # Stored as epoch nanoseconds; exposed as datetimes through properties
+    created_at_ns: int = field(default_factory=time.time_ns)
+    updated_at_ns: int = field(default_factory=time.time_ns)
+    
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self.created_at_ns / 1e9)
+    
+    @property
+    def updated_at(self) -> datetime:
+        return datetime.fromtimestamp(self.updated_at_ns / 1e9)
     
     def has_permission(self, permission: str) -> bool:
         """Check if user has specific permission"""
@@ -48,73 +72,86 @@ class UserContext:
     def add_permission(self, permission: str):
         """Add permission to user context"""
         if permission not in self.permissions:
-            self.permissions.append(permission)
-            self.updated_at = datetime.now()
+            self.permissions.add(permission)
+            self.updated_at_ns = time.time_ns()
     
     def remove_permission(self, permission: str):
         """Remove permission from user context"""
         if permission in self.permissions:
-            self.permissions.remove(permission)
-            self.updated_at = datetime.now()
+            self.permissions.discard(permission)
+            self.updated_at_ns = time.time_ns()
     
     def update_state(self, state: ConversationState):
         """Update conversation state"""
         self.conversation_state = state
-        self.updated_at = datetime.now()
+        self.updated_at_ns = time.time_ns()
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        data = asdict(self)
-        data['channel'] = self.channel.value
-        data['conversation_state'] = self.conversation_state.value
-        data['created_at'] = self.created_at.isoformat()
-        data['updated_at'] = self.updated_at.isoformat()
-        return data
+        """Convert to dictionary (metadata is shared, not copied)"""
+        return {
+            'user_id': self.user_id,
+            'channel': _CHANNEL_VALUE[self.channel],
+            'conversation_id': self.conversation_id,
+            'permissions': sorted(self.permissions),
+            'conversation_state': _STATE_VALUE[self.conversation_state],
+            'memory_scope': self.memory_scope,
+            'metadata': self.metadata,
+            'created_at': self.created_at.isoformat(),
+            'updated_at': self.updated_at.isoformat()
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'UserContext':
         """Create from dictionary"""
-        data['channel'] = ChannelType(data['channel'])
-        data['conversation_state'] = ConversationState(data['conversation_state'])
-        data['created_at'] = datetime.fromisoformat(data['created_at'])
-        data['updated_at'] = datetime.fromisoformat(data['updated_at'])
+        data['permissions'] = set(data.get('permissions', ()))
+        data['channel'] = _CHANNEL_BY_VALUE[data['channel']]
+        data['conversation_state'] = _STATE_BY_VALUE[data['conversation_state']]
+        data['created_at_ns'] = _iso_to_ns(data.pop('created_at'))
+        data['updated_at_ns'] = _iso_to_ns(data.pop('updated_at'))
         return cls(**data)
     
     def to_json(self) -> str:
         """Serialize to JSON"""
-        return json.dumps(self.to_dict())
+        return orjson.dumps(self.to_dict()).decode()
     
     @classmethod
-    def from_json(cls, json_str: str) -> 'UserContext':
-        """Deserialize from JSON"""
-        return cls.from_dict(json.loads(json_str))
+    def from_json(cls, json_str: Union[str, bytes]) -> 'UserContext':
+        """Deserialize from JSON (str or bytes)"""
+        return cls.from_dict(orjson.loads(json_str))
 
 
 class ContextProtocol:
     """
     Context Protocol Manager
     Manages context lifecycle and ensures secure access
+    
+    Contexts live in a bounded, thread-safe LRU store and are dropped after
+    CONTEXT_STORE_CONFIG["ttl_seconds"] without being read or updated.
     """
     
     def __init__(self):
-        self._contexts: Dict[str, UserContext] = {}
+        self._contexts = TTLCache(
+            max_entries=CONTEXT_STORE_CONFIG["max_entries"],
+            ttl_seconds=CONTEXT_STORE_CONFIG["ttl_seconds"],
+            sliding=True
+        )
     
     def create_context(
         self,
         user_id: str,
         channel: ChannelType,
         conversation_id: str,
-        permissions: Optional[List[str]] = None
+        permissions: Optional[Iterable[str]] = None
     ) -> UserContext:
         """Create new user context"""
         context = UserContext(
             user_id=user_id,
             channel=channel,
             conversation_id=conversation_id,
-            permissions=permissions or [],
+            permissions=set(permissions or ()),
             memory_scope="private"
         )
-        self._contexts[conversation_id] = context
+        self._contexts.put(conversation_id, context)
         return context
     
     def get_context(self, conversation_id: str) -> Optional[UserContext]:
@@ -123,12 +160,11 @@ class ContextProtocol:
     
     def update_context(self, conversation_id: str, context: UserContext):
         """Update existing context"""
-        self._contexts[conversation_id] = context
+        self._contexts.put(conversation_id, context)
     
     def delete_context(self, conversation_id: str):
         """Delete context"""
-        if conversation_id in self._contexts:
-            del self._contexts[conversation_id]
+        self._contexts.pop(conversation_id)
     
     def validate_permission(
         self,
@@ -3,13 +3,18 @@ Railway Intelligence Multi-Agent System
 Main entry point for the application
 """
 import asyncio
+import sys
+import orjson
 from orchestrator import RailwayOrchestrator
 from rag.rag_system import RAGSystem
-import json
+from utils.aes_support import check_aes_acceleration
+
+_EMIT_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
 
 def initialize_system():
     """Initialize the system and RAG data"""
     print("🚂 Initializing Railway Intelligence System...")
+    check_aes_acceleration()
     
     # Initialize RAG system
     print("📚 Loading RAG knowledge base...")
@@ -29,77 +34,91 @@ def initialize_system():
     
     return orchestrator
 
-def demo_scenario_1(orchestrator: RailwayOrchestrator):
-    """Demo: Train delay scenario"""
-    print("\n" + "="*70)
-    print("🎬 DEMO SCENARIO 1: Train Delay")
-    print("="*70)
-    
-    request = "Train 12627 is delayed by 45 minutes at Katpadi station"
-    context = {
-        "train_number": "12627",
-        "delay_minutes": 45,
-        "current_location": "Katpadi",
-        "affected_passengers": 850
-    }
-    
-    print(f"\n📢 Request: {request}")
-    print(f"📊 Context: {json.dumps(context, indent=2)}\n")
+# Demo scenarios: (title, request, context)
+DEMO_SCENARIOS = [
+    (
+        "DEMO SCENARIO 1: Train Delay",
+        "Train 12627 is delayed by 45 minutes at Katpadi station",
+        {
+            "train_number": "12627",
+            "delay_minutes": 45,
+            "current_location": "Katpadi",
+            "affected_passengers": 850
+        }
+    ),
+    (
+        "DEMO SCENARIO 2: Passenger Query",
+        "Passenger wants to know alternative trains from Bangalore to Delhi for tomorrow",
+        {
+            "passenger_id": "P1234",
+            "origin": "Bangalore",
+            "destination": "New Delhi",
+            "travel_date": "2025-12-24",
+            "class_preference": "ac_2tier"
+        }
+    ),
+    (
+        "DEMO SCENARIO 3: Overcrowding Prediction",
+        "Predict overcrowding for Train 12627 on December 25, 2025",
+        {
+            "train_number": "12627",
+            "travel_date": "2025-12-25",
+            "is_holiday": True
+        }
+    )
+]
+
+def _emit(obj):
+    """Print obj as indented JSON"""
+    # Through the text layer, so output stays in order with print() and
+    # works when stdout has no byte buffer (pytest capture, IDE consoles)
+    print(orjson.dumps(obj, default=str, option=_EMIT_OPTIONS).decode())
+
+def print_demo_header(title: str, request: str, context: dict):
+    """Print the banner, request and context of a demo scenario"""
+    banner = "="*70
+    sys.stdout.write(f"\n{banner}\n🎬 {title}\n{banner}\n\n📢 Request: {request}\n📊 Context: ")
+    _emit(context)
+    print()
+
+def print_demo_result(result: dict):
+    """Print the orchestrator result of a demo scenario"""
+    sys.stdout.write("\n📋 RESULTS:\n")
+    _emit(result)
+
+def run_demo(orchestrator: RailwayOrchestrator, scenario: tuple):
+    """Run a single demo scenario"""
+    title, request, context = scenario
+    print_demo_header(title, request, context)
     
     result = orchestrator.run(request, context)
     
-    print("\n📋 RESULTS:")
-    print(json.dumps(result, indent=2))
-    
+    print_demo_result(result)
     return result
 
+def demo_scenario_1(orchestrator: RailwayOrchestrator):
+    """Demo: Train delay scenario"""
+    return run_demo(orchestrator, DEMO_SCENARIOS[0])
+
 def demo_scenario_2(orchestrator: RailwayOrchestrator):
     """Demo: Passenger query scenario"""
-    print("\n" + "="*70)
-    print("🎬 DEMO SCENARIO 2: Passenger Query")
-    print("="*70)
-    
-    request = "Passenger wants to know alternative trains from Bangalore to Delhi for tomorrow"
-    context = {
-        "passenger_id": "P1234",
-        "origin": "Bangalore",
-        "destination": "New Delhi",
-        "travel_date": "2025-12-24",
-        "class_preference": "ac_2tier"
-    }
-    
-    print(f"\n📢 Request: {request}")
-    print(f"📊 Context: {json.dumps(context, indent=2)}\n")
-    
-    result = orchestrator.run(request, context)
-    
-    print("\n📋 RESULTS:")
-    print(json.dumps(result, indent=2))
-    
-    return result
+    return run_demo(orchestrator, DEMO_SCENARIOS[1])
 
 def demo_scenario_3(orchestrator: RailwayOrchestrator):
     """Demo: Overcrowding prediction scenario"""
-    print("\n" + "="*70)
-    print("🎬 DEMO SCENARIO 3: Overcrowding Prediction")
-    print("="*70)
-    
-    request = "Predict overcrowding for Train 12627 on December 25, 2025"
-    context = {
-        "train_number": "12627",
-        "travel_date": "2025-12-25",
-        "is_holiday": True
-    }
-    
-    print(f"\n📢 Request: {request}")
-    print(f"📊 Context: {json.dumps(context, indent=2)}\n")
-    
-    result = orchestrator.run(request, context)
+    return run_demo(orchestrator, DEMO_SCENARIOS[2])
+
+async def run_all_demos(orchestrator: RailwayOrchestrator):
+    """Plan all demo scenarios in one call, run them concurrently, then print them in order"""
+    results = await orchestrator.arun_batch([
+        (request, context) for _, request, context in DEMO_SCENARIOS
+    ])
     
-    print("\n📋 RESULTS:")
-    print(json.dumps(result, indent=2))
+    for (title, request, context), result in zip(DEMO_SCENARIOS, results):
+        print_demo_header(title, request, context)
+        print_demo_result(result)
     
-    return result
+    return results
 
 def interactive_mode(orchestrator: RailwayOrchestrator):
     """Interactive mode for custom requests"""
@@ -127,8 +146,7 @@ def interactive_mode(orchestrator: RailwayOrchestrator):
         
         result = orchestrator.run(request, {})
         
-        print("\n📋 RESULTS:")
-        print(json.dumps(result, indent=2))
+        print_demo_result(result)
 
 def main():
     """Main function"""
@@ -163,9 +181,7 @@ def main():
         elif choice == "3":
             demo_scenario_3(orchestrator)
         elif choice == "4":
-            demo_scenario_1(orchestrator)
-            demo_scenario_2(orchestrator)
-            demo_scenario_3(orchestrator)
+            asyncio.run(run_all_demos(orchestrator))
         elif choice == "5":
             interactive_mode(orchestrator)
         elif choice == "6":
@@ -2,11 +2,13 @@
 MCP (Model Context Protocol) Tool Layer
 Standardizes tool access with security and scope enforcement
 """
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Mapping, Optional, Callable, Union
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-import json
+from functools import cached_property
+from types import MappingProxyType
+import sys
 
 from context.context_protocol import UserContext
 
@@ -31,9 +33,58 @@ class ToolScope(str, Enum):
     FILE_WRITE = "file.write"
 
 
-@dataclass
+# Machine-readable error codes returned by MCPToolRegistry.execute_tool
+ERROR_UNKNOWN_TOOL = "unknown_tool"
+ERROR_INSUFFICIENT_PERMISSIONS = "insufficient_permissions"
+ERROR_INVALID_PARAMETERS = "invalid_parameters"
+ERROR_EXECUTION_FAILED = "execution_failed"
+
+
+def _is_granted(scope: str, permissions) -> bool:
+    """Whether a scope is granted directly or by a wildcard such as 'email.*'"""
+    if scope in permissions:
+        return True
+    parts = scope.split(".")
+    return any(".".join(parts[:i]) + ".*" in permissions for i in range(1, len(parts)))
+
+
+class _ScopeTrie:
+    """
+    Scope names split on '.'; every node holds the tools registered under
+    that prefix, so 'email' finds tools with 'email.read' and 'email.send'
+    """
+    __slots__ = ("children", "tools")
+    
+    def __init__(self):
+        self.children: Dict[str, "_ScopeTrie"] = {}
+        self.tools: Dict[str, None] = {}  # insertion-ordered set
+    
+    def add(self, scope: str, tool_name: str):
+        node = self
+        for part in scope.split("."):
+            node = node.children.setdefault(part, _ScopeTrie())
+            node.tools[tool_name] = None
+    
+    def remove(self, scope: str, tool_name: str):
+        node = self
+        for part in scope.split("."):
+            node = node.children.get(part)
+            if node is None:
+                return
+            node.tools.pop(tool_name, None)
+    
+    def find(self, prefix: str) -> Dict[str, None]:
+        node = self
+        for part in prefix.split("."):
+            node = node.children.get(part)
+            if node is None:
+                return {}
+        return node.tools
+
+
+@dataclass(frozen=True)
 class ToolDefinition:
-    """MCP Tool Definition"""
+    """MCP Tool Definition (immutable once created)"""
     name: str
     description: str
     capabilities: List[ToolCapability]
@@ -51,6 +102,18 @@ class ToolDefinition:
             "parameters": self.parameters,
             "version": self.version
         }
+    
+    @cached_property
+    def as_dict(self) -> Mapping[str, Any]:
+        """Read-only dictionary view, built once per definition"""
+        return MappingProxyType({
+            "name": self.name,
+            "description": self.description,
+            "capabilities": tuple(c.value for c in self.capabilities),
+            "scopes": tuple(s.value for s in self.scopes),
+            "parameters": self.parameters,
+            "version": self.version
+        })
 
 
 class MCPTool(ABC):
@@ -61,6 +124,7 @@ class MCPTool(ABC):
     
     def __init__(self, definition: ToolDefinition):
         self.definition = definition
+        self._required_scopes = frozenset(scope.value for scope in definition.scopes)
     
     @abstractmethod
     async def execute(
@@ -75,11 +139,11 @@ class MCPTool(ABC):
         pass
     
     def validate_context(self, context: UserContext) -> bool:
-        """Validate if context has required permissions"""
-        for scope in self.definition.scopes:
-            if not context.has_permission(scope.value):
-                return False
-        return True
+        """Validate if context has required permissions (wildcards like 'email.*' allowed)"""
+        permissions = context.permissions
+        if self._required_scopes <= permissions:
+            return True
+        return all(_is_granted(scope, permissions) for scope in self._required_scopes)
     
     def validate_parameters(self, parameters: Dict[str, Any]) -> bool:
         """Validate if all required parameters are provided"""
@@ -89,9 +153,9 @@ class MCPTool(ABC):
                 return False
         return True
     
-    def get_definition(self) -> Dict[str, Any]:
-        """Get tool definition"""
-        return self.definition.to_dict()
+    def get_definition(self) -> Mapping[str, Any]:
+        """Get tool definition (shared read-only view; use definition.to_dict() for a copy)"""
+        return self.definition.as_dict
 
 
 class MCPToolRegistry:
@@ -102,15 +166,29 @@ class MCPToolRegistry:
     
     def __init__(self):
         self._tools: Dict[str, MCPTool] = {}
+        # Reverse indices for discovery; dicts used as insertion-ordered sets
+        self._by_capability: Dict[ToolCapability, Dict[str, None]] = {}
+        self._scope_trie = _ScopeTrie()
     
     def register_tool(self, tool: MCPTool):
         """Register a new tool"""
-        self._tools[tool.definition.name] = tool
+        name = sys.intern(tool.definition.name)
+        self.unregister_tool(name)
+        self._tools[name] = tool
+        for capability in tool.definition.capabilities:
+            self._by_capability.setdefault(capability, {})[name] = None
+        for scope in tool.definition.scopes:
+            self._scope_trie.add(scope.value, name)
     
     def unregister_tool(self, tool_name: str):
         """Unregister a tool"""
-        if tool_name in self._tools:
-            del self._tools[tool_name]
+        tool = self._tools.pop(tool_name, None)
+        if tool is None:
+            return
+        for capability in tool.definition.capabilities:
+            self._by_capability.get(capability, {}).pop(tool_name, None)
+        for scope in tool.definition.scopes:
+            self._scope_trie.remove(scope.value, tool_name)
     
     def get_tool(self, tool_name: str) -> Optional[MCPTool]:
         """Get tool by name"""
@@ -119,7 +197,7 @@ class MCPToolRegistry:
     def list_tools(
         self,
         context: Optional[UserContext] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Mapping[str, Any]]:
         """
         List all available tools
         If context provided, filter by permissions
@@ -133,19 +211,29 @@ class MCPToolRegistry:
     def discover_tools(
         self,
         capability: Optional[ToolCapability] = None,
-        scope: Optional[ToolScope] = None
+        scope: Optional[Union[ToolScope, str]] = None
     ) -> List[str]:
-        """Discover tools by capability or scope"""
-        matching_tools = []
+        """
+        Discover tools by capability or scope
+        scope may be a full scope or a prefix such as 'email' / 'email.*'
+        """
+        if capability is None and scope is None:
+            return list(self._tools)
         
-        for name, tool in self._tools.items():
-            if capability and capability not in tool.definition.capabilities:
-                continue
-            if scope and scope not in tool.definition.scopes:
-                continue
-            matching_tools.append(name)
+        by_scope = None
+        if scope is not None:
+            prefix = scope.value if isinstance(scope, ToolScope) else scope
+            if prefix.endswith(".*"):
+                prefix = prefix[:-2]
+            by_scope = self._scope_trie.find(prefix)
         
-        return matching_tools
+        if capability is None:
+            return list(by_scope)
+        
+        matching_tools = self._by_capability.get(capability, {})
+        if by_scope is None:
+            return list(matching_tools)
+        return [name for name in matching_tools if name in by_scope]
     
     async def execute_tool(
         self,
@@ -159,35 +247,25 @@ class MCPToolRegistry:
         tool = self.get_tool(tool_name)
         
         if not tool:
-            return {
-                "success": False,
-                "error": f"Tool '{tool_name}' not found"
-            }
+            return {"success": False, "error": ERROR_UNKNOWN_TOOL, "tool": tool_name}
         
         # Validate context permissions
         if not tool.validate_context(context):
-            return {
-                "success": False,
-                "error": f"Insufficient permissions for tool '{tool_name}'"
-            }
+            return {"success": False, "error": ERROR_INSUFFICIENT_PERMISSIONS, "tool": tool_name}
         
         # Validate parameters
         if not tool.validate_parameters(parameters):
-            return {
-                "success": False,
-                "error": f"Invalid parameters for tool '{tool_name}'"
-            }
+            return {"success": False, "error": ERROR_INVALID_PARAMETERS, "tool": tool_name}
         
         try:
             result = await tool.execute(context, parameters)
-            return {
-                "success": True,
-                "result": result
-            }
+            return {"success": True, "result": result}
         except Exception as e:
             return {
                 "success": False,
-                "error": str(e)
+                "error": ERROR_EXECUTION_FAILED,
+                "tool": tool_name,
+                "detail": str(e)
             }
 
 
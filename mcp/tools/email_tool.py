@@ -2,12 +2,18 @@
 Email Tool - MCP Implementation
 Handles email operations via Gmail API
 """
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import asyncio
 import base64
-import os.path
+import logging
+import os
+import threading
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
+import httplib2
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
@@ -15,10 +21,23 @@ from googleapiclient.errors import HttpError
 from mcp.tool_layer import MCPTool, ToolDefinition, ToolCapability, ToolScope
 from context.context_protocol import UserContext
 from config import settings
+from utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
 
 
 SCOPES = ['https://www.googleapis.com/auth/gmail.readonly']
 
+# Gmail accepts at most 100 sub-requests per batch HTTP request
+GMAIL_BATCH_LIMIT = 100
+
+# Refresh OAuth tokens in the background this long before they expire
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+# Built Gmail service objects kept per user
+SERVICE_CACHE_SIZE = 256
+SERVICE_CACHE_TTL = 3600
+
 
 class EmailTool(MCPTool):
     """
@@ -57,34 +76,118 @@ class EmailTool(MCPTool):
             }
         )
         super().__init__(definition)
-        self._credentials_cache: Dict[str, Credentials] = {}
+        # user_id -> (token file mtime_ns, credentials); a newer token file
+        # on disk invalidates the entry
+        self._credentials_cache: Dict[str, Tuple[int, Credentials]] = {}
+        # One transport for every token refresh instead of one per call
+        self._shared_request = Request()
+        # user_id -> (credentials, service); rebuilt when the credentials change
+        self._service_cache = TTLCache(
+            max_entries=SERVICE_CACHE_SIZE,
+            ttl_seconds=SERVICE_CACHE_TTL,
+            sliding=True
+        )
+        # Background token refreshes; one in flight per user at most
+        self._refresh_executor = ThreadPoolExecutor(max_workers=2)
+        self._refreshing: set = set()
+        self._refresh_lock = threading.Lock()
+    
+    def _get_service(self, user_id: str, creds: Credentials):
+        """
+        Get the Gmail service for a user, building it only once per credentials
+        Service objects are shared between requests, so each request supplies
+        its own HTTP connection (see _new_http) for thread safety.
+        """
+        cached = self._service_cache.get(user_id)
+        if cached is not None and cached[0] is creds:
+            return cached[1]
+        
+        service = build(
+            'gmail', 'v1',
+            credentials=creds,
+            cache_discovery=False,
+            static_discovery=True
+        )
+        self._service_cache.put(user_id, (creds, service))
+        return service
+    
+    @staticmethod
+    def _new_http(creds: Credentials) -> AuthorizedHttp:
+        """Authorized HTTP connection for one request (httplib2 is not thread-safe)"""
+        return AuthorizedHttp(creds, http=httplib2.Http())
     
     def _get_credentials(self, user_id: str) -> Optional[Credentials]:
-        """Get or refresh Gmail API credentials for user"""
-        if user_id in self._credentials_cache:
-            creds = self._credentials_cache[user_id]
-            if creds and creds.valid:
-                return creds
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-                return creds
-        
-        # Load credentials from file
-        token_path = f'./credentials/token_{user_id}.json'
-        creds = None
-        
-        if os.path.exists(token_path):
+        """
+        Get or refresh Gmail API credentials for user
+        The token file is only parsed again when its mtime changes.
+        """
+        token_path = self._token_path(user_id)
+        try:
+            mtime_ns = os.stat(token_path).st_mtime_ns
+        except FileNotFoundError:
+            # Need to initiate OAuth flow
+            self._credentials_cache.pop(user_id, None)
+            return None
+        
+        cached = self._credentials_cache.get(user_id)
+        if cached is not None and cached[0] == mtime_ns:
+            creds = cached[1]
+        else:
             creds = Credentials.from_authorized_user_file(token_path, SCOPES)
+            self._credentials_cache[user_id] = (mtime_ns, creds)
         
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                # Need to initiate OAuth flow
-                return None
+        if creds.valid:
+            self._schedule_refresh(user_id, creds)
+            return creds
+        if creds.expired and creds.refresh_token:
+            self._refresh_credentials(user_id, creds)
+            return creds
+        return None
+    
+    @staticmethod
+    def _token_path(user_id: str) -> str:
+        return f'./credentials/token_{user_id}.json'
+    
+    def _refresh_credentials(self, user_id: str, creds: Credentials):
+        """Refresh a token and persist it, so restarts start from the new token"""
+        creds.refresh(self._shared_request)
+        
+        # Write-then-rename so readers never see a partial token file
+        token_path = self._token_path(user_id)
+        tmp_path = f"{token_path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w') as token_file:
+            token_file.write(creds.to_json())
+        os.replace(tmp_path, token_path)
+        
+        # Keep the refreshed object (and the service built on it) cached
+        # under the new mtime instead of re-reading our own write
+        self._credentials_cache[user_id] = (os.stat(token_path).st_mtime_ns, creds)
+    
+    def _schedule_refresh(self, user_id: str, creds: Credentials):
+        """
+        Refresh a still-valid token in the background once it is close to
+        expiry, keeping the refresh round-trip off the request path
+        """
+        if not creds.refresh_token or creds.expiry is None:
+            return
+        if creds.expiry - datetime.utcnow() > TOKEN_REFRESH_MARGIN:
+            return
+        
+        with self._refresh_lock:
+            if user_id in self._refreshing:
+                return
+            self._refreshing.add(user_id)
+        
+        def refresh():
+            try:
+                self._refresh_credentials(user_id, creds)
+            except Exception:
+                logger.warning("Background token refresh failed for %s", user_id, exc_info=True)
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(user_id)
         
-        self._credentials_cache[user_id] = creds
-        return creds
+        self._refresh_executor.submit(refresh)
     
     async def execute(
         self,
@@ -94,8 +197,8 @@ class EmailTool(MCPTool):
         """Execute email operation"""
         action = parameters.get("action")
         
-        # Get credentials
-        creds = self._get_credentials(context.user_id)
+        # Get credentials (loading or refreshing them is blocking I/O)
+        creds = await asyncio.to_thread(self._get_credentials, context.user_id)
         if not creds:
             return {
                 "error": "Gmail not authenticated. Please complete OAuth flow.",
@@ -103,14 +206,15 @@ class EmailTool(MCPTool):
             }
         
         try:
-            service = build('gmail', 'v1', credentials=creds)
+            service = self._get_service(context.user_id, creds)
+            http = self._new_http(creds)
             
             if action == "search":
-                return await self._search_emails(service, parameters)
+                return await self._search_emails(service, http, parameters)
             elif action == "read":
-                return await self._read_email(service, parameters)
+                return await self._read_email(service, http, parameters)
             elif action == "list":
-                return await self._list_emails(service, parameters)
+                return await self._list_emails(service, http, parameters)
             else:
                 return {"error": f"Unknown action: {action}"}
                 
@@ -120,6 +224,7 @@ class EmailTool(MCPTool):
     async def _search_emails(
         self,
         service,
+        http,
         parameters: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Search emails"""
@@ -127,11 +232,14 @@ class EmailTool(MCPTool):
         max_results = parameters.get("max_results", 10)
         
         # Search messages
-        results = service.users().messages().list(
-            userId='me',
-            q=query,
-            maxResults=max_results
-        ).execute()
+        results = await asyncio.to_thread(
+            service.users().messages().list(
+                userId='me',
+                q=query,
+                maxResults=max_results
+            ).execute,
+            http=http
+        )
         
         messages = results.get('messages', [])
         
@@ -142,16 +250,17 @@ class EmailTool(MCPTool):
                 "messages": []
             }
         
-        # Get full message details
-        detailed_messages = []
-        for msg in messages[:max_results]:
-            msg_detail = service.users().messages().get(
-                userId='me',
-                id=msg['id'],
+        # Get full message details in one batched round-trip
+        detailed_messages = [
+            self._parse_message(msg_detail)
+            for msg_detail in await asyncio.to_thread(
+                self._batch_get_messages,
+                service,
+                http,
+                [msg['id'] for msg in messages[:max_results]],
                 format='full'
-            ).execute()
-            
-            detailed_messages.append(self._parse_message(msg_detail))
+            )
+        ]
         
         return {
             "found": True,
@@ -162,6 +271,7 @@ class EmailTool(MCPTool):
     async def _read_email(
         self,
         service,
+        http,
         parameters: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Read specific email"""
@@ -170,11 +280,14 @@ class EmailTool(MCPTool):
         if not message_id:
             return {"error": "message_id required"}
         
-        msg = service.users().messages().get(
-            userId='me',
-            id=message_id,
-            format='full'
-        ).execute()
+        msg = await asyncio.to_thread(
+            service.users().messages().get(
+                userId='me',
+                id=message_id,
+                format='full'
+            ).execute,
+            http=http
+        )
         
         return {
             "found": True,
@@ -184,31 +297,35 @@ class EmailTool(MCPTool):
     async def _list_emails(
         self,
         service,
+        http,
         parameters: Dict[str, Any]
     ) -> Dict[str, Any]:
         """List recent emails"""
         max_results = parameters.get("max_results", 10)
         
-        results = service.users().messages().list(
-            userId='me',
-            maxResults=max_results
-        ).execute()
+        results = await asyncio.to_thread(
+            service.users().messages().list(
+                userId='me',
+                maxResults=max_results
+            ).execute,
+            http=http
+        )
         
         messages = results.get('messages', [])
         
-        # Get headers only for listing
+        # Get headers only for listing, in one batched round-trip
         email_list = []
-        for msg in messages:
-            msg_detail = service.users().messages().get(
-                userId='me',
-                id=msg['id'],
-                format='metadata',
-                metadataHeaders=['From', 'Subject', 'Date']
-            ).execute()
-            
+        for msg_detail in await asyncio.to_thread(
+            self._batch_get_messages,
+            service,
+            http,
+            [msg['id'] for msg in messages],
+            format='metadata',
+            metadataHeaders=['From', 'Subject', 'Date']
+        ):
             headers = {h['name']: h['value'] for h in msg_detail['payload']['headers']}
             email_list.append({
-                "id": msg['id'],
+                "id": msg_detail['id'],
                 "from": headers.get('From', ''),
                 "subject": headers.get('Subject', ''),
                 "date": headers.get('Date', '')
@@ -219,25 +336,64 @@ class EmailTool(MCPTool):
             "emails": email_list
         }
     
+    def _batch_get_messages(
+        self,
+        service,
+        http,
+        message_ids: List[str],
+        **get_kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch several messages with batched HTTP requests
+        Returns the messages in the order of message_ids; messages that
+        fail individually are skipped
+        """
+        fetched: Dict[str, Dict[str, Any]] = {}
+        
+        def collect(request_id, response, exception):
+            if exception is None:
+                fetched[request_id] = response
+        
+        for start in range(0, len(message_ids), GMAIL_BATCH_LIMIT):
+            batch = service.new_batch_http_request(callback=collect)
+            for offset, message_id in enumerate(message_ids[start:start + GMAIL_BATCH_LIMIT]):
+                batch.add(
+                    service.users().messages().get(userId='me', id=message_id, **get_kwargs),
+                    request_id=str(start + offset)
+                )
+            batch.execute(http=http)
+        
+        return [fetched[str(i)] for i in range(len(message_ids)) if str(i) in fetched]
+    
+    @staticmethod
+    def _find_body_data(payload: Dict[str, Any]) -> Optional[str]:
+        """
+        Encoded data of the first text/plain part, searching nested
+        multipart parts in document order; falls back to the first text/html
+        part when there is no plain text
+        """
+        html_data = None
+        stack = [payload]
+        while stack:
+            part = stack.pop()
+            data = part.get('body', {}).get('data')
+            if data:
+                mime_type = part.get('mimeType', '')
+                if mime_type == 'text/plain' or part is payload:
+                    return data
+                if mime_type == 'text/html' and html_data is None:
+                    html_data = data
+            stack.extend(reversed(part.get('parts', ())))
+        return html_data
+    
     def _parse_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """Parse Gmail message to structured format"""
-        headers = {h['name']: h['value'] for h in message['payload']['headers']}
-        
-        # Extract body
-        body = ""
-        if 'parts' in message['payload']:
-            for part in message['payload']['parts']:
-                if part['mimeType'] == 'text/plain':
-                    if 'data' in part['body']:
-                        body = base64.urlsafe_b64decode(
-                            part['body']['data']
-                        ).decode('utf-8')
-                        break
-        else:
-            if 'data' in message['payload']['body']:
-                body = base64.urlsafe_b64decode(
-                    message['payload']['body']['data']
-                ).decode('utf-8')
+        payload = message['payload']
+        headers = {h['name']: h['value'] for h in payload['headers']}
+        
+        # Extract body, decoding only the chosen part
+        data = self._find_body_data(payload)
+        body = base64.urlsafe_b64decode(data).decode('utf-8') if data else ""
         
         return {
             "id": message['id'],
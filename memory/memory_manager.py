@@ -3,7 +3,15 @@ Memory Management System
 Handles conversation memory, vector storage, and context retention
 """
 from typing import List, Dict, Any, Optional
+from collections import defaultdict
 from datetime import datetime
+from heapq import nlargest
+import atexit
+import logging
+import queue
+import re
+import threading
+import time
 import chromadb
 from chromadb.config import Settings
 from langchain.memory import ConversationBufferMemory, ConversationSummaryMemory
@@ -14,6 +22,39 @@ from langchain_community.chat_models import ChatOllama
 import json
 
 from config import settings
+from utils.lazy import LazyProxy
+from utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Vector store writes go through a background writer thread, which writes a
+# batch once it is this large or has waited this long for more documents
+WRITE_BATCH_SIZE = 32
+WRITE_BATCH_MAX_AGE = 0.25  # seconds
+WRITE_QUEUE_SIZE = 1024
+# Longest the process waits at exit for queued documents to be written
+WRITE_SHUTDOWN_TIMEOUT = 10  # seconds
+
+def iso_ts(timestamp_ns: Optional[int] = None) -> str:
+    """ISO-8601 local time for an epoch-nanosecond timestamp (default: now)"""
+    if timestamp_ns is None:
+        timestamp_ns = time.time_ns()
+    return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+
+
+# Per-user collections of the layout before the shared "interactions"
+# collection; copied into it (and deleted) on startup
+LEGACY_COLLECTION_RE = re.compile(r"user_(.+)_memory")
+MIGRATION_BATCH_SIZE = 500
+
+# Queue markers asking the writer to write what it has without waiting,
+# and additionally to exit afterwards
+_FLUSH = object()
+_STOP = object()
+
+# Repeated memory searches are served from cache for this long
+SEARCH_CACHE_TTL = 30  # seconds
+SEARCH_CACHE_SIZE = 1024
 
 
 class MemoryType:
@@ -55,8 +96,74 @@ class MemoryManager:
         # Memory stores per user
         self._conversation_memories: Dict[str, ConversationBufferMemory] = {}
         self._summary_memories: Dict[str, ConversationSummaryMemory] = {}
-        self._vector_stores: Dict[str, Chroma] = {}
+        # One collection for all users; documents carry user_id metadata
+        self._shared_store = Chroma(
+            collection_name="interactions",
+            embedding_function=self.embeddings,
+            client=self.chroma_client,
+            persist_directory=settings.chroma_persist_dir
+        )
+        self._migrate_user_collections()
         self._fact_stores: Dict[str, List[Dict[str, Any]]] = {}
+        
+        # (user_id, document) waiting to be embedded and written, and the
+        # number of queued-but-unwritten documents per user
+        self._write_queue: "queue.Queue" = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._unwritten: Dict[str, int] = defaultdict(int)
+        self._unwritten_cond = threading.Condition()
+        
+        # (user_id, write generation, query, k, filter_type) -> results;
+        # a user's generation is bumped on every write so stale hits never match
+        self._search_cache = TTLCache(
+            max_entries=SEARCH_CACHE_SIZE,
+            ttl_seconds=SEARCH_CACHE_TTL
+        )
+        self._write_generation: Dict[str, int] = defaultdict(int)
+        
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="memory-writer", daemon=True
+        )
+        self._writer.start()
+        # The writer is a daemon thread; write what is still queued at exit
+        atexit.register(self.close)
+    
+    def _migrate_user_collections(self):
+        """
+        Copy documents from per-user "user_<id>_memory" collections into the
+        shared collection, with their stored embeddings and user_id metadata,
+        then delete each copied collection so the migration runs only once
+        """
+        try:
+            names = [getattr(c, "name", c) for c in self.chroma_client.list_collections()]
+        except Exception:
+            logger.exception("Could not list memory collections for migration")
+            return
+        
+        shared = self._shared_store._collection
+        for name in names:
+            match = LEGACY_COLLECTION_RE.fullmatch(name)
+            if not match:
+                continue
+            try:
+                legacy = self.chroma_client.get_collection(name)
+                data = legacy.get(include=["documents", "metadatas", "embeddings"])
+                ids = data["ids"]
+                metadatas = [
+                    {"user_id": match.group(1), **(metadata or {})}
+                    for metadata in data["metadatas"]
+                ]
+                for start in range(0, len(ids), MIGRATION_BATCH_SIZE):
+                    end = start + MIGRATION_BATCH_SIZE
+                    shared.upsert(
+                        ids=ids[start:end],
+                        embeddings=data["embeddings"][start:end],
+                        documents=data["documents"][start:end],
+                        metadatas=metadatas[start:end]
+                    )
+                self.chroma_client.delete_collection(name)
+                logger.info("Migrated %d memory documents from %s", len(ids), name)
+            except Exception:
+                logger.exception("Could not migrate memory collection %s", name)
     
     def get_conversation_memory(self, user_id: str) -> ConversationBufferMemory:
         """Get or create conversation buffer memory for user"""
@@ -78,18 +185,6 @@ class MemoryManager:
             )
         return self._summary_memories[user_id]
     
-    def get_vector_store(self, user_id: str) -> Chroma:
-        """Get or create vector store for user"""
-        if user_id not in self._vector_stores:
-            collection_name = f"user_{user_id}_memory"
-            self._vector_stores[user_id] = Chroma(
-                collection_name=collection_name,
-                embedding_function=self.embeddings,
-                client=self.chroma_client,
-                persist_directory=settings.chroma_persist_dir
-            )
-        return self._vector_stores[user_id]
-    
     def add_interaction(
         self,
         user_id: str,
@@ -113,11 +208,10 @@ class MemoryManager:
         )
         
         # Add to vector store
-        vector_store = self.get_vector_store(user_id)
         doc_metadata = metadata or {}
         doc_metadata.update({
             "user_id": user_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns(),
             "type": "interaction"
         })
         
@@ -125,7 +219,7 @@ class MemoryManager:
             page_content=f"User: {user_message}\nAssistant: {assistant_message}",
             metadata=doc_metadata
         )
-        vector_store.add_documents([doc])
+        self._queue_document(user_id, doc)
     
     def add_fact(
         self,
@@ -139,17 +233,17 @@ class MemoryManager:
         if user_id not in self._fact_stores:
             self._fact_stores[user_id] = []
         
+        timestamp_ns = time.time_ns()
         fact_entry = {
             "fact": fact,
             "source": source,
             "confidence": confidence,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": timestamp_ns,
             "metadata": metadata or {}
         }
         self._fact_stores[user_id].append(fact_entry)
         
         # Also add to vector store for semantic search
-        vector_store = self.get_vector_store(user_id)
         doc = Document(
             page_content=fact,
             metadata={
@@ -157,10 +251,87 @@ class MemoryManager:
                 "type": "fact",
                 "source": source,
                 "confidence": confidence,
-                "timestamp": datetime.now().isoformat()
+                "timestamp_ns": timestamp_ns
             }
         )
-        vector_store.add_documents([doc])
+        self._queue_document(user_id, doc)
+    
+    def _queue_document(self, user_id: str, doc: Document):
+        """Hand a document to the writer thread (blocks only if the queue is full)"""
+        with self._unwritten_cond:
+            self._unwritten[user_id] += 1
+        if not self._writer.is_alive():
+            # Closed (interpreter shutting down): write synchronously
+            self._write_batch([(user_id, doc)])
+            return
+        self._write_queue.put((user_id, doc))
+    
+    def _writer_loop(self):
+        """
+        Drain the write queue in batches of up to WRITE_BATCH_SIZE documents,
+        waiting at most WRITE_BATCH_MAX_AGE for a batch to fill, and write
+        the whole batch with a single add_documents call
+        """
+        while True:
+            batch = [self._write_queue.get()]
+            deadline = time.monotonic() + WRITE_BATCH_MAX_AGE
+            while batch[-1] is not _FLUSH and batch[-1] is not _STOP \
+                    and len(batch) < WRITE_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._write_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            items = [item for item in batch if item is not _FLUSH and item is not _STOP]
+            if items:
+                self._write_batch(items)
+            if batch[-1] is _STOP:
+                return
+    
+    def _write_batch(self, items: List[tuple]):
+        """Write (user_id, document) pairs with one add_documents call"""
+        try:
+            self._shared_store.add_documents([doc for _, doc in items])
+        except Exception:
+            logger.exception("Memory write failed for %d documents", len(items))
+        finally:
+            written: Dict[str, int] = defaultdict(int)
+            for uid, _ in items:
+                written[uid] += 1
+            with self._unwritten_cond:
+                for uid, count in written.items():
+                    self._write_generation[uid] += 1
+                    self._unwritten[uid] -= count
+                self._unwritten_cond.notify_all()
+    
+    def flush(self, user_id: Optional[str] = None):
+        """
+        Wait until queued documents are written (all users if user_id is None)
+        """
+        with self._unwritten_cond:
+            if user_id is None:
+                done = lambda: not any(self._unwritten.values())
+            else:
+                done = lambda: not self._unwritten.get(user_id)
+            if done():
+                return
+        
+        # Cut the writer's batching wait short, then wait for the writes
+        self._write_queue.put(_FLUSH)
+        with self._unwritten_cond:
+            self._unwritten_cond.wait_for(done)
+    
+    def close(self):
+        """Write all queued documents and stop the writer thread"""
+        if not self._writer.is_alive():
+            return
+        self._write_queue.put(_STOP)
+        self._writer.join(WRITE_SHUTDOWN_TIMEOUT)
+        if self._writer.is_alive():
+            logger.warning("Memory writer did not finish within %ss", WRITE_SHUTDOWN_TIMEOUT)
     
     def search_memory(
         self,
@@ -170,14 +341,22 @@ class MemoryManager:
         filter_type: Optional[str] = None
     ) -> List[Document]:
         """Search vector memory"""
-        vector_store = self.get_vector_store(user_id)
+        self.flush(user_id)  # read your own writes
+        cache_key = (user_id, self._write_generation[user_id], query, k, filter_type)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
         
-        search_kwargs = {"k": k}
+        # The collection is shared by all users: always filter on user_id
+        search_kwargs = {"k": k, "filter": {"user_id": user_id}}
         if filter_type:
-            search_kwargs["filter"] = {"type": filter_type}
+            search_kwargs["filter"] = {
+                "$and": [{"user_id": user_id}, {"type": filter_type}]
+            }
         
-        results = vector_store.similarity_search(query, **search_kwargs)
-        return results
+        results = self._shared_store.similarity_search(query, **search_kwargs)
+        self._search_cache.put(cache_key, results)
+        return list(results)
     
     def get_conversation_context(self, user_id: str) -> str:
         """Get formatted conversation context"""
@@ -190,15 +369,11 @@ class MemoryManager:
         return summary_memory.load_memory_variables({}).get("conversation_summary", "")
     
     def get_facts(self, user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get recent facts for user"""
+        """Get recent facts for user, with an ISO "timestamp" added for display"""
         facts = self._fact_stores.get(user_id, [])
-        # Sort by confidence and recency
-        sorted_facts = sorted(
-            facts,
-            key=lambda x: (x["confidence"], x["timestamp"]),
-            reverse=True
-        )
-        return sorted_facts[:limit]
+        # Top facts by confidence and recency, without sorting them all
+        top = nlargest(limit, facts, key=lambda x: (x["confidence"], x["timestamp_ns"]))
+        return [{**fact, "timestamp": iso_ts(fact["timestamp_ns"])} for fact in top]
     
     def clear_memory(self, user_id: str):
         """Clear all memory for user"""
@@ -216,9 +391,9 @@ class MemoryManager:
             "conversation": self.get_conversation_context(user_id),
             "summary": self.get_summary_context(user_id),
             "facts": self.get_facts(user_id),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": iso_ts()
         }
 
 
-# Global memory manager instance
-memory_manager = MemoryManager()
+# Global memory manager instance (built on first use)
+memory_manager: MemoryManager = LazyProxy(MemoryManager)
@@ -2,7 +2,9 @@
 LangGraph Orchestrator - Multi-Agent Coordination
 Orchestrates agent execution using LangGraph state machine
 """
-from typing import Dict, Any, List, TypedDict, Annotated
+from typing import Callable, Dict, Any, List, Optional, Tuple, TypedDict, Annotated
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 try:
     from langgraph.graph import StateGraph, END
 except ImportError:
@@ -15,19 +17,25 @@ from agents import (
     PlannerAgent, OperationsAgent, PassengerAgent, 
     AlertAgent
 )
+from agents._json_utils import dumps_compact
 
 class AgentState(TypedDict):
     """State shared across all agents"""
     request: str
     context: Dict[str, Any]
+    context_json: str
     plan: Dict[str, Any]
     operations_result: Annotated[List[Dict], operator.add]
     passenger_result: Annotated[List[Dict], operator.add]
     alert_result: Annotated[List[Dict], operator.add]
+    task_results: Dict[str, Any]
     final_response: Dict[str, Any]
     iteration: int
     max_iterations: int
 
+# Upper bound on subtasks executed at the same time within one run
+MAX_PARALLEL_TASKS = 8
+
 class RailwayOrchestrator:
     """
     Orchestrates multiple agents using LangGraph
@@ -41,6 +49,9 @@ class RailwayOrchestrator:
         self.passenger = PassengerAgent()
         self.alert = AlertAgent()
         
+        # Runs independent subtasks concurrently; agent calls are blocking HTTPS I/O
+        self._executor = ThreadPoolExecutor(max_workers=MAX_PARALLEL_TASKS)
+        
         # Build the graph
         self.workflow = self._build_workflow()
         
@@ -93,16 +104,22 @@ class RailwayOrchestrator:
         """
         Planner agent node - creates execution plan
         """
-        if state.get("iteration", 0) == 0:
+        if state.get("iteration", 0) == 0 and state.get("plan"):
+            # Plan was produced up front (see arun_batch)
+            plan = state["plan"]
+        elif state.get("iteration", 0) == 0:
             # Initial planning
             plan = self.planner.analyze_request(
                 state["request"], 
-                state.get("context", {})
+                state.get("context", {}),
+                state.get("context_json")
             )
         else:
             # Refine plan based on results
             feedback = self._generate_feedback(state)
-            plan = self.planner.refine_plan(feedback)
+            plan = self.planner.refine_plan(
+                feedback, state["plan"], state.get("task_results", {})
+            )
         
         state["plan"] = plan
         state["iteration"] = state.get("iteration", 0) + 1
@@ -118,20 +135,32 @@ class RailwayOrchestrator:
             if task.get("agent", "").lower() == "operations"
         ]
         
+        # Analyze all delay tasks with a single batched LLM call
+        delay_tasks = [
+            task for task in operations_tasks
+            if "delay" in task.get("description", "").lower()
+        ]
+        delay_results = iter(self.operations.analyze_delays_batch([
+            (
+                task.get("inputs", {}).get("train_number", ""),
+                task.get("inputs", {}).get("delay_minutes", 0),
+                task.get("inputs", {}).get("current_location")
+            )
+            for task in delay_tasks
+        ]))
+        
         results = []
         for task in operations_tasks:
             if "delay" in task.get("description", "").lower():
                 # Handle delay analysis
-                train_number = task.get("inputs", {}).get("train_number", "")
-                delay_minutes = task.get("inputs", {}).get("delay_minutes", 0)
-                result = self.operations.analyze_delay(train_number, delay_minutes)
+                result = next(delay_results)
             else:
                 result = {"task": task["description"], "status": "completed"}
             
             results.append(result)
             
             # Update planner state
-            self.planner.update_state(task["task_id"], result)
+            self._record_result(state, task, result)
         
         state["operations_result"] = results
         return state
@@ -146,24 +175,35 @@ class RailwayOrchestrator:
             if task.get("agent", "").lower() == "passenger"
         ]
         
-        results = []
+        # Fetch RAG context for all passenger tasks in one batch
+        retrievals = []
         for task in passenger_tasks:
             task_desc = task.get("description", "").lower()
+            if "alternative" in task_desc:
+                context = task.get("inputs", {}).get("passenger_context", {})
+                retrievals.append((self.passenger.alternatives_query(context), 10))
+            elif "query" in task_desc or "question" in task_desc:
+                retrievals.append((task.get("inputs", {}).get("query", ""), 5))
+        if len(retrievals) > 1:
+            self.passenger.prefetch(retrievals)
+        
+        def handle(task: Dict[str, Any]) -> Dict[str, Any]:
+            task_desc = task.get("description", "").lower()
             
             if "alternative" in task_desc:
                 # Suggest alternatives
                 train = task.get("inputs", {}).get("train_number", "")
                 context = task.get("inputs", {}).get("passenger_context", {})
-                result = self.passenger.suggest_alternatives(train, context)
+                return self.passenger.suggest_alternatives(train, context)
             elif "query" in task_desc or "question" in task_desc:
                 # Answer query
                 query = task.get("inputs", {}).get("query", "")
-                result = self.passenger.answer_query(query)
-            else:
-                result = {"task": task["description"], "status": "completed"}
-            
-            results.append(result)
-            self.planner.update_state(task["task_id"], result)
+                return self.passenger.answer_query(query)
+            return {"task": task["description"], "status": "completed"}
+        
+        results = self._run_tasks(passenger_tasks, handle)
+        for task, result in zip(passenger_tasks, results):
+            self._record_result(state, task, result)
         
         state["passenger_result"] = results
         return state
@@ -179,19 +219,57 @@ class RailwayOrchestrator:
             if task.get("agent", "").lower() == "alert"
         ]
         
-        results = []
-        for task in alert_tasks:
+        def handle(task: Dict[str, Any]) -> Dict[str, Any]:
             alert_type = task.get("inputs", {}).get("alert_type", "general")
             target = task.get("inputs", {}).get("target_audience", "passengers")
             context = task.get("inputs", {}).get("context", {})
-            
-            result = self.alert.create_alert(alert_type, target, context)
-            results.append(result)
-            self.planner.update_state(task["task_id"], result)
+            return self.alert.create_alert(alert_type, target, context)
+        
+        results = self._run_tasks(alert_tasks, handle)
+        for task, result in zip(alert_tasks, results):
+            self._record_result(state, task, result)
         
         state["alert_result"] = results
         return state
     
+    def _run_tasks(self, tasks: List[Dict[str, Any]],
+                   handler: Callable[[Dict[str, Any]], Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Execute subtasks level by level following their dependencies
+        Tasks whose dependencies are satisfied run concurrently; dependencies
+        on tasks outside this list (other agents) count as satisfied.
+        Returns results in task order.
+        """
+        index_by_id = {task.get("task_id"): i for i, task in enumerate(tasks)}
+        results: Dict[int, Dict[str, Any]] = {}
+        pending = list(range(len(tasks)))
+        
+        while pending:
+            level = [
+                i for i in pending
+                if all(
+                    dep not in index_by_id or index_by_id[dep] in results
+                    for dep in tasks[i].get("dependencies", [])
+                )
+            ]
+            if not level:
+                # Circular dependencies: run whatever is left together
+                level = pending
+            
+            if len(level) == 1:
+                outputs = [handler(tasks[level[0]])]
+            else:
+                outputs = list(self._executor.map(handler, [tasks[i] for i in level]))
+            results.update(zip(level, outputs))
+            pending = [i for i in pending if i not in results]
+        
+        return [results[i] for i in range(len(tasks))]
+    
+    def _record_result(self, state: AgentState, task: Dict[str, Any], result: Dict[str, Any]):
+        """Record a task result for this run and in the planner's state"""
+        state.setdefault("task_results", {})[task["task_id"]] = result
+        self.planner.update_state(task["task_id"], result)
+    
     def _synthesize_node(self, state: AgentState) -> AgentState:
         """
         Synthesize results from all agents
@@ -264,7 +342,7 @@ class RailwayOrchestrator:
         return "; ".join(feedback_parts)
     
     def run(self, request: str, context: Dict[str, Any] = None, 
-            max_iterations: int = 3) -> Dict[str, Any]:
+            max_iterations: int = 3, plan: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Run the orchestrator with a request
         
@@ -272,17 +350,21 @@ class RailwayOrchestrator:
             request: User/system request
             context: Additional context
             max_iterations: Maximum refinement iterations
+            plan: Initial plan, if already produced; skips the first planner call
             
         Returns:
             Final response with all agent results
         """
+        context = context or {}
         initial_state: AgentState = {
             "request": request,
-            "context": context or {},
-            "plan": {},
+            "context": context,
+            "context_json": dumps_compact(context),
+            "plan": plan or {},
             "operations_result": [],
             "passenger_result": [],
             "alert_result": [],
+            "task_results": {},
             "final_response": {},
             "iteration": 0,
             "max_iterations": max_iterations
@@ -292,3 +374,30 @@ class RailwayOrchestrator:
         final_state = self.workflow.invoke(initial_state)
         
         return final_state.get("final_response", {})
+    
+    async def arun(self, request: str, context: Dict[str, Any] = None,
+                   max_iterations: int = 3) -> Dict[str, Any]:
+        """
+        Async variant of run for use inside an event loop
+        The blocking workflow runs in a worker thread, so concurrent
+        requests overlap their LLM round-trips instead of queueing.
+        """
+        return await asyncio.to_thread(self.run, request, context, max_iterations)
+    
+    async def arun_batch(self, items: List[Tuple[str, Dict[str, Any]]],
+                         max_iterations: int = 3) -> List[Dict[str, Any]]:
+        """
+        Run several independent requests, planning them with one LLM call
+        
+        Args:
+            items: (request, context) pairs
+            max_iterations: Maximum refinement iterations per request
+            
+        Returns:
+            Final responses in the same order as items
+        """
+        plans = await asyncio.to_thread(self.planner.analyze_requests_batch, items)
+        return await asyncio.gather(*(
+            asyncio.to_thread(self.run, request, context, max_iterations, plan)
+            for (request, context), plan in zip(items, plans)
+        ))
@@ -0,0 +1,105 @@
+"""
+Embedding Cache - On-disk store of document embeddings
+Embeddings are deterministic for a given (model, text), so unchanged
+documents are never re-encoded across restarts
+"""
+import hashlib
+import os
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# Saved matrices are memory-mapped on load, except on Windows: it refuses to
+# replace a mapped file, and another RAGSystem in the process may hold one
+NPY_MMAP_MODE = None if os.name == "nt" else "r"
+
+
+def text_digest(text: str) -> bytes:
+    """16-byte content hash used as the cache key"""
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+class EmbeddingCache:
+    """
+    Embedding rows for one model, keyed by text digest
+
+    Stored as two .npy files: the digests as (N, 16) uint8 rows and a float32
+    matrix that is memory-mapped on load (see NPY_MMAP_MODE), so rows are
+    only read from disk when looked up.
+    New rows are kept in memory until save().
+    """
+
+    def __init__(self, directory: str, model_name: str):
+        stem = os.path.join(directory, model_name.replace("/", "__"))
+        self.keys_path = f"{stem}.keys.npy"
+        self.vectors_path = f"{stem}.vectors.npy"
+
+        self._rows: Dict[bytes, int] = {}
+        self._vectors: Optional[np.ndarray] = None
+        self._new_keys: List[bytes] = []
+        self._new_vectors: List[np.ndarray] = []
+        self._load()
+
+    def _load(self):
+        if not (os.path.exists(self.keys_path) and os.path.exists(self.vectors_path)):
+            return
+        try:
+            keys = np.load(self.keys_path)
+            vectors = np.load(self.vectors_path, mmap_mode=NPY_MMAP_MODE)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Ignoring unreadable embedding cache: {e}")
+            return
+        if len(keys) != len(vectors):
+            print("⚠️  Ignoring inconsistent embedding cache")
+            return
+
+        self._vectors = vectors
+        self._rows = {key.tobytes(): row for row, key in enumerate(keys)}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get(self, digest: bytes) -> Optional[np.ndarray]:
+        """Cached embedding for a text digest, or None"""
+        row = self._rows.get(digest)
+        if row is None:
+            return None
+        if self._vectors is not None and row < len(self._vectors):
+            # A copy, so no caller keeps the memory map (and the file) open
+            return np.array(self._vectors[row])
+        return self._new_vectors[row - (0 if self._vectors is None else len(self._vectors))]
+
+    def put_many(self, digests: List[bytes], vectors: np.ndarray):
+        """Add embeddings for texts not yet cached"""
+        for digest, vector in zip(digests, vectors):
+            if digest in self._rows:
+                continue
+            self._rows[digest] = len(self)
+            self._new_keys.append(digest)
+            self._new_vectors.append(np.asarray(vector, dtype=np.float32))
+
+    def save(self):
+        """Persist new rows, replacing the files atomically"""
+        if not self._new_keys:
+            return
+
+        # Row order of _rows matches the on-disk rows followed by the new ones
+        keys = np.frombuffer(b"".join(self._rows), dtype=np.uint8).reshape(-1, 16)
+        new_vectors = np.stack(self._new_vectors)
+        if self._vectors is not None:
+            vectors = np.concatenate([np.asarray(self._vectors), new_vectors])
+        else:
+            vectors = new_vectors
+
+        # Windows refuses to replace a file that is still memory-mapped
+        self._vectors = None
+
+        for path, array in ((self.keys_path, keys), (self.vectors_path, vectors)):
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp_path, path)
+
+        self._new_keys.clear()
+        self._new_vectors.clear()
+        self._load()
@@ -0,0 +1,90 @@
+"""
+ONNX Embedder - sentence embeddings through ONNX Runtime
+Drop-in replacement for SentenceTransformer.encode on CPU, running an
+exported (optionally int8-quantized) copy of the embedding model
+
+Export the model once, then quantize it:
+    optimum-cli export onnx --model sentence-transformers/all-MiniLM-L6-v2 <model_dir>
+    python -c "from rag.onnx_embedder import quantize_model; quantize_model('<model_dir>')"
+"""
+import os
+from typing import List
+
+import numpy as np
+
+try:
+    import onnxruntime as ort
+    from transformers import AutoTokenizer
+    HAS_ONNXRUNTIME = True
+except ImportError:
+    HAS_ONNXRUNTIME = False
+
+
+def quantize_model(model_dir: str, source: str = "model.onnx",
+                   target: str = "model_int8.onnx"):
+    """Write an int8 dynamically quantized copy of an exported model"""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantize_dynamic(
+        os.path.join(model_dir, source),
+        os.path.join(model_dir, target),
+        weight_type=QuantType.QInt8
+    )
+
+
+class OnnxEmbedder:
+    """
+    Mean-pooled sentence embeddings from an ONNX transformer
+
+    Texts are sorted by length before batching so each batch pads to a
+    similar length, and results are returned in input order.
+    """
+
+    def __init__(self, model_dir: str, model_file: str, max_length: int = 256):
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            os.path.join(model_dir, model_file),
+            sess_options=options,
+            providers=["CPUExecutionProvider"]
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.max_length = max_length
+        self._input_names = {inp.name for inp in self.session.get_inputs()}
+        self._dimension = int(self.session.get_outputs()[0].shape[-1])
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self._dimension
+
+    def encode(self, texts: List[str], batch_size: int = 32,
+               normalize_embeddings: bool = False, **kwargs) -> np.ndarray:
+        """Embed texts as a (texts, dim) float32 array"""
+        if isinstance(texts, str):
+            texts = [texts]
+
+        embeddings = np.empty((len(texts), self._dimension), dtype=np.float32)
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+
+        for start in range(0, len(order), batch_size):
+            batch = order[start:start + batch_size]
+            encoded = self.tokenizer(
+                [texts[i] for i in batch],
+                padding=True,
+                truncation=True,
+                max_length=self.max_length,
+                return_tensors="np"
+            )
+            feeds = {
+                name: value.astype(np.int64)
+                for name, value in encoded.items() if name in self._input_names
+            }
+            token_embeddings = self.session.run(None, feeds)[0]
+
+            # Mean over the real (unpadded) tokens
+            mask = encoded["attention_mask"][..., None].astype(np.float32)
+            pooled = (token_embeddings * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+            embeddings[batch] = pooled
+
+        if normalize_embeddings:
+            embeddings /= np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12)
+        return embeddings
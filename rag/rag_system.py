@@ -9,12 +9,63 @@ except ImportError:
     HAS_SENTENCE_TRANSFORMERS = False
     print("⚠️  sentence-transformers not found. RAG will be disabled/mocked.")
 
-from typing import List, Dict, Any
-import json
+try:
+    import simsimd
+    HAS_SIMSIMD = True
+except ImportError:
+    HAS_SIMSIMD = False
+
+try:
+    import faiss
+    HAS_FAISS = True
+    HAS_FAISS_GPU = hasattr(faiss, "get_num_gpus") and faiss.get_num_gpus() > 0
+except ImportError:
+    HAS_FAISS = False
+    HAS_FAISS_GPU = False
+
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import groupby
 import os
+import re
 import numpy as np
+import orjson
 import pickle
-from config import VECTOR_STORE_PATH, EMBEDDING_MODEL, RAG_DATA_SOURCES
+import queue
+import threading
+from config import (
+    VECTOR_STORE_PATH, EMBEDDING_MODEL, EMBEDDING_BATCH_SIZE, RAG_DATA_SOURCES,
+    EMBEDDING_STORAGE_DTYPE, ONNX_EMBEDDING_CONFIG, QUERY_EMBEDDING_CACHE_SIZE,
+    ANN_INDEX_CONFIG, GPU_SEARCH_CONFIG, QUANTIZED_SCAN_CONFIG, ensure_directories
+)
+from utils.ttl_cache import TTLCache
+from .embedding_cache import NPY_MMAP_MODE, EmbeddingCache, text_digest
+from .onnx_embedder import HAS_ONNXRUNTIME, OnnxEmbedder
+
+# Texts per encode() call when indexing; the next page is encoded while
+# the previous one is stored
+ENCODE_PAGE_SIZE = 8 * EMBEDDING_BATCH_SIZE
+
+# Minimum cosine similarity for a document to be returned
+SIMILARITY_THRESHOLD = 0.3
+
+# Bytes of float32 rows per matmul tile in _similarities; sized for L2 so
+# every query in a batch is scored while a tile is still cache-resident
+SCAN_TILE_BYTES = 1 << 20
+
+# Queries that are nothing but a train or route ID, e.g. "Train No. 12627?"
+_ID_LOOKUP_RE = re.compile(
+    r"\s*(train|route)\s*(?:no\.?|number|id|#)?\s*:?\s*([A-Za-z]?\d+)\s*\??\s*$",
+    re.IGNORECASE
+)
+# ID kind -> (collection, metadata key) it is looked up in
+_ID_LOOKUP_FIELDS = {
+    "train": ("timetables", "train_number"),
+    "route": ("route_maps", "route_id")
+}
+
 
 class RAGSystem:
     """
@@ -23,14 +74,23 @@ class RAGSystem:
     """
     
     def __init__(self):
-        if HAS_SENTENCE_TRANSFORMERS:
+        onnx_model = os.path.join(
+            ONNX_EMBEDDING_CONFIG["model_dir"], ONNX_EMBEDDING_CONFIG["model_file"]
+        )
+        if HAS_ONNXRUNTIME and os.path.exists(onnx_model):
+            # Exported model present: skip PyTorch for inference
+            self.embedding_model = OnnxEmbedder(**ONNX_EMBEDDING_CONFIG)
+            self.embedding_model_name = f"{EMBEDDING_MODEL}-{ONNX_EMBEDDING_CONFIG['model_file']}"
+        elif HAS_SENTENCE_TRANSFORMERS:
             self.embedding_model = SentenceTransformer(EMBEDDING_MODEL)
+            self.embedding_model_name = EMBEDDING_MODEL
         else:
             self.embedding_model = None
+            self.embedding_model_name = None
 
         
         # Initialize in-memory storage
-        os.makedirs(VECTOR_STORE_PATH, exist_ok=True)
+        ensure_directories(VECTOR_STORE_PATH)
         
         # Storage dictionaries
         self.documents = {
@@ -39,63 +99,421 @@ class RAGSystem:
             "refund_rules": [],
             "route_maps": []
         }
+        # One preallocated (capacity, dim) matrix per collection, stored as
+        # EMBEDDING_STORAGE_DTYPE; only the first embedding_counts[name] rows are live
+        dim = (
+            self.embedding_model.get_sentence_embedding_dimension()
+            if self.embedding_model else 0
+        )
+        self.storage_dtype = np.dtype(EMBEDDING_STORAGE_DTYPE)
         self.embeddings = {
-            "timetables": [],
-            "policies": [],
-            "refund_rules": [],
-            "route_maps": []
+            name: np.empty((0, dim), dtype=self.storage_dtype) for name in self.documents
+        }
+        self.embedding_counts = {name: 0 for name in self.documents}
+        
+        # int8 copies of the rows with one float32 scale per row, scanned by
+        # SimSIMD's int8 kernels before an exact float32 rerank
+        self.quantized = {
+            name: np.empty((0, dim), dtype=np.int8) for name in self.documents
+        }
+        self.quantized_scales = {
+            name: np.empty(0, dtype=np.float32) for name in self.documents
+        }
+        
+        # Content hashes (16-byte digests) of the indexed documents, per collection
+        self.doc_ids = {name: set() for name in self.documents}
+        
+        # Metadata key -> value -> row numbers, per collection (search_by_metadata)
+        self._metadata_index: Dict[str, Dict[Any, Dict[Any, set]]] = {
+            name: {} for name in self.documents
         }
         
+        # Document embeddings persisted across restarts, keyed by text digest
+        self._embedding_cache = (
+            EmbeddingCache(VECTOR_STORE_PATH, self.embedding_model_name)
+            if self.embedding_model else None
+        )
+        
+        # Collection-name tuple -> stacked rows of those collections (see
+        # _fused_collections); dropped whenever a collection grows
+        self._fused: Dict[Tuple[str, ...], tuple] = {}
+        
+        # Collection -> FAISS index over its rows, for large collections
+        # (exact flat index on the GPU when there is one, HNSW otherwise)
+        self._faiss_indexes: Dict[str, Any] = {}
+        self._gpu_resources = None
+        
+        # Collections whose rows changed since they were loaded or saved
+        self._dirty: set = set()
+        
+        # Restore the last saved collections, if any; initialize_data then
+        # only indexes what changed since
+        self.load()
+        
+        # Runs FAISS searches and the exact scan side by side
+        self._search_pool = ThreadPoolExecutor(max_workers=4)
+        
+        # Query digest -> embedding, for queries repeated across requests
+        self._query_embeddings = TTLCache(
+            max_entries=QUERY_EMBEDDING_CACHE_SIZE,
+            ttl_seconds=float("inf")
+        )
+        
     def initialize_data(self):
         """
         Load and index initial data from RAG data sources
+        All sources are embedded together in a single encode call.
         """
+        loaded: Dict[str, List[Any]] = {}
+        
         # Load timetables
         if os.path.exists(RAG_DATA_SOURCES["timetables"]):
-            with open(RAG_DATA_SOURCES["timetables"], 'r') as f:
-                timetables = json.load(f)
-                self._index_documents(timetables, "timetables")
+            with open(RAG_DATA_SOURCES["timetables"], 'rb') as f:
+                loaded["timetables"] = self._json_records(orjson.loads(f.read()))
         
         # Load policies
         if os.path.exists(RAG_DATA_SOURCES["policies"]):
-            with open(RAG_DATA_SOURCES["policies"], 'r') as f:
-                policies = f.read().split('\n\n')
-                policy_docs = [{"content": p, "type": "policy"} for p in policies if p.strip()]
-                self._index_documents(policy_docs, "policies")
+            policies = self._read_blocks(RAG_DATA_SOURCES["policies"])
+            loaded["policies"] = [{"content": p, "type": "policy"} for p in policies if p.strip()]
         
         # Load refund rules
         if os.path.exists(RAG_DATA_SOURCES["refund_rules"]):
-            with open(RAG_DATA_SOURCES["refund_rules"], 'r') as f:
-                refund_rules = f.read().split('\n\n')
-                refund_docs = [{"content": r, "type": "refund"} for r in refund_rules if r.strip()]
-                self._index_documents(refund_docs, "refund_rules")
+            refund_rules = self._read_blocks(RAG_DATA_SOURCES["refund_rules"])
+            loaded["refund_rules"] = [{"content": r, "type": "refund"} for r in refund_rules if r.strip()]
         
         # Load route maps
         if os.path.exists(RAG_DATA_SOURCES["route_maps"]):
-            with open(RAG_DATA_SOURCES["route_maps"], 'r') as f:
-                route_maps = json.load(f)
-                self._index_documents(route_maps, "route_maps")
+            with open(RAG_DATA_SOURCES["route_maps"], 'rb') as f:
+                loaded["route_maps"] = self._json_records(orjson.loads(f.read()))
+        
+        # Entries edited or removed in their source file are dropped before
+        # the current ones are indexed (their embeddings come from the cache)
+        removed = sum(self._prune_collection(name, docs) for name, docs in loaded.items())
+        added = self._index_collections(loaded)
+        if (added or removed) and self.embedding_model:
+            self.save()
+        
+        # Build FAISS indexes (and GPU copies) now rather than on the first query
+        for name in self.documents:
+            self._faiss_index(name)
         
         print(f"✅ Indexed data: {sum(len(docs) for docs in self.documents.values())} documents")
     
+    @staticmethod
+    def _json_records(data: Any) -> List[Any]:
+        """
+        One document per record: {"trains": [...]} style files are unwrapped
+        to their list entries instead of being indexed by their key names
+        """
+        if isinstance(data, list):
+            return data
+        if isinstance(data, dict) and data and all(isinstance(v, list) for v in data.values()):
+            return [record for records in data.values() for record in records]
+        return [data]
+    
+    @staticmethod
+    def _read_blocks(path: str) -> Iterator[str]:
+        """Blank-line separated blocks of a text file, read line by line"""
+        with open(path, 'r') as f:
+            for is_blank, lines in groupby(f, key=lambda line: line == "\n"):
+                if not is_blank:
+                    yield "".join(lines).rstrip("\n")
+    
     def _index_documents(self, documents: List[Dict[str, Any]], collection_name: str):
         """Index documents into a collection"""
-        if not documents:
+        self._index_collections({collection_name: documents})
+    
+    def _index_collections(self, batches: Dict[str, List[Any]]) -> int:
+        """
+        Index documents into several collections with one forward pass
+        Documents already in their collection (same content hash) are skipped,
+        so re-running initialize_data does not re-embed or duplicate them.
+        
+        Returns:
+            Number of newly indexed documents
+        """
+        pending = []
+        for collection_name, documents in batches.items():
+            indexed = self.doc_ids[collection_name]
+            new_documents = []
+            for doc in documents:
+                doc_id = self._doc_id(doc)
+                if doc_id not in indexed:
+                    indexed.add(doc_id)
+                    new_documents.append(doc)
+            if new_documents:
+                pending.append((collection_name, new_documents))
+        
+        if not pending:
+            return 0
+        
+        if self.embedding_model:
+            texts = [
+                doc.get("content", str(doc)) if isinstance(doc, dict) else str(doc)
+                for _, documents in pending
+                for doc in documents
+            ]
+            embeddings = self._embed_documents(texts)
+            start = 0
+            for collection_name, documents in pending:
+                end = start + len(documents)
+                self._append_embeddings(collection_name, embeddings[start:end])
+                start = end
+        
+        # Store
+        for collection_name, documents in pending:
+            stored = self.documents[collection_name]
+            self._index_metadata(collection_name, documents, len(stored))
+            stored.extend(documents)
+        
+        return sum(len(documents) for _, documents in pending)
+    
+    def _prune_collection(self, collection_name: str, documents: List[Any]) -> int:
+        """
+        Drop stored documents that are not in `documents` (the collection's
+        current source), keeping the remaining rows in order
+        
+        Returns:
+            Number of removed documents
+        """
+        current = {self._doc_id(doc) for doc in documents}
+        stored = self.documents[collection_name]
+        keep = [row for row, doc in enumerate(stored) if self._doc_id(doc) in current]
+        if len(keep) == len(stored):
+            return 0
+        
+        self.documents[collection_name] = [stored[row] for row in keep]
+        self.doc_ids[collection_name] &= current
+        self._metadata_index[collection_name] = {}
+        self._index_metadata(collection_name, self.documents[collection_name], 0)
+        
+        if self.embedding_counts[collection_name] == len(stored):
+            rows = np.asarray(self._collection_matrix(collection_name), dtype=np.float32)[keep]
+            dim = rows.shape[1]
+            self.embeddings[collection_name] = np.empty((0, dim), dtype=self.storage_dtype)
+            self.quantized[collection_name] = np.empty((0, dim), dtype=np.int8)
+            self.quantized_scales[collection_name] = np.empty(0, dtype=np.float32)
+            self.embedding_counts[collection_name] = 0
+            if len(rows):
+                self._append_embeddings(collection_name, rows)
+        
+        # FAISS indexes only support appends; rebuilt on the next search
+        self._faiss_indexes.pop(collection_name, None)
+        self._fused.clear()
+        self._dirty.add(collection_name)
+        return len(stored) - len(keep)
+    
+    def _state_paths(self, collection_name: str) -> Tuple[str, str]:
+        """(embedding matrix .npy, documents pickle) saved for a collection"""
+        state_dir = os.path.join(VECTOR_STORE_PATH, self.embedding_model_name.replace("/", "__"))
+        return (
+            os.path.join(state_dir, f"{collection_name}.npy"),
+            os.path.join(state_dir, f"docs_{collection_name}.pkl")
+        )
+    
+    def save(self):
+        """
+        Persist every collection changed since it was loaded or last saved:
+        its live embedding rows as .npy and its documents (with their
+        content hashes) as a pickle sidecar
+        """
+        if not self.embedding_model:
             return
         
-        for doc in documents:
-            if isinstance(doc, dict):
-                text = doc.get("content", str(doc))
-            else:
-                text = str(doc)
+        for name in list(self._dirty):
+            count = self.embedding_counts[name]
+            if count != len(self.documents[name]):
+                continue
             
-            # Generate embedding
-            if self.embedding_model:
-                embedding = self.embedding_model.encode([text])[0]
-                self.embeddings[collection_name].append(embedding)
+            # Windows refuses to replace a file that is still memory-mapped
+            if isinstance(self.embeddings[name], np.memmap):
+                self.embeddings[name] = np.array(self.embeddings[name])
+                self._fused.clear()
             
-            # Store
-            self.documents[collection_name].append(doc)
+            matrix_path, docs_path = self._state_paths(name)
+            ensure_directories(os.path.dirname(matrix_path))
+            state = {"documents": self.documents[name], "doc_ids": self.doc_ids[name]}
+            
+            # Write-then-rename so a crash never leaves a torn file behind
+            with open(f"{matrix_path}.tmp", 'wb') as f:
+                np.save(f, self.embeddings[name][:count])
+            with open(f"{docs_path}.tmp", 'wb') as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f"{matrix_path}.tmp", matrix_path)
+            os.replace(f"{docs_path}.tmp", docs_path)
+            self._dirty.discard(name)
+    
+    def load(self) -> bool:
+        """
+        Restore collections written by save()
+        Embeddings are memory-mapped (see NPY_MMAP_MODE), so nothing is read
+        until queried; they are copied into a writable matrix only if the
+        collection grows.
+        
+        Returns:
+            True if at least one collection was restored
+        """
+        if not self.embedding_model:
+            return False
+        
+        restored = False
+        for name in self.documents:
+            matrix_path, docs_path = self._state_paths(name)
+            if not (os.path.exists(matrix_path) and os.path.exists(docs_path)):
+                continue
+            try:
+                with open(docs_path, 'rb') as f:
+                    state = pickle.load(f)
+                matrix = np.load(matrix_path, mmap_mode=NPY_MMAP_MODE)
+            except (OSError, ValueError, EOFError, pickle.UnpicklingError) as e:
+                print(f"⚠️  Ignoring saved RAG collection {name}: {e}")
+                continue
+            
+            documents = state["documents"]
+            if len(matrix) != len(documents) or matrix.shape[1] != self.embeddings[name].shape[1]:
+                print(f"⚠️  Ignoring saved RAG collection {name}: shape mismatch")
+                continue
+            if matrix.dtype != self.storage_dtype:
+                matrix = matrix.astype(self.storage_dtype)
+            
+            self.documents[name] = documents
+            self.doc_ids[name] = state["doc_ids"]
+            self._metadata_index[name] = {}
+            self._index_metadata(name, documents, 0)
+            self.embeddings[name] = matrix
+            self.embedding_counts[name] = len(matrix)
+            self._dirty.discard(name)
+            if HAS_SIMSIMD:
+                self.quantized[name], self.quantized_scales[name] = self._quantize_rows(
+                    np.asarray(matrix, dtype=np.float32)
+                )
+            restored = True
+        
+        self._fused.clear()
+        return restored
+    
+    def _index_metadata(self, collection_name: str, documents: List[Any], first_row: int):
+        """Add documents to the collection's key -> value -> rows inverted index"""
+        index = self._metadata_index[collection_name]
+        for row, doc in enumerate(documents, first_row):
+            if not isinstance(doc, dict):
+                continue
+            for key, value in doc.items():
+                try:
+                    index.setdefault(key, {}).setdefault(value, set()).add(row)
+                except TypeError:
+                    # Unhashable values (lists, dicts) never equal a hashable filter value
+                    pass
+    
+    def _embed_documents(self, texts: List[str]) -> np.ndarray:
+        """
+        Unit-length document embeddings as a (texts, dim) float32 array
+        Texts already in the on-disk cache are not re-encoded; the distinct
+        remaining texts are length-sorted (so each mini-batch pads little),
+        encoded page by page and written back to the cache.
+        """
+        digests = [text_digest(text) for text in texts]
+        rows = [self._embedding_cache.get(digest) for digest in digests]
+        
+        # Uncached digest -> positions holding that text; each distinct text
+        # is encoded once and scattered to all of its positions
+        missing: Dict[bytes, List[int]] = {}
+        for i, (digest, row) in enumerate(zip(digests, rows)):
+            if row is None:
+                missing.setdefault(digest, []).append(i)
+        
+        if missing:
+            unique = sorted(missing, key=lambda digest: len(texts[missing[digest][0]]))
+            start = 0
+            for encoded in self._encode_pages([texts[missing[digest][0]] for digest in unique]):
+                page = unique[start:start + len(encoded)]
+                for digest, embedding in zip(page, encoded):
+                    for i in missing[digest]:
+                        rows[i] = embedding
+                self._embedding_cache.put_many(page, encoded)
+                start += len(encoded)
+            self._embedding_cache.save()
+        
+        return np.stack(rows).astype(np.float32, copy=False)
+    
+    def _encode_pages(self, texts: List[str]) -> Iterator[np.ndarray]:
+        """
+        Yield float32 embeddings for texts, ENCODE_PAGE_SIZE texts at a time
+        The next page is encoded on a background thread while the caller
+        stores the current one; at most two finished pages wait in memory.
+        """
+        def encode(page: List[str]) -> np.ndarray:
+            return np.asarray(self.embedding_model.encode(
+                page,
+                batch_size=EMBEDDING_BATCH_SIZE,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+                normalize_embeddings=True
+            ), dtype=np.float32)
+        
+        if len(texts) <= ENCODE_PAGE_SIZE:
+            yield encode(texts)
+            return
+        
+        pages: "queue.Queue" = queue.Queue(maxsize=2)
+        
+        def produce():
+            try:
+                for start in range(0, len(texts), ENCODE_PAGE_SIZE):
+                    pages.put(encode(texts[start:start + ENCODE_PAGE_SIZE]))
+                pages.put(None)
+            except Exception as e:
+                pages.put(e)
+        
+        threading.Thread(target=produce, name="rag-encode", daemon=True).start()
+        while True:
+            page = pages.get()
+            if page is None:
+                return
+            if isinstance(page, Exception):
+                raise page
+            yield page
+    
+    def _append_embeddings(self, collection_name: str, rows: np.ndarray):
+        """Append rows to a collection matrix, doubling its capacity when full"""
+        matrix = self.embeddings[collection_name]
+        size = self.embedding_counts[collection_name]
+        needed = size + len(rows)
+        
+        if needed > len(matrix) or matrix.shape[1] != rows.shape[1]:
+            capacity = max(16, 2 * len(matrix), needed)
+            grown = np.empty((capacity, rows.shape[1]), dtype=self.storage_dtype)
+            grown[:size] = matrix[:size]
+            self.embeddings[collection_name] = matrix = grown
+        
+        matrix[size:needed] = rows
+        self.embedding_counts[collection_name] = needed
+        self._fused.clear()
+        self._dirty.add(collection_name)
+        
+        if HAS_SIMSIMD:
+            quantized = self.quantized[collection_name]
+            scales = self.quantized_scales[collection_name]
+            if len(quantized) != len(matrix) or quantized.shape[1] != matrix.shape[1]:
+                grown = np.empty(matrix.shape, dtype=np.int8)
+                grown_scales = np.empty(len(matrix), dtype=np.float32)
+                grown[:size] = quantized[:size]
+                grown_scales[:size] = scales[:size]
+                self.quantized[collection_name] = quantized = grown
+                self.quantized_scales[collection_name] = scales = grown_scales
+            quantized[size:needed], scales[size:needed] = self._quantize_rows(rows)
+    
+    def _collection_matrix(self, collection_name: str) -> np.ndarray:
+        """Live embedding rows of a collection (a view, no copy)"""
+        return self.embeddings[collection_name][:self.embedding_counts[collection_name]]
+    
+    @staticmethod
+    def _doc_id(doc: Any) -> bytes:
+        """Stable content hash of a document"""
+        payload = orjson.dumps(
+            doc, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+        return hashlib.blake2b(payload, digest_size=16).digest()
     
     def retrieve(self, query: str, top_k: int = 5, 
                 collection_name: str = None) -> List[Dict[str, Any]]:
@@ -107,80 +525,378 @@ class RAGSystem:
             top_k: Number of results to return
             collection_name: Specific collection to search (None = search all)
         """
+        return self.retrieve_batch([query], top_k, collection_name)[0]
+    
+    def retrieve_batch(self, queries: List[str], top_k: int = 5,
+                       collection_name: str = None) -> List[List[Dict[str, Any]]]:
+        """
+        Retrieve for several queries with one embedding pass and one
+        similarity product over all searched collections
+        
+        Returns:
+            One result list per query, in query order
+        """
+        if not queries:
+            return []
+        
         if not self.embedding_model:
             # Mock retrieval
             print("⚠️  RAG Retrieval in Mock Mode")
             return [
-                {
-                    "content": "Mock Result: Train 12627 leaves at 10:00 AM.",
-                    "metadata": {"type": "timetable"},
-                    "similarity": 0.99,
-                    "source": "mock"
-                }
+                [
+                    {
+                        "content": "Mock Result: Train 12627 leaves at 10:00 AM.",
+                        "metadata": {"type": "timetable"},
+                        "similarity": 0.99,
+                        "source": "mock"
+                    }
+                ]
+                for _ in queries
             ]
-
-        # Generate query embedding
-        query_embedding = self.embedding_model.encode([query])[0]
+        
+        # Pure ID lookups ("train 12627") are answered from metadata alone,
+        # with no forward pass or scan
+        all_results = [self._lookup_by_id(query, collection_name, top_k) for query in queries]
+        semantic = [q for q, results in enumerate(all_results) if results is None]
+        if semantic:
+            found = self._retrieve_semantic([queries[q] for q in semantic], top_k, collection_name)
+            for q, results in zip(semantic, found):
+                all_results[q] = results
+        return all_results
+    
+    def _lookup_by_id(self, query: str, collection_name: Optional[str],
+                      top_k: int) -> Optional[List[Dict[str, Any]]]:
+        """Exact metadata matches for a bare train/route ID query, else None"""
+        match = _ID_LOOKUP_RE.match(query)
+        if match is None:
+            return None
+        
+        target, key = _ID_LOOKUP_FIELDS[match.group(1).lower()]
+        if collection_name and collection_name != target:
+            return None
+        
+        results = self.search_by_metadata(target, {key: match.group(2).upper()})
+        if not results:
+            return None
+        for result in results:
+            result["similarity"] = 1.0
+        return results[:top_k]
+    
+    def _retrieve_semantic(self, queries: List[str], top_k: int,
+                           collection_name: Optional[str]) -> List[List[Dict[str, Any]]]:
+        """Embedding search for retrieve_batch"""
+        query_embeddings = self._embed_queries(queries)
         
         # Determine which collections to search
         if collection_name:
             collections = [collection_name]
         else:
             collections = ["timetables", "policies", "refund_rules", "route_maps"]
+        collections = [name for name in collections if self.embedding_counts[name]]
+        if not collections:
+            return [[] for _ in queries]
         
-        all_results = []
+        # Large collections are searched through their FAISS index; the rest
+        # are scanned exactly as one matrix
+        jobs = []
+        scanned = []
+        for name in collections:
+            index = self._faiss_index(name)
+            if index is None:
+                scanned.append(name)
+            else:
+                jobs.append(partial(self._search_index, name, index, query_embeddings, top_k))
+        if scanned:
+            fused = self._fused_collections(tuple(scanned))
+            jobs.append(partial(self._scan_exact, scanned, fused, query_embeddings, top_k))
         
-        for coll_name in collections:
-            if not self.embeddings[coll_name]:
-                continue
-            
-            # Calculate cosine similarities
-            embeddings_array = np.array(self.embeddings[coll_name])
-            similarities = np.dot(embeddings_array, query_embedding) / (
-                np.linalg.norm(embeddings_array, axis=1) * np.linalg.norm(query_embedding)
-            )
-            
-            # Get top-k indices
-            top_indices = np.argsort(similarities)[::-1][:top_k]
+        # Independent searches overlap on the pool (BLAS and FAISS release the GIL)
+        if len(jobs) == 1:
+            outputs = [jobs[0]()]
+        else:
+            outputs = list(self._search_pool.map(lambda job: job(), jobs))
+        candidates = [
+            [candidate for output in outputs for candidate in output[q]]
+            for q in range(len(queries))
+        ]
+        
+        all_results = []
+        for query_candidates in candidates:
+            # Global top-k across collections, best first
+            query_candidates.sort(key=lambda candidate: candidate[0], reverse=True)
             
             # Format results
-            for idx in top_indices:
-                if similarities[idx] > 0.3:  # Similarity threshold
-                    doc = self.documents[coll_name][idx]
-                    all_results.append({
+            results = []
+            for score, coll_name, row in query_candidates[:top_k]:
+                if score > SIMILARITY_THRESHOLD:
+                    doc = self.documents[coll_name][row]
+                    results.append({
                         "content": doc.get("content", str(doc)) if isinstance(doc, dict) else str(doc),
                         "metadata": doc if isinstance(doc, dict) else {},
-                        "similarity": float(similarities[idx]),
+                        "similarity": score,
                         "source": coll_name
                     })
+            all_results.append(results)
         
-        # Sort by similarity (higher is better)
-        all_results.sort(key=lambda x: x.get("similarity", 0), reverse=True)
+        return all_results
+    
+    @staticmethod
+    def _search_index(collection_name: str, index, queries: np.ndarray,
+                    top_k: int) -> List[List[tuple]]:
+        """Per-query (score, collection, row) candidates from a FAISS index"""
+        scores, rows = index.search(queries, top_k)
+        return [
+            [
+                (float(score), collection_name, int(row))
+                for score, row in zip(scores[q], rows[q]) if row >= 0
+            ]
+            for q in range(len(queries))
+        ]
+    
+    def _scan_exact(self, collections: List[str], fused: tuple, queries: np.ndarray,
+                    top_k: int) -> List[List[tuple]]:
+        """Per-query (score, collection, row) candidates from an exact scan"""
+        embeddings_array, quantized, quantized_scales, row_collection, row_offset = fused
+        
+        shortlist_size = QUANTIZED_SCAN_CONFIG["rerank_factor"] * top_k
+        if (HAS_SIMSIMD
+                and len(embeddings_array) >= QUANTIZED_SCAN_CONFIG["min_documents"]
+                and len(embeddings_array) > shortlist_size):
+            # Shortlist on int8 scores, then rescore the shortlist exactly
+            approximate = self._quantized_similarities(quantized, quantized_scales, queries)
+            ranked = []
+            for q in range(len(queries)):
+                shortlist = np.argpartition(approximate[:, q], -shortlist_size)[-shortlist_size:]
+                rows = embeddings_array[shortlist].astype(np.float32, copy=False)
+                exact = rows @ queries[q]
+                order = self._top_k_indices(exact, top_k)
+                ranked.append((shortlist[order], exact[order]))
+        else:
+            # Cosine similarities: (documents, queries); all vectors are unit length
+            similarities = self._similarities(embeddings_array, queries)
+            ranked = []
+            for q in range(len(queries)):
+                column = similarities[:, q]
+                # Only rows over the threshold can be returned, so select among those
+                above = np.flatnonzero(column > SIMILARITY_THRESHOLD)
+                top_indices = above[self._top_k_indices(column[above], top_k)]
+                ranked.append((top_indices, column[top_indices]))
         
-        return all_results[:top_k]
+        return [
+            [
+                (float(score), collections[row_collection[idx]], int(row_offset[idx]))
+                for idx, score in zip(top_indices, scores)
+            ]
+            for top_indices, scores in ranked
+        ]
     
-    def add_document(self, document: Dict[str, Any], collection_name: str):
-        """Add a new document to a collection"""
-        text = document.get("content", str(document))
-        embedding = self.embedding_model.encode([text])[0]
+    def _faiss_index(self, collection_name: str):
+        """
+        FAISS index for a collection once it is large enough to beat the CPU
+        scan; rows added since the last search are appended to it first
+        With a CUDA device the index is an exact IndexFlatIP held in device
+        memory, otherwise an approximate HNSW index.
+        """
+        size = self.embedding_counts[collection_name]
+        if not HAS_FAISS:
+            return None
+        
+        index = self._faiss_indexes.get(collection_name)
+        if index is None and HAS_FAISS_GPU and size >= GPU_SEARCH_CONFIG["min_documents"]:
+            # Inner product on unit vectors is cosine similarity
+            if self._gpu_resources is None:
+                self._gpu_resources = faiss.StandardGpuResources()
+            index = faiss.index_cpu_to_gpu(
+                self._gpu_resources,
+                GPU_SEARCH_CONFIG["device"],
+                faiss.IndexFlatIP(self.embeddings[collection_name].shape[1])
+            )
+            self._faiss_indexes[collection_name] = index
+        elif index is None:
+            if size < ANN_INDEX_CONFIG["min_documents"]:
+                return None
+            index = faiss.IndexHNSWFlat(
+                self.embeddings[collection_name].shape[1],
+                ANN_INDEX_CONFIG["hnsw_m"],
+                faiss.METRIC_INNER_PRODUCT
+            )
+            index.hnsw.efConstruction = ANN_INDEX_CONFIG["ef_construction"]
+            index.hnsw.efSearch = ANN_INDEX_CONFIG["ef_search"]
+            self._faiss_indexes[collection_name] = index
+        
+        if index.ntotal < size:
+            rows = self.embeddings[collection_name][index.ntotal:size]
+            index.add(rows.astype(np.float32, copy=False))
+        return index
+    
+    @staticmethod
+    def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the k highest scores, best first, via an O(N) partition"""
+        k = min(k, len(scores))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        if k < len(scores):
+            part = np.argpartition(-scores, k - 1)[:k]
+        else:
+            part = np.arange(len(scores))
+        return part[np.argsort(-scores[part], kind="stable")]
+    
+    @staticmethod
+    def _quantize_rows(rows: np.ndarray):
+        """Symmetric int8 quantization with one scale per row: rows ~= int8 * scale"""
+        scales = np.abs(rows).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        return np.rint(rows / scales[:, None]).astype(np.int8), scales.astype(np.float32)
+    
+    def _fused_collections(self, collections: Tuple[str, ...]):
+        """
+        Live rows of several collections stacked into one matrix, as
+        (stored rows, int8 rows, int8 scales, row -> collection position,
+        row -> offset in its collection). Built once and reused until a
+        collection gains rows; a single collection is served as views.
+        """
+        fused = self._fused.get(collections)
+        if fused is not None:
+            return fused
+        
+        counts = [self.embedding_counts[name] for name in collections]
         
-        self.documents[collection_name].append(document)
-        self.embeddings[collection_name].append(embedding)
+        def stack(arrays):
+            blocks = [array[:count] for array, count in zip(arrays, counts)]
+            return blocks[0] if len(blocks) == 1 else np.concatenate(blocks)
+        
+        matrix = stack([self.embeddings[name] for name in collections])
+        if HAS_SIMSIMD:
+            quantized = stack([self.quantized[name] for name in collections])
+            scales = stack([self.quantized_scales[name] for name in collections])
+        else:
+            quantized = scales = None
+        row_collection = np.repeat(np.arange(len(collections)), counts)
+        row_offset = np.arange(len(matrix)) - np.repeat(np.cumsum(counts) - counts, counts)
+        
+        fused = (matrix, quantized, scales, row_collection, row_offset)
+        self._fused[collections] = fused
+        return fused
+    
+    def _quantized_similarities(self, matrix: np.ndarray, row_scales: np.ndarray,
+                                queries: np.ndarray) -> np.ndarray:
+        """Approximate (documents, queries) dot products from the int8 rows"""
+        query_rows, query_scales = self._quantize_rows(queries)
+        products = np.asarray(simsimd.cdist(matrix, query_rows, metric="dot"), dtype=np.float32)
+        return products * row_scales[:, None] * query_scales[None, :]
+    
+    @staticmethod
+    def _similarities(matrix: np.ndarray, queries: np.ndarray) -> np.ndarray:
+        """
+        Dot products of unit-length rows: (documents, queries)
+        Uses SimSIMD's dispatched SIMD kernels when installed, BLAS otherwise.
+        The BLAS path walks the matrix in L2-sized row tiles against all
+        queries at once; float16 tiles are upcast into one reused buffer.
+        """
+        if HAS_SIMSIMD:
+            return np.asarray(simsimd.cdist(
+                np.ascontiguousarray(matrix), queries.astype(matrix.dtype, copy=False),
+                metric="dot"
+            ), dtype=np.float32)
+        tile_rows = max(256, SCAN_TILE_BYTES // (4 * max(matrix.shape[1], 1)))
+        if len(matrix) <= tile_rows and matrix.dtype == np.float32:
+            return matrix @ queries.T
+        
+        similarities = np.empty((len(matrix), len(queries)), dtype=np.float32)
+        if matrix.dtype != np.float32:
+            tile = np.empty((min(tile_rows, len(matrix)), matrix.shape[1]), dtype=np.float32)
+        for start in range(0, len(matrix), tile_rows):
+            rows = matrix[start:start + tile_rows]
+            if rows.dtype != np.float32:
+                upcast = tile[:len(rows)]
+                upcast[:] = rows
+                rows = upcast
+            np.matmul(rows, queries.T, out=similarities[start:start + len(rows)])
+        return similarities
+    
+    def _embed_queries(self, queries: List[str]) -> np.ndarray:
+        """
+        Unit-length query embeddings as a (queries, dim) array
+        Cached queries skip the model; the rest are encoded in one forward pass.
+        The cache is keyed on the query digest, so long queries cost 16 bytes.
+        """
+        digests = [text_digest(query) for query in queries]
+        cached = [self._query_embeddings.get(digest) for digest in digests]
+        missing = list(dict.fromkeys(
+            (digest, query)
+            for digest, query, embedding in zip(digests, queries, cached)
+            if embedding is None
+        ))
+        
+        if missing:
+            vectors = np.asarray(self.embedding_model.encode(
+                [query for _, query in missing], normalize_embeddings=True
+            ), dtype=np.float32)
+            # Shared between callers, so never handed out writable
+            vectors.setflags(write=False)
+            encoded = {}
+            for (digest, _), embedding in zip(missing, vectors):
+                self._query_embeddings.put(digest, embedding)
+                encoded[digest] = embedding
+            cached = [
+                encoded[digest] if embedding is None else embedding
+                for digest, embedding in zip(digests, cached)
+            ]
+        
+        return np.stack(cached).astype(np.float32, copy=False)
+    
+    def add_document(self, document: Dict[str, Any], collection_name: str):
+        """Add a new document to a collection (no-op if already indexed)"""
+        self._index_documents([document], collection_name)
     
     def search_by_metadata(self, collection_name: str, 
                           metadata_filter: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Search documents by metadata filter"""
-        results = []
+        """
+        Search documents by metadata filter
+        Answered by intersecting inverted-index postings, smallest first;
+        filters the index cannot answer (None or unhashable values, or an
+        empty filter) fall back to a scan.
+        """
+        documents = self.documents[collection_name]
+        rows = self._metadata_rows(collection_name, metadata_filter)
         
-        for doc in self.documents[collection_name]:
-            if isinstance(doc, dict):
+        if rows is None:
+            rows = [
+                row for row, doc in enumerate(documents)
+                if isinstance(doc, dict)
                 # Check if all filter keys match
-                if all(doc.get(k) == v for k, v in metadata_filter.items()):
-                    results.append({
-                        "content": doc.get("content", str(doc)),
-                        "metadata": doc,
-                        "source": collection_name
-                    })
+                and all(doc.get(k) == v for k, v in metadata_filter.items())
+            ]
+        
+        return [
+            {
+                "content": documents[row].get("content", str(documents[row])),
+                "metadata": documents[row],
+                "source": collection_name
+            }
+            for row in rows
+        ]
+    
+    def _metadata_rows(self, collection_name: str,
+                       metadata_filter: Dict[str, Any]) -> Optional[List[int]]:
+        """Matching rows in document order, or None when a scan is needed"""
+        if not metadata_filter:
+            return None
+        
+        index = self._metadata_index[collection_name]
+        postings = []
+        for key, value in metadata_filter.items():
+            if value is None:
+                # Also matches documents that lack the key
+                return None
+            try:
+                rows = index.get(key, {}).get(value)
+            except TypeError:
+                return None
+            if not rows:
+                return []
+            postings.append(rows)
         
-        return results
+        postings.sort(key=len)
+        return sorted(postings[0].intersection(*postings[1:]))
 
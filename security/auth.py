@@ -2,14 +2,53 @@
 Security Module
 Handles authentication, authorization, and encryption
 """
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
-from jose import JWTError, jwt
+from typing import Dict, Any, FrozenSet, Optional, Union
+from datetime import datetime, timedelta, timezone
+import json
+import jwt
 from passlib.context import CryptContext
 from cryptography.fernet import Fernet
 import os
+import sqlite3
+import threading
+import time
 
 from config import settings
+from utils.ttl_cache import TTLCache
+
+try:
+    import rfernet
+    HAS_RFERNET = True
+except ImportError:
+    HAS_RFERNET = False
+
+# Use the Rust Fernet binding when installed; tokens are interchangeable
+# with cryptography's Fernet, so this can be flipped at any time
+USE_RFERNET = True
+
+# bcrypt work factor for user passwords (2^rounds key expansions per hash);
+# raise it as hardware gets faster, existing hashes keep verifying
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+
+# SQLite database holding encrypted OAuth tokens
+OAUTH_TOKEN_DB = "./credentials/oauth_tokens.db"
+# Per-token JSON files written before the database, next to it; imported
+# into the database (and deleted) the first time the token is read
+LEGACY_TOKEN_FILE = "oauth_{user_id}_{service}.json"
+
+# Decrypted tokens are reused for up to this long, and never within
+# OAUTH_TOKEN_EXPIRY_MARGIN seconds of the token's own expiry
+OAUTH_TOKEN_CACHE_SIZE = 10_000
+OAUTH_TOKEN_CACHE_TTL = 300
+OAUTH_TOKEN_EXPIRY_MARGIN = 60
+
+# Default scopes per channel, built once; frozensets give O(1) scope checks
+_DEFAULT_PERMISSIONS: Dict[str, FrozenSet[str]] = {
+    "whatsapp": frozenset({"email.read", "db.read"}),
+    "web": frozenset({"email.read", "db.read", "file.read"}),
+    "api": frozenset({"db.read", "api.call"})
+}
+_FALLBACK_PERMISSIONS: FrozenSet[str] = frozenset({"db.read"})
 
 
 class SecurityManager:
@@ -21,7 +60,9 @@ class SecurityManager:
     """
     
     def __init__(self):
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.pwd_context = CryptContext(
+            schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS
+        )
         self.secret_key = settings.secret_key
         self.algorithm = "HS256"
         self.access_token_expire_minutes = 60
@@ -31,7 +72,10 @@ class SecurityManager:
         if len(encryption_key) != 44:  # Fernet key must be 32 url-safe base64-encoded bytes
             # Generate proper key if not provided
             encryption_key = Fernet.generate_key()
-        self.cipher = Fernet(encryption_key)
+        if HAS_RFERNET and USE_RFERNET:
+            self.cipher = rfernet.Fernet(encryption_key.decode())
+        else:
+            self.cipher = Fernet(encryption_key)
     
     def create_access_token(
         self,
@@ -56,7 +100,7 @@ class SecurityManager:
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
             return payload
-        except JWTError:
+        except jwt.PyJWTError:
             return None
     
     def hash_password(self, password: str) -> str:
@@ -70,11 +114,15 @@ class SecurityManager:
     def encrypt_token(self, token: str) -> str:
         """Encrypt sensitive token (OAuth, API keys)"""
         encrypted = self.cipher.encrypt(token.encode())
-        return encrypted.decode()
+        # rfernet returns str, cryptography returns bytes
+        return encrypted if isinstance(encrypted, str) else encrypted.decode()
     
-    def decrypt_token(self, encrypted_token: str) -> str:
+    def decrypt_token(self, encrypted_token: Union[str, bytes]) -> str:
         """Decrypt token"""
-        decrypted = self.cipher.decrypt(encrypted_token.encode())
+        # rfernet only accepts str; Fernet tokens are ASCII either way
+        if isinstance(encrypted_token, bytes):
+            encrypted_token = encrypted_token.decode()
+        decrypted = self.cipher.decrypt(encrypted_token)
         return decrypted.decode()
     
     def generate_encryption_key(self) -> str:
@@ -85,11 +133,40 @@ class SecurityManager:
 class OAuth2Manager:
     """
     Manages OAuth2 flows for external services
+    
+    Encrypted tokens live in one SQLite database in WAL mode, keyed by
+    (user_id, service), so a lookup is a single primary-key read.
     """
     
-    def __init__(self):
+    def __init__(self, db_path: str = OAUTH_TOKEN_DB):
         self.security = SecurityManager()
-        self._token_store: Dict[str, Dict[str, Any]] = {}
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        # (user_id, service) -> (decrypted tokens, expires_at)
+        self._decrypted = TTLCache(
+            max_entries=OAUTH_TOKEN_CACHE_SIZE, ttl_seconds=OAUTH_TOKEN_CACHE_TTL
+        )
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Open the token database on first use"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS tokens (
+                    user_id TEXT NOT NULL,
+                    service TEXT NOT NULL,
+                    access BLOB NOT NULL,
+                    refresh BLOB,
+                    expires_at INTEGER,
+                    created_at INTEGER NOT NULL,
+                    PRIMARY KEY (user_id, service)
+                )"""
+            )
+            self._conn = conn
+        return self._conn
     
     def store_oauth_token(
         self,
@@ -106,86 +183,122 @@ class OAuth2Manager:
         if refresh_token:
             encrypted_refresh = self.security.encrypt_token(refresh_token)
         
-        expires_at = None
-        if expires_in:
-            expires_at = datetime.utcnow() + timedelta(seconds=expires_in)
+        now = int(time.time())
+        expires_at = now + expires_in if expires_in else None
         
-        key = f"{user_id}_{service}"
-        self._token_store[key] = {
+        self._persist_token(user_id, service, {
             "access_token": encrypted_access,
             "refresh_token": encrypted_refresh,
             "expires_at": expires_at,
-            "created_at": datetime.utcnow()
-        }
-        
-        # In production, store in database
-        self._persist_token(user_id, service, self._token_store[key])
+            "created_at": now
+        })
+        self._decrypted.pop((user_id, service))
     
     def get_oauth_token(self, user_id: str, service: str) -> Optional[Dict[str, str]]:
         """Retrieve OAuth tokens"""
-        key = f"{user_id}_{service}"
+        key = (user_id, service)
+        cached = self._decrypted.get(key)
+        if cached is not None:
+            tokens, expires_at = cached
+            if expires_at is None or time.time() < expires_at - OAUTH_TOKEN_EXPIRY_MARGIN:
+                return dict(tokens)
+            self._decrypted.pop(key)
         
-        if key not in self._token_store:
-            # Try to load from database
-            self._token_store[key] = self._load_token(user_id, service)
-        
-        if key not in self._token_store:
+        token_data = self._load_token(user_id, service)
+        if token_data is None:
             return None
         
-        token_data = self._token_store[key]
-        
         # Check if expired
-        if token_data.get("expires_at"):
-            if datetime.utcnow() > token_data["expires_at"]:
-                # Token expired - should refresh
-                return None
+        if token_data["expires_at"] is not None and time.time() > token_data["expires_at"]:
+            # Token expired - should refresh
+            return None
         
         # Decrypt tokens
         access_token = self.security.decrypt_token(token_data["access_token"])
         refresh_token = None
         
-        if token_data.get("refresh_token"):
+        if token_data["refresh_token"]:
             refresh_token = self.security.decrypt_token(token_data["refresh_token"])
         
-        return {
+        tokens = {
             "access_token": access_token,
             "refresh_token": refresh_token
         }
+        self._decrypted.put(key, (tokens, token_data["expires_at"]))
+        return dict(tokens)
     
     def _persist_token(self, user_id: str, service: str, token_data: Dict[str, Any]):
-        """Persist token to storage (database, file, etc.)"""
-        # Save to file for now
-        token_file = f"./credentials/oauth_{user_id}_{service}.json"
-        
-        import json
-        with open(token_file, 'w') as f:
-            # Serialize datetime
-            serialized = token_data.copy()
-            if serialized.get("expires_at"):
-                serialized["expires_at"] = serialized["expires_at"].isoformat()
-            if serialized.get("created_at"):
-                serialized["created_at"] = serialized["created_at"].isoformat()
-            
-            json.dump(serialized, f)
+        """Insert or replace the token row for (user_id, service)"""
+        refresh = token_data["refresh_token"]
+        with self._db_lock:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO tokens "
+                "(user_id, service, access, refresh, expires_at, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    user_id,
+                    service,
+                    token_data["access_token"].encode(),
+                    refresh.encode() if refresh else None,
+                    token_data["expires_at"],
+                    token_data["created_at"]
+                )
+            )
     
     def _load_token(self, user_id: str, service: str) -> Optional[Dict[str, Any]]:
         """Load token from storage"""
-        token_file = f"./credentials/oauth_{user_id}_{service}.json"
+        with self._db_lock:
+            row = self._connection().execute(
+                "SELECT access, refresh, expires_at, created_at FROM tokens "
+                "WHERE user_id = ? AND service = ?",
+                (user_id, service)
+            ).fetchone()
+        
+        if row is None:
+            return self._import_legacy_token(user_id, service)
         
+        access, refresh, expires_at, created_at = row
+        return {
+            "access_token": bytes(access),
+            "refresh_token": bytes(refresh) if refresh else None,
+            "expires_at": expires_at,
+            "created_at": created_at
+        }
+    
+    def _import_legacy_token(self, user_id: str, service: str) -> Optional[Dict[str, Any]]:
+        """Move a token from its pre-database JSON file into the database"""
+        token_file = os.path.join(
+            os.path.dirname(self.db_path),
+            LEGACY_TOKEN_FILE.format(user_id=user_id, service=service)
+        )
         if not os.path.exists(token_file):
             return None
         
-        import json
         with open(token_file, 'r') as f:
-            token_data = json.load(f)
-            
-            # Deserialize datetime
-            if token_data.get("expires_at"):
-                token_data["expires_at"] = datetime.fromisoformat(token_data["expires_at"])
-            if token_data.get("created_at"):
-                token_data["created_at"] = datetime.fromisoformat(token_data["created_at"])
-            
-            return token_data
+            legacy = json.load(f)
+        
+        def epoch(value: Optional[str]) -> Optional[int]:
+            # Written from naive datetime.utcnow() values
+            if not value:
+                return None
+            return int(datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp())
+        
+        token_data = {
+            "access_token": legacy["access_token"],
+            "refresh_token": legacy.get("refresh_token"),
+            "expires_at": epoch(legacy.get("expires_at")),
+            "created_at": epoch(legacy.get("created_at")) or int(time.time())
+        }
+        self._persist_token(user_id, service, token_data)
+        os.remove(token_file)
+        
+        return {
+            **token_data,
+            "access_token": token_data["access_token"].encode(),
+            "refresh_token": (
+                token_data["refresh_token"].encode() if token_data["refresh_token"] else None
+            )
+        }
 
 
 class PermissionManager:
@@ -194,20 +307,14 @@ class PermissionManager:
     """
     
     @staticmethod
-    def validate_scope(user_permissions: list, required_scope: str) -> bool:
+    def validate_scope(user_permissions: FrozenSet[str], required_scope: str) -> bool:
         """Check if user has required scope"""
         return required_scope in user_permissions
     
     @staticmethod
-    def get_default_permissions(channel: str) -> list:
+    def get_default_permissions(channel: str) -> FrozenSet[str]:
         """Get default permissions for channel"""
-        default_permissions = {
-            "whatsapp": ["email.read", "db.read"],
-            "web": ["email.read", "db.read", "file.read"],
-            "api": ["db.read", "api.call"]
-        }
-        
-        return default_permissions.get(channel, ["db.read"])
+        return _DEFAULT_PERMISSIONS.get(channel, _FALLBACK_PERMISSIONS)
 
 
 # Global instances
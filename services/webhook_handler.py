@@ -5,7 +5,8 @@ Receives and processes incoming WhatsApp messages
 from flask import Flask, request, jsonify
 from typing import Dict, Any
 import asyncio
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 import uuid
 
 from context.context_protocol import context_protocol, ChannelType, UserContext
@@ -16,6 +17,22 @@ from config import settings
 
 app = Flask(__name__)
 
+# (YYYYMMDD, epoch seconds of the next local midnight)
+_day_stamp_cache = ("", 0.0)
+
+
+def _day_stamp() -> str:
+    """Local YYYYMMDD stamp, reformatted only when the day rolls over"""
+    global _day_stamp_cache
+    stamp, valid_until = _day_stamp_cache
+    now = time.time()
+    if now >= valid_until:
+        today = datetime.fromtimestamp(now)
+        stamp = today.strftime('%Y%m%d')
+        next_midnight = datetime.combine(today.date() + timedelta(days=1), datetime.min.time())
+        _day_stamp_cache = (stamp, next_midnight.timestamp())
+    return stamp
+
 
 class MessageIngestionService:
     """
@@ -43,7 +60,7 @@ class MessageIngestionService:
     def create_user_context(message_data: Dict[str, Any]) -> UserContext:
         """Create or retrieve user context"""
         user_id = message_data["from"]
-        conversation_id = f"{user_id}_{datetime.now().strftime('%Y%m%d')}"
+        conversation_id = f"{user_id}_{_day_stamp()}"
         
         # Check if context exists
         existing_context = context_protocol.get_context(conversation_id)
@@ -2,12 +2,32 @@
 WhatsApp Service
 Handles WhatsApp message sending via Twilio
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+import asyncio
+from requests.adapters import HTTPAdapter
 from twilio.rest import Client
 from twilio.base.exceptions import TwilioRestException
+from twilio.http.http_client import TwilioHttpClient
 
 from config import settings
 
+# Keep-alive HTTPS connections to the Twilio API; also the number of
+# messages send_messages_bulk has in flight at once
+TWILIO_POOL_SIZE = 32
+TWILIO_TIMEOUT = 10
+
+# Simple template formatting
+# In production, use WhatsApp-approved templates
+MESSAGE_TEMPLATES = {
+    "bill_notification": "Your {bill_type} bill for {period} is {amount}. Due date: {due_date}",
+    "confirmation": "Your request has been processed. {details}",
+    "error": "We encountered an issue: {error_message}. Please try again."
+}
+
+# Bound format_map per template, built once instead of per message
+_TEMPLATE_FORMATTERS = {name: template.format_map for name, template in MESSAGE_TEMPLATES.items()}
+_DEFAULT_TEMPLATE_FORMATTER = "{message}".format_map
+
 
 class WhatsAppService:
     """
@@ -15,9 +35,15 @@ class WhatsAppService:
     """
     
     def __init__(self):
+        # One pooled session for every request, so sends reuse warm TLS
+        # connections instead of handshaking per message
+        http_client = TwilioHttpClient(pool_connections=True, timeout=TWILIO_TIMEOUT)
+        http_client.session.mount("https://", HTTPAdapter(pool_maxsize=TWILIO_POOL_SIZE))
+        
         self.client = Client(
             settings.twilio_account_sid,
-            settings.twilio_auth_token
+            settings.twilio_auth_token,
+            http_client=http_client
         )
         self.from_number = settings.twilio_whatsapp_number
     
@@ -74,6 +100,35 @@ class WhatsAppService:
                 "error": str(e)
             }
     
+    async def send_message_async(
+        self,
+        to_number: str,
+        message: str,
+        media_url: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """send_message without blocking the event loop"""
+        return await asyncio.to_thread(self.send_message, to_number, message, media_url)
+    
+    async def send_messages_bulk(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Send many WhatsApp messages concurrently over the pooled connections
+        
+        Args:
+            messages: Dicts with "to_number", "message" and optional "media_url"
+        
+        Returns:
+            One send_message result per message, in order
+        """
+        limit = asyncio.Semaphore(TWILIO_POOL_SIZE)
+        
+        async def send(item: Dict[str, Any]) -> Dict[str, Any]:
+            async with limit:
+                return await self.send_message_async(
+                    item["to_number"], item["message"], item.get("media_url")
+                )
+        
+        return await asyncio.gather(*(send(item) for item in messages))
+    
     def send_template_message(
         self,
         to_number: str,
@@ -108,16 +163,8 @@ class WhatsAppService:
         params: Dict[str, str]
     ) -> str:
         """Format template with parameters"""
-        # Simple template formatting
-        # In production, use WhatsApp-approved templates
-        templates = {
-            "bill_notification": "Your {bill_type} bill for {period} is {amount}. Due date: {due_date}",
-            "confirmation": "Your request has been processed. {details}",
-            "error": "We encountered an issue: {error_message}. Please try again."
-        }
-        
-        template = templates.get(template_name, "{message}")
-        return template.format(**params)
+        formatter = _TEMPLATE_FORMATTERS.get(template_name, _DEFAULT_TEMPLATE_FORMATTER)
+        return formatter(params)
     
     def get_message_status(self, message_sid: str) -> Dict[str, Any]:
         """Get status of sent message"""
@@ -1,10 +1,13 @@
 """
 Crowd Predictor - Predicts crowd levels and overcrowding
 """
-from typing import Dict, Any, List, Tuple
-from datetime import datetime
+from typing import Dict, Any, List, Sequence, Tuple
+from datetime import date, datetime
 import random
 
+import numpy as np
+
+
 class CrowdPredictor:
     """
     Predicts crowd levels based on bookings and historical data
@@ -22,7 +25,7 @@ class CrowdPredictor:
         base_capacity = 1000
         
         # Day of week factor
-        date_obj = datetime.strptime(travel_date, "%Y-%m-%d")
+        date_obj = date.fromisoformat(travel_date)
         day_of_week = date_obj.weekday()
         
         # Weekends typically have higher demand
@@ -51,6 +54,45 @@ class CrowdPredictor:
             }
         }
     
+    def predict_batch(self, train_numbers: Sequence[str],
+                      travel_dates: Sequence[str]) -> Dict[str, np.ndarray]:
+        """
+        Vectorized predict() over many (train, date) pairs
+        
+        Returns:
+            Column arrays (one entry per pair) with the same fields as
+            predict() and its "factors", rather than a list of dicts
+        """
+        base_capacity = 1000
+        dates = np.asarray(travel_dates, dtype="datetime64[D]")
+        
+        # 1970-01-05 was a Monday, matching datetime.weekday()
+        day_of_week = (dates - np.datetime64("1970-01-05", "D")).astype(np.int64) % 7
+        month = dates.astype("datetime64[M]").astype(np.int64) % 12 + 1
+        
+        # Weekends typically have higher demand
+        demand_factor = np.where(np.isin(day_of_week, (4, 5, 6)), 1.3, 1.0)
+        
+        # Holiday factor (simplified)
+        is_holiday_season = np.isin(month, (4, 5, 10, 12))
+        demand_factor = np.where(is_holiday_season, demand_factor * 1.2, demand_factor)
+        
+        predicted_passengers = (base_capacity * demand_factor).astype(np.int64)
+        occupancy_rate = np.minimum(predicted_passengers / base_capacity, 1.2)
+        
+        return {
+            "train_number": np.asarray(train_numbers),
+            "travel_date": np.asarray(travel_dates),
+            "predicted_passengers": predicted_passengers,
+            "capacity": np.full(len(dates), base_capacity),
+            "occupancy_rate": np.round(occupancy_rate, 2),
+            "status": self._get_status_batch(occupancy_rate),
+            "confidence": np.full(len(dates), 0.85),
+            "day_of_week": day_of_week,
+            "demand_factor": np.round(demand_factor, 2),
+            "is_holiday_season": is_holiday_season
+        }
+    
     def _get_status(self, occupancy_rate: float) -> str:
         """Determine status based on occupancy"""
         if occupancy_rate <= 0.7:
@@ -62,6 +104,15 @@ class CrowdPredictor:
         else:
             return "overcrowded"
     
+    @staticmethod
+    def _get_status_batch(occupancy_rate: np.ndarray) -> np.ndarray:
+        """_get_status for an array of occupancy rates"""
+        return np.select(
+            [occupancy_rate <= 0.7, occupancy_rate <= 0.9, occupancy_rate <= 1.0],
+            ["comfortable", "moderate", "near_capacity"],
+            default="overcrowded"
+        )
+    
     def get_historical_patterns(self, train_number: str) -> Dict[str, Any]:
         """
         Get historical crowd patterns for a train
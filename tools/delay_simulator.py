@@ -4,6 +4,22 @@ Delay Simulator - Simulates delay propagation
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 
+import numpy as np
+
+from utils.jit import njit
+
+
+@njit(cache=True, nogil=True)
+def _cascade_impact(delays, threshold):
+    """Total delay and the mask of trains delayed past the connection threshold"""
+    total = 0.0
+    missed = np.zeros(delays.size, np.bool_)
+    for i in range(delays.size):
+        total += delays[i]
+        missed[i] = delays[i] > threshold
+    return total, missed
+
+
 class DelaySimulator:
     """
     Simulates how delays propagate through the railway network
@@ -30,13 +46,13 @@ class DelaySimulator:
         
         # Simulate downstream impacts
         downstream_delays = []
-        remaining_delay = delay_minutes
         
         # Mock: Each subsequent station gets slightly less delay due to recovery time
         recovery_per_station = 3  # minutes recovered per station
         
-        for i in range(5):  # Simulate next 5 stations
-            remaining_delay = max(0, remaining_delay - recovery_per_station)
+        # Simulate next 5 stations: the i-th station has recovered i * 3 minutes
+        remaining = np.maximum(0, delay_minutes - recovery_per_station * np.arange(1, 6))
+        for i, remaining_delay in enumerate(remaining.tolist()):
             if remaining_delay > 0:
                 downstream_delays.append({
                     "station_index": i + 1,
@@ -98,27 +114,49 @@ class DelaySimulator:
         """
         Simulate cascading effects across multiple trains
         """
-        total_impact = 0
-        affected_connections = []
+        count = len(affected_trains)
+        return self.simulate_cascading_effects_soa(
+            np.array([train_data.get("train_number") for train_data in affected_trains], dtype=object),
+            np.fromiter((train_data.get("delay_minutes") or 0 for train_data in affected_trains),
+                        dtype=np.float64, count=count),
+            np.fromiter((train_data.get("passengers") or 0 for train_data in affected_trains),
+                        dtype=np.float64, count=count)
+        )
+    
+    def simulate_cascading_effects_soa(self, train_numbers: np.ndarray, delays: np.ndarray,
+                                       passengers: np.ndarray) -> Dict[str, Any]:
+        """
+        Simulate cascading effects from parallel per-train arrays
         
-        for train_data in affected_trains:
-            delay = train_data.get("delay_minutes", 0)
-            total_impact += delay
-            
-            # Check for missed connections
-            if delay > 20:
-                affected_connections.append({
-                    "train": train_data.get("train_number"),
-                    "impact": "missed_connections",
-                    "estimated_passengers_affected": train_data.get("passengers", 0) * 0.2
-                })
+        Args:
+            train_numbers: Train identifiers
+            delays: Delay in minutes for each train (may be fractional)
+            passengers: Passenger count for each train
+        """
+        total, missed = _cascade_impact(np.asarray(delays, dtype=np.float64), 20)
+        # Whole-minute totals stay ints, as when the delays were summed directly
+        total_impact = int(total) if float(total).is_integer() else float(total)
+        num_trains = len(train_numbers)
+        
+        # Trains delayed past 20 minutes miss their connections
+        affected_connections = [
+            {
+                "train": train,
+                "impact": "missed_connections",
+                "estimated_passengers_affected": affected
+            }
+            for train, affected in zip(
+                np.asarray(train_numbers)[missed].tolist(),
+                (np.asarray(passengers)[missed] * 0.2).tolist()
+            )
+        ]
         
         return {
-            "total_trains_affected": len(affected_trains),
+            "total_trains_affected": num_trains,
             "total_delay_minutes": total_impact,
-            "average_delay": total_impact / len(affected_trains) if affected_trains else 0,
+            "average_delay": total_impact / num_trains if num_trains else 0,
             "affected_connections": affected_connections,
-            "system_stress_level": self._calculate_system_stress(total_impact, len(affected_trains))
+            "system_stress_level": self._calculate_system_stress(total_impact, num_trains)
         }
     
     def _calculate_system_stress(self, total_delay: int, num_trains: int) -> str:
@@ -9,6 +9,7 @@ except ImportError:
     HAS_TWILIO = False
 
 import smtplib
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from config import (
@@ -16,6 +17,9 @@ from config import (
     SMTP_HOST, SMTP_PORT, SMTP_EMAIL, SMTP_PASSWORD
 )
 
+# Upper bound on concurrent outbound SMS requests
+MAX_CONCURRENT_SMS = 8
+
 class NotificationService:
     """
     Handles sending notifications through various channels:
@@ -27,9 +31,11 @@ class NotificationService:
     def __init__(self):
         # Initialize Twilio client if credentials are available
         self.twilio_client = None
+        self._sms_executor = None
         if HAS_TWILIO and TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN:
             try:
                 self.twilio_client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+                self._sms_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_SMS)
             except Exception as e:
                 print(f"Failed to initialize Twilio: {e}")
         elif not HAS_TWILIO:
@@ -58,18 +64,25 @@ class NotificationService:
                 "error": "Twilio not configured"
             }
         
+        # Each send is an independent HTTPS round-trip, so issue them concurrently
+        pending = []
         for recipient in recipients:
             phone = recipient.get("phone")
             if not phone:
                 failed += 1
                 continue
             
+            future = self._sms_executor.submit(
+                self.twilio_client.messages.create,
+                body=message,
+                from_=TWILIO_PHONE_NUMBER,
+                to=phone
+            )
+            pending.append((phone, future))
+        
+        for phone, future in pending:
             try:
-                message_obj = self.twilio_client.messages.create(
-                    body=message,
-                    from_=TWILIO_PHONE_NUMBER,
-                    to=phone
-                )
+                future.result()
                 sent += 1
             except Exception as e:
                 failed += 1
@@ -105,29 +118,41 @@ class NotificationService:
                 "error": "Email not configured"
             }
         
-        for recipient in recipients:
-            email = recipient.get("email")
-            if not email:
-                failed += 1
-                continue
-            
-            try:
-                msg = MIMEMultipart()
-                msg['From'] = SMTP_EMAIL
-                msg['To'] = email
-                msg['Subject'] = subject
-                
-                msg.attach(MIMEText(body, 'html'))
-                
-                with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
-                    server.starttls()
-                    server.login(SMTP_EMAIL, SMTP_PASSWORD)
+        emails = [recipient.get("email") for recipient in recipients]
+        failed += sum(1 for email in emails if not email)
+        emails = [email for email in emails if email]
+        
+        if not emails:
+            return {"sent": 0, "failed": failed, "errors": None}
+        
+        # One authenticated SMTP session for the whole batch instead of a
+        # TCP + TLS handshake and login per recipient
+        try:
+            server = smtplib.SMTP(SMTP_HOST, SMTP_PORT)
+            server.starttls()
+            server.login(SMTP_EMAIL, SMTP_PASSWORD)
+        except Exception as e:
+            return {
+                "sent": 0,
+                "failed": failed + len(emails),
+                "errors": [{"email": email, "error": str(e)} for email in emails]
+            }
+        
+        with server:
+            for email in emails:
+                try:
+                    msg = MIMEMultipart()
+                    msg['From'] = SMTP_EMAIL
+                    msg['To'] = email
+                    msg['Subject'] = subject
+                    
+                    msg.attach(MIMEText(body, 'html'))
                     server.send_message(msg)
-                
-                sent += 1
-            except Exception as e:
-                failed += 1
-                errors.append({"email": email, "error": str(e)})
+                    
+                    sent += 1
+                except Exception as e:
+                    failed += 1
+                    errors.append({"email": email, "error": str(e)})
         
         return {
             "sent": sent,
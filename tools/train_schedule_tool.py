@@ -5,6 +5,9 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import json
 
+# Column header of the compact route tables; "-" marks a missing time
+ROUTE_TABLE_HEADER = "station\tarr\tdep\tpf"
+
 class TrainScheduleTool:
     """
     Tool to access train schedule data
@@ -14,6 +17,33 @@ class TrainScheduleTool:
     def __init__(self):
         # Mock database - in production, use SQLAlchemy with real DB
         self.schedules = self._load_mock_schedules()
+        # Static per-train route tables, formatted once for prompt building
+        self.route_tables = {
+            train_number: self._format_route_table(schedule)
+            for train_number, schedule in self.schedules.items()
+        }
+    
+    @staticmethod
+    def _format_route_table(schedule: Dict[str, Any]) -> str:
+        """Render a schedule as a tab-separated route table"""
+        lines = [
+            f"{schedule['train_number']} {schedule['train_name']} "
+            f"({schedule['type']}, {schedule['frequency']})",
+            ROUTE_TABLE_HEADER
+        ]
+        for stop in schedule["route"]:
+            lines.append(
+                f"{stop['station']}\t{stop['arrival'] or '-'}\t"
+                f"{stop['departure'] or '-'}\t{stop['platform']}"
+            )
+        return "\n".join(lines)
+    
+    def get_route_table(self, train_number: str) -> Optional[str]:
+        """
+        Get the precomputed compact route table for a train
+        Much smaller than the JSON schedule when embedded in a prompt
+        """
+        return self.route_tables.get(train_number)
     
     def _load_mock_schedules(self) -> Dict[str, Any]:
         """Load mock schedule data"""
@@ -0,0 +1,34 @@
+"""
+AES support check - reports the crypto backend behind Fernet token encryption
+Called once from application startup rather than on import
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def check_aes_acceleration() -> bool:
+    """
+    Log the OpenSSL build behind Fernet and whether the CPU advertises
+    hardware AES; OpenSSL's EVP AES-CBC dispatches to it automatically
+    """
+    try:
+        from cryptography.hazmat.backends.openssl.backend import backend
+        logger.debug("Token encryption via %s", backend.openssl_version_text())
+    except Exception:
+        pass
+    
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith(("flags", "Features")):
+                    # "aes" is listed for x86 AES-NI and ARMv8 Crypto Extensions alike
+                    if "aes" in line.split(":", 1)[1].split():
+                        return True
+                    break
+    except OSError:
+        # Not Linux; nothing to check
+        return True
+    
+    logger.warning("CPU does not report AES instructions; token encryption uses software AES")
+    return False
@@ -0,0 +1,22 @@
+"""
+JIT helpers - optional Numba compilation for numeric kernels
+Falls back to plain Python when numba is not installed
+"""
+import os
+
+from config import NUMBA_CACHE_DIR
+
+# Must be set before numba is imported for cache=True to use it
+os.environ.setdefault("NUMBA_CACHE_DIR", NUMBA_CACHE_DIR)
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit, usable bare or with options"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
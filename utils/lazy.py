@@ -0,0 +1,45 @@
+"""
+Lazy Proxy - Deferred construction of module-level singletons
+"""
+import threading
+from typing import Any, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class LazyProxy(Generic[T]):
+    """
+    Stand-in for a module-level singleton that is built on first use
+
+    `from module import agent` keeps working, but the agent (and any SDK
+    clients it creates) is only constructed when an attribute is first
+    accessed.
+    """
+
+    __slots__ = ("_factory", "_instance", "_lock")
+
+    def __init__(self, factory: Callable[[], T]):
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _get_instance(self) -> T:
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                instance = self._instance
+                if instance is None:
+                    instance = self._factory()
+                    object.__setattr__(self, "_instance", instance)
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get_instance(), name)
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(self._get_instance(), name, value)
+
+    def __repr__(self) -> str:
+        if self._instance is None:
+            return f"<LazyProxy for {self._factory!r} (not built)>"
+        return repr(self._instance)
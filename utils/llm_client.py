@@ -1,11 +1,56 @@
 
 import os
+import threading
+import time
 import logging
-from typing import Dict, Any, Optional
+from datetime import timedelta
+from functools import lru_cache
+from typing import Dict, Any, Iterator, Optional
 
-from config import GEMINI_API_KEY, GROQ_API_KEY, LLM_PROVIDER
+from config import (
+    GEMINI_API_KEY, GROQ_API_KEY, LLM_PROVIDER, PROMPT_CACHE_TTL,
+    PROMPT_CACHE_MODEL_PREFIXES, PROMPT_CACHE_MIN_TOKENS
+)
 logger = logging.getLogger(__name__)
 
+# Refresh a server-side prompt cache this long before it expires
+PROMPT_CACHE_REFRESH_MARGIN = 300
+
+# (model_name, system_instruction) -> (CachedContent, GenerativeModel, expires_at) or None
+# Shared by all LLMClient instances so agents built per request reuse the same caches
+_prompt_caches: Dict[tuple, Any] = {}
+_prompt_caches_lock = threading.Lock()
+
+# Rough characters per token, to skip prefixes far below the cacheable size
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=None)
+def _get_groq_client():
+    """Process-wide Groq client, so its HTTP connection pool is reused"""
+    from groq import Groq
+    if not GROQ_API_KEY:
+        raise ValueError("Groq API Key not found")
+    return Groq(api_key=GROQ_API_KEY)
+
+
+@lru_cache(maxsize=None)
+def get_ollama_client(host: str):
+    """Process-wide Ollama async client per host, shared by the local-model agents"""
+    from ollama import AsyncClient
+    return AsyncClient(host=host)
+
+
+@lru_cache(maxsize=None)
+def _get_gemini_model(model_name: str):
+    """Process-wide Gemini model per model name; genai is configured once"""
+    import google.generativeai as genai
+    if not GEMINI_API_KEY:
+        raise ValueError("Gemini API Key not found")
+    genai.configure(api_key=GEMINI_API_KEY)
+    return genai.GenerativeModel(model_name)
+
+
 class LLMClient:
     """
     Unified client for interacting with different LLM providers (Gemini, Groq)
@@ -25,44 +70,100 @@ class LLMClient:
         """Initialize the appropriate client based on provider"""
         try:
             if self.provider == "groq":
-                from groq import Groq
-                if not GROQ_API_KEY:
-                    raise ValueError("Groq API Key not found")
-                self.client = Groq(api_key=GROQ_API_KEY)
+                self.client = _get_groq_client()
                 logger.info(f"Initialized Groq client with model {self.model_name}")
                 
             elif self.provider == "gemini":
-                import google.generativeai as genai
-                if not GEMINI_API_KEY:
-                    raise ValueError("Gemini API Key not found")
-                genai.configure(api_key=GEMINI_API_KEY)
-                self.client = genai.GenerativeModel(self.model_name)
+                self.client = _get_gemini_model(self.model_name)
                 logger.info(f"Initialized Gemini client with model {self.model_name}")
                 
         except Exception as e:
             logger.error(f"Failed to initialize LLM client: {e}")
             self.client = None
 
-    def generate_content(self, prompt: str) -> Any:
+    def _get_cached_model(self, system_instruction: str) -> Optional[Any]:
+        """
+        Get a Gemini model bound to a server-side cache of the static prompt prefix
+        Returns None when the prefix cannot be cached (unsupported model or
+        prefix below the provider's minimum cacheable size)
+        """
+        if not (self.model_name or "").startswith(PROMPT_CACHE_MODEL_PREFIXES):
+            return None
+        if len(system_instruction) < PROMPT_CACHE_MIN_TOKENS * CHARS_PER_TOKEN:
+            return None
+        
+        # Held across create/refresh so concurrent agents never create
+        # duplicate server-side caches for the same prefix
+        with _prompt_caches_lock:
+            return self._get_cached_model_locked(system_instruction)
+    
+    def _get_cached_model_locked(self, system_instruction: str) -> Optional[Any]:
+        """_get_cached_model body; caller holds _prompt_caches_lock"""
+        cache_key = (self.model_name, system_instruction)
+        if cache_key in _prompt_caches:
+            entry = _prompt_caches[cache_key]
+            if entry is None:
+                return None
+            
+            cached_content, model, expires_at = entry
+            if expires_at - time.monotonic() > PROMPT_CACHE_REFRESH_MARGIN:
+                return model
+            try:
+                cached_content.update(ttl=timedelta(seconds=PROMPT_CACHE_TTL))
+                _prompt_caches[cache_key] = (
+                    cached_content, model, time.monotonic() + PROMPT_CACHE_TTL
+                )
+                return model
+            except Exception as e:
+                logger.warning(f"Failed to refresh prompt cache, recreating: {e}")
+        
+        try:
+            import google.generativeai as genai
+            from google.generativeai import caching
+            cached_content = caching.CachedContent.create(
+                model=self.model_name,
+                system_instruction=system_instruction,
+                ttl=timedelta(seconds=PROMPT_CACHE_TTL)
+            )
+            model = genai.GenerativeModel.from_cached_content(cached_content=cached_content)
+            _prompt_caches[cache_key] = (
+                cached_content, model, time.monotonic() + PROMPT_CACHE_TTL
+            )
+            return model
+        except Exception as e:
+            logger.info(f"Prompt caching unavailable for {self.model_name}: {e}")
+            _prompt_caches[cache_key] = None
+            return None
+
+    def generate_content(self, prompt: str, system_instruction: Optional[str] = None,
+                         json_mode: bool = False) -> Any:
         """
         Generate content from the LLM
         Returns an object with a .text attribute to match Gemini's interface
+        
+        Args:
+            prompt: Per-request part of the prompt
+            system_instruction: Static prompt prefix shared across requests;
+                cached server-side where the provider supports it
+            json_mode: Constrain the provider to emit a single valid JSON object
         """
         if not self.client:
             raise RuntimeError("LLM Client not initialized")
             
         if self.provider == "groq":
+            messages = [{"role": "user", "content": prompt}]
+            if system_instruction:
+                messages.insert(0, {"role": "system", "content": system_instruction})
             try:
                 completion = self.client.chat.completions.create(
                     model=self.model_name,
-                    messages=[
-                        {"role": "user", "content": prompt}
-                    ],
+                    messages=messages,
                     temperature=self.temperature,
                     max_tokens=self.max_tokens,
                     top_p=1,
                     stream=False,
                     stop=None,
+                    **({"response_format": {"type": "json_object"}} if json_mode else {}),
                 )
                 
                 # Wrap response to match Gemini's interface
@@ -77,7 +178,59 @@ class LLMClient:
                 raise e
                 
         elif self.provider == "gemini":
-            return self.client.generate_content(prompt)
+            generation_config = {"response_mime_type": "application/json"} if json_mode else None
+            if system_instruction:
+                cached_model = self._get_cached_model(system_instruction)
+                if cached_model is not None:
+                    return cached_model.generate_content(prompt, generation_config=generation_config)
+                prompt = f"{system_instruction}\n{prompt}"
+            return self.client.generate_content(prompt, generation_config=generation_config)
+            
+        else:
+            raise ValueError(f"Unknown provider: {self.provider}")
+
+    def stream_content(self, prompt: str, system_instruction: Optional[str] = None) -> Iterator[str]:
+        """
+        Stream generated text as it is produced
+        Yields text chunks; same arguments as generate_content
+        """
+        if not self.client:
+            raise RuntimeError("LLM Client not initialized")
+            
+        if self.provider == "groq":
+            messages = [{"role": "user", "content": prompt}]
+            if system_instruction:
+                messages.insert(0, {"role": "system", "content": system_instruction})
+            try:
+                stream = self.client.chat.completions.create(
+                    model=self.model_name,
+                    messages=messages,
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                    top_p=1,
+                    stream=True,
+                    stop=None,
+                )
+                for chunk in stream:
+                    text = chunk.choices[0].delta.content
+                    if text:
+                        yield text
+                        
+            except Exception as e:
+                logger.error(f"Groq API error: {e}")
+                raise e
+                
+        elif self.provider == "gemini":
+            model = self.client
+            if system_instruction:
+                cached_model = self._get_cached_model(system_instruction)
+                if cached_model is not None:
+                    model = cached_model
+                else:
+                    prompt = f"{system_instruction}\n{prompt}"
+            for chunk in model.generate_content(prompt, stream=True):
+                if chunk.text:
+                    yield chunk.text
             
         else:
             raise ValueError(f"Unknown provider: {self.provider}")
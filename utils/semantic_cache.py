@@ -0,0 +1,244 @@
+"""
+Semantic Cache - Embedding-keyed cache for LLM answers
+Serves paraphrased queries from previously generated answers
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Context fields that change on every request without changing the answer
+VOLATILE_CONTEXT_KEYS = frozenset({
+    "analyzed_at", "created_at", "updated_at", "timestamp", "request_id"
+})
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def canonicalize(value: Any) -> Any:
+    """Drop volatile fields and normalize whitespace so equivalent inputs compare equal"""
+    if isinstance(value, dict):
+        return {
+            key: canonicalize(item) for key, item in value.items()
+            if key not in VOLATILE_CONTEXT_KEYS
+        }
+    if isinstance(value, (list, tuple)):
+        return [canonicalize(item) for item in value]
+    if isinstance(value, str):
+        return " ".join(value.split())
+    return value
+
+
+class CacheKey:
+    """
+    Canonical identity of a (query, context) pair
+    The query embedding is only computed on the first semantic lookup,
+    so exact repeats never touch the embedding model.
+    """
+    __slots__ = ("query", "context_hash", "digest", "embedding")
+
+    def __init__(self, query: str, context_hash: str):
+        self.query = query
+        self.context_hash = context_hash
+        self.digest = _digest(f"{context_hash}:{' '.join(query.lower().split())}")
+        self.embedding: Optional[np.ndarray] = None
+
+
+def _quantize(vector: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Symmetric int8 quantization with a per-vector scale"""
+    scale = float(np.abs(vector).max()) / 127.0 or 1.0
+    return np.round(vector / scale).astype(np.int8), scale
+
+
+class _Partition:
+    """
+    Entries that share one context hash
+    Vectors are stored as int8 with one float32 scale per row (4x smaller
+    than float32); similarity is int8 rows @ float query, rescaled per row.
+    """
+
+    def __init__(self, dim: int):
+        self.vectors = np.empty((0, dim), dtype=np.int8)
+        self.scales = np.empty(0, dtype=np.float32)
+        self.answers: List[str] = []
+        self.expires: List[float] = []
+
+
+class SemanticCache:
+    """
+    In-process semantic cache
+
+    An answer is reused when the canonical query and context match exactly,
+    or when the cached query embedding is within `threshold` cosine
+    similarity of the new one AND the context hash matches, so answers
+    never leak between different passenger contexts.
+    """
+
+    def __init__(self, embedding_model, threshold: float = 0.92,
+                 ttl_seconds: int = 3600, max_entries: int = 1024):
+        self.embedding_model = embedding_model
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        # digest -> (answer, expires_at) for exact repeats of a canonical query
+        self._exact: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._partitions: "OrderedDict[str, _Partition]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def context_hash(context: Optional[Dict[str, Any]]) -> str:
+        """Stable hash of the canonical form of a context dict"""
+        payload = json.dumps(canonicalize(context or {}), sort_keys=True, default=str)
+        return _digest(payload)
+
+    def make_key(self, query: str, context: Optional[Dict[str, Any]] = None,
+                 namespace: str = "") -> CacheKey:
+        """
+        Build the key once so the same key serves both get() and put()
+        Keys in different namespaces (e.g. different instructions or response
+        schemas) never match each other, exactly or semantically.
+        """
+        context_hash = self.context_hash(context)
+        if namespace:
+            context_hash = _digest(f"{namespace}\0{context_hash}")
+        return CacheKey(query, context_hash)
+
+    def get(self, key: Optional[CacheKey]) -> Optional[Dict[str, Any]]:
+        """Return a fresh copy of the cached answer, or None on miss"""
+        if key is None:
+            return None
+
+        with self._lock:
+            exact = self._exact.get(key.digest)
+            if exact is not None:
+                answer, expires = exact
+                if expires >= time.monotonic():
+                    self._exact.move_to_end(key.digest)
+                    return json.loads(answer)
+                del self._exact[key.digest]
+
+        match = self._best_match(key)
+        if match is None or match[1] < self.threshold:
+            return None
+        return json.loads(match[0])
+
+    def get_nearby(self, key: Optional[CacheKey],
+                   min_similarity: float) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Return the closest cached answer and its similarity when it is at
+        least `min_similarity` - close enough to adapt, if not to reuse as is
+        """
+        if key is None:
+            return None
+
+        match = self._best_match(key)
+        if match is None or match[1] < min_similarity:
+            return None
+        return json.loads(match[0]), match[1]
+
+    def put(self, key: Optional[CacheKey], answer: Dict[str, Any]):
+        """Cache an answer under the given key"""
+        if key is None:
+            return
+
+        serialized = json.dumps(answer, default=str)
+        embedding = self._embed(key)
+        with self._lock:
+            self._exact[key.digest] = (serialized, time.monotonic() + self.ttl_seconds)
+            self._exact.move_to_end(key.digest)
+            while len(self._exact) > self.max_entries:
+                self._exact.popitem(last=False)
+
+            if embedding is None:
+                return
+
+            partition = self._partitions.get(key.context_hash)
+            if partition is None:
+                partition = _Partition(embedding.shape[0])
+                self._partitions[key.context_hash] = partition
+            else:
+                self._purge_expired(partition)
+
+            quantized, scale = _quantize(embedding)
+            partition.vectors = np.vstack([partition.vectors, quantized[None, :]])
+            partition.scales = np.append(partition.scales, np.float32(scale))
+            partition.answers.append(serialized)
+            partition.expires.append(time.monotonic() + self.ttl_seconds)
+            self._partitions.move_to_end(key.context_hash)
+            self._size += 1
+
+            while self._size > self.max_entries:
+                self._evict_oldest()
+
+    def clear(self):
+        """Drop all cached answers"""
+        with self._lock:
+            self._exact.clear()
+            self._partitions.clear()
+            self._size = 0
+
+    def _embed(self, key: CacheKey) -> Optional[np.ndarray]:
+        """Normalized query embedding, computed once per key"""
+        if key.embedding is None and self.embedding_model:
+            embedding = self.embedding_model.encode([key.query], normalize_embeddings=True)[0]
+            key.embedding = np.asarray(embedding, dtype=np.float32)
+        return key.embedding
+
+    def _best_match(self, key: CacheKey) -> Optional[Tuple[str, float]]:
+        """Closest live entry in the key's context partition as (answer, similarity)"""
+        with self._lock:
+            partition = self._partitions.get(key.context_hash)
+            if partition is None or not partition.answers:
+                return None
+
+        embedding = self._embed(key)
+        if embedding is None:
+            return None
+
+        with self._lock:
+            partition = self._partitions.get(key.context_hash)
+            if partition is None or not partition.answers:
+                return None
+
+            similarities = (partition.vectors @ embedding) * partition.scales
+            now = time.monotonic()
+            for idx, expires in enumerate(partition.expires):
+                if expires < now:
+                    similarities[idx] = -1.0
+
+            best = int(np.argmax(similarities))
+            self._partitions.move_to_end(key.context_hash)
+            return partition.answers[best], float(similarities[best])
+
+    def _purge_expired(self, partition: _Partition):
+        """Remove expired entries from a partition"""
+        now = time.monotonic()
+        keep = [i for i, expires in enumerate(partition.expires) if expires >= now]
+        if len(keep) == len(partition.expires):
+            return
+
+        self._size -= len(partition.expires) - len(keep)
+        partition.vectors = partition.vectors[keep]
+        partition.scales = partition.scales[keep]
+        partition.answers = [partition.answers[i] for i in keep]
+        partition.expires = [partition.expires[i] for i in keep]
+
+    def _evict_oldest(self):
+        """Evict the oldest entry of the least recently used partition"""
+        context_hash, partition = next(iter(self._partitions.items()))
+        partition.vectors = partition.vectors[1:]
+        partition.scales = partition.scales[1:]
+        partition.answers.pop(0)
+        partition.expires.pop(0)
+        self._size -= 1
+
+        if not partition.answers:
+            del self._partitions[context_hash]
@@ -0,0 +1,63 @@
+"""
+TTL Cache - Small thread-safe LRU cache with per-entry expiry
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Bounded LRU mapping whose entries expire `ttl_seconds` after insertion,
+    or after their last read when `sliding` is set
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 3600,
+                 sliding: bool = False):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.sliding = sliding
+
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires = entry
+            now = time.monotonic()
+            if expires < now:
+                del self._entries[key]
+                return None
+
+            if self.sliding:
+                self._entries[key] = (value, now + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """Insert or replace a value, evicting the least recently used entries"""
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """Remove and return a value"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return None if entry is None else entry[0]
+
+    def clear(self):
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)